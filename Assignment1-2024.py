@@ -1,4 +1,18 @@
+import argparse
 import random
+import sys
+
+from board_gen import count_inversions, random_solvable_board
+from puzzle_batch import parse_board, run_batch
+from puzzle_solver import MOVE_NAMES
+from puzzle_table import best_move, distance
+from tile_index import TileIndex
+
+SOLVED_CHESSBOARD = list(range(1, 9)) + [' ']
+# For each blank index, the index of the tile that moves left, right, up or down into it, or -1 if none can.
+MOVE_TARGETS = [tuple(target if 0 <= target < 9 and (target // 3 == index // 3 or target % 3 == index % 3) else -1
+                      for target in (index + 1, index - 1, index + 3, index - 3))
+                for index in range(9)]
 
 def display_introductions()-> None:
     """Display an introduction message to the player about the game.
@@ -23,47 +37,55 @@ def get_valid_moves() -> tuple[str, str, str, str]:
     """
     
     while True:
-        user_input = input("Enter 4 letters (a-z) for left, right, up, down moves > ").lower().replace(" ", "")
-        if len(user_input) == 4 and len(set(user_input)) == 4 and user_input.isalpha():
-            return user_input[0], user_input[1], user_input[2], user_input[3]
+        letters = parse_moves(input("Enter 4 letters (a-z) for left, right, up, down moves > "))
+        if letters is not None:
+            return letters
         else:
             print("Invalid input. Please ensure four unique letters, no repetitions or non-letter characters.")
 
 
-def initialize_chessboard() -> list[int, str]:
+def parse_moves(text: str) -> tuple[str, str, str, str] | None:
+    """
+    Turn the player's input into the letters for left, right, up, and down moves.
+
+    Returns None unless the input, ignoring case and spaces, is four unique letters.
+
+    Args: str
+    Returns: tuple[str, str, str, str] | None
+    """
+
+    letters = text.lower().replace(" ", "")
+    if len(letters) == 4 and len(set(letters)) == 4 and letters.isalpha():
+        return letters[0], letters[1], letters[2], letters[3]
+    return None
+
+
+def initialize_chessboard(rng: random.Random | None = None) -> list[int, str]:
     """
     Initialize and return a solvable 8-tile puzzle chessboard.
     
     The chessboard is a list with numbers 1 through 8 and a blank space represented by ' '.
-    The function ensures the generated chessboard is solvable for the user.
+    The function draws a uniformly random solvable chessboard in a single pass.
 
-    Args: None
+    Args: random.Random | None (default: the random module)
     Returns: list[int, str]
     """
     
-    chessboard = list(range(1, 9)) + [' ']
-    random.shuffle(chessboard)
-    while not is_solvable(chessboard):
-        random.shuffle(chessboard)
-    return chessboard
+    return [tile if tile else ' ' for tile in random_solvable_board(3, rng)]
 
 
 def is_solvable(chessboard: list[str, int]) -> bool:
     """
     Check if a given chessboard configuration is solvable for the user.
     
-    Counts the total number of inversions in the chessboard. A solvable configuration
-    has an even number of inversions.
+    Counts the total number of inversions in the chessboard in O(n log n). A solvable
+    configuration has an even number of inversions.
 
     Args: list[str, int]
     Returns: bool
     """
     
-    inversion_count = 0
-    for i in range(len(chessboard)):
-        for j in range(i + 1, len(chessboard)):
-            if chessboard[i] != ' ' and chessboard[j] != ' ' and chessboard[i] > chessboard[j]:
-                inversion_count += 1
+    inversion_count = count_inversions([0 if tile == ' ' else tile for tile in chessboard])
     return inversion_count % 2 == 0
 
 
@@ -94,15 +116,27 @@ def print_chessboard(chessboard: list[str, int]):
         print(f"{chessboard[i]} {chessboard[i+1]} {chessboard[i+2]}")
 
 
-def move_tile(chessboard: list, move: str, moves: tuple[str, str, str, str]):
+def create_index(chessboard: list[int, str]) -> TileIndex:
+    """
+    Build the tile-position index of a chessboard, so the blank and any tile can be found in O(1).
+
+    Args: list[int, str]
+    Returns: TileIndex
+    """
+
+    return TileIndex([0 if tile == ' ' else tile for tile in chessboard], 3)
+
+
+def move_tile(chessboard: list, move: str, moves: tuple[str, str, str, str], tile_index: TileIndex | None = None):
     """
     Move a tile based on the player's input, adjusting the logic to reflect the movement of numbers towards the specified direction.
+    When a tile index is given, the blank is looked up in it and it is kept in step with the chessboard.
     
-    Args: list, str, tuple[str, str, str, str]
+    Args: list, str, tuple[str, str, str, str], TileIndex | None
     Returns: None
     """
     
-    index = chessboard.index(' ')
+    index = tile_index.blank if tile_index is not None else chessboard.index(' ')
     move_direction = moves.index(move)
 
     # Mapping the index of the move to the actual direction
@@ -118,6 +152,8 @@ def move_tile(chessboard: list, move: str, moves: tuple[str, str, str, str]):
     # Make sure that the target index is within the bounds of the chessboard and the move is valid
     if 0 <= target_index < len(chessboard) and (target_index // 3 == index // 3 or target_index % 3 == index % 3):
         chessboard[index], chessboard[target_index] = chessboard[target_index], chessboard[index]
+        if tile_index is not None:
+            tile_index.swap(index, target_index)
     else:
         print("Invalid move. Please follow the prompt and try again.")
 
@@ -132,20 +168,23 @@ def is_solved(chessboard: list[str, int]) -> bool:
     Returns: bool
     """
     
-    return chessboard == list(range(1, 9)) + [' ']
+    return chessboard == SOLVED_CHESSBOARD
 
 
-def ask_for_next_round(moves: tuple[str, str, str, str]):
-    """Prompt the player to play another game or quit."""
+def ask_for_next_round() -> bool:
+    """Prompt the player to play another game or quit.
+    
+    Args: None
+    Returns: bool (True for another game)
+    """
     
     while True:
         decision = input('Enter "n" for another game, or "q" to end the game > ').lower()
         if decision == 'n':
-            play_game(moves)
-            break
+            return True
         elif decision == 'q':
             print("Thanks for playing Dylan's 8-tile puzzle game!")
-            break
+            return False
         else:
             print("Invalid input. Please enter 'n' to start another game or 'q' to end the game.")
 
@@ -155,18 +194,21 @@ def play_game(moves: tuple[str, str, str, str]):
     Main game loop.
     
     Initializes the chessboard, processes player moves, and checks for game completion.
-    Prompts the player for moves until the puzzle is solved, then offers a new game or exit.
+    Prompts the player for moves until the puzzle is solved.
+    Entering '?' shows an optimal next move; the optimality gap is reported at the end.
 
     Args: tuple[str, str, str, str]
     Returns: None
     """
     
     chessboard = initialize_chessboard()
+    optimal_count = distance(chessboard)
+    tile_index = create_index(chessboard)
     move_count = 0
 
-    while not is_solved(chessboard):
+    while tile_index.manhattan:  # Zero only for the solved chessboard
         print_chessboard(chessboard)
-        index = chessboard.index(' ')
+        index = tile_index.blank
         possible_moves = get_possible_moves(index)
 
         # Adjusting move prompts based on the position of the blank space and the fact that players move numbers
@@ -180,13 +222,19 @@ def play_game(moves: tuple[str, str, str, str]):
         if 'up' in possible_moves and index >= 3:  # Can move number down, blank moves up
             available_moves_prompt.append(f"down-{moves[3]}")
 
+        available_moves_prompt.append("hint-?")
         move_prompt = ", ".join(available_moves_prompt)
 
         move = input(f"Enter your move ({move_prompt})> ").lower()
-        chessboard_before_move = chessboard[:]  # Copy the chessboard before attempting the move
+        if move == '?':
+            hint = best_move(chessboard)
+            print(f"Hint: {hint}-{moves[MOVE_NAMES.index(hint)]} "
+                  f"({distance(chessboard)} moves left with perfect play)")
+            print()
+            continue
         if move in moves:
-            move_tile(chessboard, move, moves)
-            if chessboard_before_move != chessboard:  # Check if the move was valid
+            move_tile(chessboard, move, moves, tile_index)
+            if tile_index.blank != index:  # Check if the move was valid
                 move_count += 1
             else:
                 print("Invalid move. That direction is not possible from the current position.")
@@ -197,19 +245,177 @@ def play_game(moves: tuple[str, str, str, str]):
 
     print_chessboard(chessboard)
     print(f"Congratulations! You have solved the puzzle in {move_count} moves!")
-    ask_for_next_round(moves)
+    if move_count == optimal_count:
+        print("That is an optimal solution!")
+    else:
+        print(f"The optimal solution takes {optimal_count} moves, {move_count - optimal_count} fewer than yours.")
+
+
+def play_session(moves: tuple[str, str, str, str]):
+    """
+    Play games until the player chooses to quit.
+    
+    Each game returns here before the next one starts, so a long session does not
+    grow the call stack.
+
+    Args: tuple[str, str, str, str]
+    Returns: None
+    """
+
+    play_game(moves)
+    while ask_for_next_round():
+        play_game(moves)
+
+
+def run_script(stream, moves: tuple[str, str, str, str], chessboard: list[int, str],
+               rng: random.Random | None = None) -> dict:
+    """
+    Apply a move string read from a text stream to a chessboard, without prompting.
+    
+    Letters are matched as in the game, ignoring case; whitespace is skipped and any other
+    character is counted as ignored. A move that is impossible from the current position
+    is counted as invalid and changes nothing. Whenever the puzzle is solved, a new
+    chessboard is dealt and the script carries on, as if the player had entered "n".
+    The stream is read in blocks, so scripts of millions of moves take constant memory.
+
+    Args: text stream, tuple[str, str, str, str], list[int, str] (changed in place),
+          random.Random | None (deals the new chessboards)
+    Returns: dict (counts: 'moves', 'invalid', 'ignored', 'solved', 'game_moves')
+    """
+
+    direction_of = {}
+    for direction, letter in enumerate(moves):
+        direction_of[letter] = direction_of[letter.upper()] = direction
+    targets = MOVE_TARGETS
+    board = chessboard
+    blank = board.index(' ')
+    applied = invalid = ignored = solved = game_moves = 0
+    for block in iter(lambda: stream.read(1 << 16), ''):
+        for char in block:
+            direction = direction_of.get(char)
+            if direction is None:
+                if not char.isspace():
+                    ignored += 1
+                continue
+            target = targets[blank][direction]
+            if target < 0:
+                invalid += 1
+                continue
+            board[blank], board[target] = board[target], ' '
+            blank = target
+            applied += 1
+            game_moves += 1
+            if blank == 8 and board == SOLVED_CHESSBOARD:
+                solved += 1
+                game_moves = 0
+                board[:] = initialize_chessboard(rng)
+                blank = board.index(' ')
+    return {'moves': applied, 'invalid': invalid, 'ignored': ignored, 'solved': solved, 'game_moves': game_moves}
+
+
+def choose_moves(letters: str | None, path: str) -> tuple[str, str, str, str]:
+    """
+    Return the move letters given on the command line, or ask for them as in the game.
+    
+    Exits when the letters are not valid, or are missing while the input comes from stdin ('-').
+
+    Args: str | None, str (input path)
+    Returns: tuple[str, str, str, str]
+    """
+
+    if letters is None:
+        if path == '-':
+            sys.exit("Reading from stdin needs --letters.")
+        return get_valid_moves()
+    moves = parse_moves(letters)
+    if moves is None:
+        sys.exit("--letters needs four unique letters for left, right, up, down.")
+    return moves
+
+
+def script_game(path: str, letters: str | None, board: str | None, seed: int | None) -> int:
+    """
+    Play a move string from a file, or from stdin for '-', and report the final state and move counts.
+    
+    The game starts from the given board, or a random one (reproducible with a seed).
+
+    Args: str, str | None, str | None, int | None
+    Returns: int (exit status)
+    """
+
+    moves = choose_moves(letters, path)
+    rng = random.Random(seed)
+    if board is None:
+        chessboard = initialize_chessboard(rng)
+    else:
+        try:
+            chessboard = parse_board(board)
+        except ValueError as error:
+            sys.exit(f"--board: {error}")
+        if not is_solvable(chessboard):
+            sys.exit("--board: The chessboard is not solvable.")
+    if path == '-':
+        counts = run_script(sys.stdin, moves, chessboard, rng)
+    else:
+        with open(path) as script:
+            counts = run_script(script, moves, chessboard, rng)
+
+    report = [f"{chessboard[i]} {chessboard[i+1]} {chessboard[i+2]}" for i in range(0, 9, 3)]
+    report.append(f"Solved: {'yes' if is_solved(chessboard) else 'no'}, "
+                  f"{distance(chessboard)} moves left with perfect play")
+    report.append(f"Moves applied: {counts['moves']} ({counts['game_moves']} in the current game)")
+    report.append(f"Games solved: {counts['solved']}")
+    report.append(f"Invalid moves: {counts['invalid']}")
+    report.append(f"Ignored characters: {counts['ignored']}")
+    sys.stdout.write("\n".join(report) + "\n")
+    return 0
+
+
+def batch_solve(path: str, letters: str | None, workers: int | None) -> int:
+    """
+    Solve every board in a file, or on stdin for '-', across processes.
+    
+    Prints one JSON line per board, in input order, with the optimal length, the moves
+    in the player's letters and the nodes expanded. Without --letters, the letters are
+    asked for as in the game.
+
+    Args: str, str | None, int | None
+    Returns: int (exit status: 1 if any line was not a solvable board)
+    """
+
+    moves = choose_moves(letters, path)
+    if path == '-':
+        return 1 if run_batch(sys.stdin, moves, sys.stdout, workers) else 0
+    with open(path) as boards:
+        return 1 if run_batch(boards, moves, sys.stdout, workers) else 0
+
 
 def main():
     """Run the game.
     
     Display the introduction message, prompt the player for moves, and start the game loop.
+    With --batch, solve a file of boards instead; with --script, play a file of moves.
     Args: None
     Returns: None
     """
-   
+
+    parser = argparse.ArgumentParser(description="Dylan's 8-tile puzzle game")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--batch', metavar='FILE', help="solve the boards in FILE ('-' for stdin), one per line")
+    mode.add_argument('--script', metavar='FILE', help="play the move string in FILE ('-' for stdin) without prompting")
+    parser.add_argument('--letters', help='letters for left, right, up, down moves in batch and script modes, e.g. adws')
+    parser.add_argument('--workers', type=int, help='processes solving boards in batch mode (default: one per CPU)')
+    parser.add_argument('--board', help='starting board in script mode, e.g. 123456708 (default: random)')
+    parser.add_argument('--seed', type=int, help='seed for the random boards dealt in script mode')
+    args = parser.parse_args()
+    if args.batch:
+        sys.exit(batch_solve(args.batch, args.letters, args.workers))
+    if args.script:
+        sys.exit(script_game(args.script, args.letters, args.board, args.seed))
+
     display_introductions()
     moves = get_valid_moves()
-    play_game(moves)
+    play_session(moves)
 
 if __name__ == "__main__":
     main()
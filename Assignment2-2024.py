@@ -1,16 +1,47 @@
-import turtle
 import random
+import time
+from collections import deque
+
 import numpy as np
 
+from board_gen import random_solvable_board
+from puzzle_worker import SolveJob, start_database_build
+from renderer import FrameCounter, Lazy, TileLayer, get_renderer
+from tile_index import TileIndex
+
 #Constants for the game's design
 BOARD_SIZE = 0  
+MAX_BOARD_SIZE = 15  # Largest board the game offers; the solver reduces anything above 4x4 line by line
+BOARD_PX = 600  # Width and height of the board on screen, whatever its size
 EMPTY_TILE = (0, 0)    
-TILES = np.array([])
-#Setting up the turtle screen for the users
-t = turtle.Turtle()
-screen = turtle.Screen()
-t.speed(0)
-t.hideturtle()
+TILES = np.array([], dtype=np.int16)
+TILE_INDEX = None  # Cell of every tile, built by set_tiles and kept in step with TILES by perform_swap
+SOLUTION_MOVES = []  # Pending (row, col) slides of an auto-solve
+SOLVE_JOB = None  # Background solve feeding SOLUTION_MOVES, None when no auto-solve is running
+POLL_MS = 15  # How often the solver queue is checked while waiting for slides, below one frame
+PENDING_SLIDES = deque()  # Clicked (row, col) cells waiting for the slide on screen to finish
+ANIMATION = None  # (tile, direction, started, seconds) of the slide on screen, None when idle
+SLIDE_MS = 120  # Length of one slide when nothing else is waiting
+MIN_SLIDE_MS = 25  # Shortest slide when many are waiting
+FRAME_MS = 16  # Time between animation frames
+TILE_LAYER = TileLayer()  # One persistent sprite and label per tile
+FRAMES = FrameCounter()  # Frame times and canvas operations per frame
+
+def create_pen():
+    """
+    Creates the turtle that draws the puzzle.
+
+    Returns:
+        The pen, hidden and set to the fastest speed.
+    """
+    pen = get_renderer().turtle()
+    pen.speed(0)
+    pen.hideturtle()
+    return pen
+
+#The turtle screen for the users, created on first use so importing this module opens no window
+t = Lazy(create_pen)
+screen = Lazy(lambda: get_renderer().screen())
 
 def initial_game()-> None:
     """
@@ -25,18 +56,19 @@ def initial_game()-> None:
     Returns:
     None
     """
-    global BOARD_SIZE, TILES, color
+    global BOARD_SIZE, color
     color = 'Pale Green'  
     screen.setup(width=600, height=600)
-    turtle.title("Dylan's Sliding Puzzle Game")
-    BOARD_SIZE = screen.numinput("Dylan's Sliding Puzzle Game", "Enter the puzzle's dimensions (3, 4, 5):", default=3, minval=3, maxval=5)
+    screen.title("Dylan's Sliding Puzzle Game (press S to auto-solve)")
+    BOARD_SIZE = screen.numinput("Dylan's Sliding Puzzle Game", f"Enter the puzzle's dimensions (3 to {MAX_BOARD_SIZE}):",
+                                 default=3, minval=3, maxval=MAX_BOARD_SIZE)
     if BOARD_SIZE is not None:
         BOARD_SIZE = int(BOARD_SIZE)  
-        TILES = np.arange(BOARD_SIZE ** 2).reshape((BOARD_SIZE, BOARD_SIZE))
+        set_tiles(np.arange(BOARD_SIZE ** 2).reshape((BOARD_SIZE, BOARD_SIZE)))
         generate_solvable_puzzle(BOARD_SIZE)
         draw_puzzle()
     else:
-        turtle.bye()
+        screen.bye()
 
 def generate_move() -> list[int, int]:
     """
@@ -88,8 +120,9 @@ def generate_solvable_puzzle(size: int) -> None:
     """
     Generates a solvable puzzle of the given size.
 
-    This function takes the size of the puzzle as input and generates a solvable puzzle configuration.
-    The puzzle configuration is stored in the global variable TILES.
+    This function takes the size of the puzzle as input and draws a uniformly random solvable
+    configuration in one pass, instead of a short random walk that often stays near the solution.
+    The puzzle configuration is stored in the global variable TILES, as int16 so a 15x15 board stays compact.
 
     Parameters:
     size (int): The size of the puzzle.
@@ -97,8 +130,36 @@ def generate_solvable_puzzle(size: int) -> None:
     Returns:
     None
     """
-    puzzle = np.arange(size ** 2).reshape((size, size))
-    shuffle_puzzle()
+    set_tiles(np.array(random_solvable_board(size)).reshape((size, size)))
+
+def set_tiles(tiles) -> None:
+    """
+    Replaces the board with the given tiles and rebuilds the tile index and the empty tile to match.
+
+    Code that sets up a board should go through here rather than assign TILES, so that
+    check_ifsolved and the moves see the new board.
+
+    Parameters:
+    tiles: A square numpy array or nested list with 0 for the blank.
+
+    Returns:
+    None
+    """
+    global TILES, EMPTY_TILE, TILE_INDEX
+    TILES = np.array(tiles, dtype=np.int16)
+    TILE_INDEX = TileIndex(TILES.ravel(), TILES.shape[0])
+    EMPTY_TILE = TILE_INDEX.position(0)
+
+def index_matches_tiles() -> bool:
+    """
+    Checks whether TILE_INDEX describes a board of the same size as TILES.
+
+    It does not when TILES was assigned directly instead of through set_tiles.
+
+    Returns:
+        bool: True if the index can be used.
+    """
+    return TILE_INDEX is not None and TILE_INDEX.size ** 2 == TILES.size
 
 def determine_direction(pos_1: tuple[int, int], pos_2: tuple[int, int]) -> str:
     """
@@ -126,6 +187,7 @@ def perform_swap(pos_1: tuple[int, int], pos_2: tuple[int, int]) -> None:
     Swaps the values of two positions in the TILES array.
 
     This function takes two positions as input and swaps the values of those positions in the TILES array.
+    The tile index is updated with the same swap.
 
     Parameters:
     pos_1 (tuple[int, int]): The first position.
@@ -137,6 +199,8 @@ def perform_swap(pos_1: tuple[int, int], pos_2: tuple[int, int]) -> None:
     temp = TILES[pos_1[0]][pos_1[1]]
     TILES[pos_1[0]][pos_1[1]] = TILES[pos_2[0]][pos_2[1]]
     TILES[pos_2[0]][pos_2[1]] = temp
+    if index_matches_tiles():
+        TILE_INDEX.swap(pos_1[0] * BOARD_SIZE + pos_1[1], pos_2[0] * BOARD_SIZE + pos_2[1])
 
 def swap_TILES(pos_1: tuple[int, int], pos_2: tuple[int, int]) -> str:
     """
@@ -156,19 +220,34 @@ def swap_TILES(pos_1: tuple[int, int], pos_2: tuple[int, int]) -> str:
     perform_swap(pos_1, pos_2)
     return direction
 
+def report_frame_times() -> None:
+    """
+    Prints the frame-time counter: frames drawn, mean and worst frame time, and canvas operations per frame.
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    """
+    stats = FRAMES.summary()
+    print(f"{stats['frames']} frames, {stats['mean_ms']:.2f} ms mean, {stats['max_ms']:.2f} ms worst, "
+          f"{stats['mean_ops']:.1f} canvas operations per frame")
+
 def check_ifsolved() -> bool:
     """
     Checks if the puzzle is solved.
 
-    This function compares the current puzzle configuration with the solution configuration
-    and returns True if they are equal, indicating that the puzzle is solved.
+    The puzzle is solved exactly when every tile is in its goal cell, i.e. when the
+    Manhattan distance kept by the tile index is zero. Without an index for this board,
+    TILES is compared with the goal instead.
 
     Returns:
         bool: True if the puzzle is solved, False otherwise.
     """
-    solution = np.arange(1, BOARD_SIZE ** 2)
-    solution = np.append(solution, 0).reshape((BOARD_SIZE, BOARD_SIZE))
-    return np.array_equal(TILES, solution)
+    if not index_matches_tiles():
+        return TILES.size > 0 and bool((TILES.ravel() == np.roll(np.arange(TILES.size), -1)).all())
+    return TILE_INDEX.manhattan == 0
 
 def check_solved_and_notify() -> None:
     """
@@ -187,12 +266,13 @@ def check_solved_and_notify() -> None:
         global color, t
         color = 'red'
         draw_puzzle()
-        turtle.tracer(1, 10)
+        screen.tracer(1, 10)
         t.penup()
         t.color("black")
         t.goto(0, 0)
         t.write("Congratulations!", align="center", font=("Times", 24, "bold"))
         screen.onclick(None)
+        screen.onkey(None, 's')
 
 
 def draw_all_TILES() -> None:
@@ -200,6 +280,7 @@ def draw_all_TILES() -> None:
     Draws all the tiles on the puzzle board.
 
     This function iterates over the TILES array and calls the draw_tile function for each tile.
+    Tiles that are already drawn in the right place and colour are left untouched.
 
     Parameters:
     None
@@ -207,31 +288,36 @@ def draw_all_TILES() -> None:
     Returns:
     None
     """
+    TILE_LAYER.build(TILES.ravel(), color)
+    TILE_LAYER.recolour(color)
     for i in range(BOARD_SIZE):
         for j in range(BOARD_SIZE):
             draw_tile(i, j, TILES[i, j])
 
-def draw_puzzle(tile=None,direction=None) -> None:
+def draw_puzzle(tile=None,direction=None,progress=1.0) -> None:
     """
     Draws the puzzle board.
 
     This function draws the puzzle board by calling the 'draw_all_TILES' function.
-    If 'tile' and 'direction' are provided, it animates the movement of the tile.
+    If 'tile' and 'direction' are provided, it draws that tile part of the way through its slide instead.
+    Each call is timed as one frame in FRAMES.
 
     Parameters:
     tile ([int]): The number of the tile to animate. Default is None.
     direction ([str]): The direction of the tile movement. Default is None.
+    progress (float): How far the slide has got, from 0 to 1. Default is 1.
 
     Returns:
     None
     """
-    turtle.tracer(0, 0)
-    t.clear()
+    FRAMES.begin(TILE_LAYER)
+    screen.tracer(0, 0)
     if tile and direction:
-        animate_tile_movement(tile, direction)
+        animate_tile_movement(tile, direction, progress)
     else:
         draw_all_TILES()
-    turtle.update()
+    screen.update()
+    FRAMES.end(TILE_LAYER)
 
 def take_tile_positition(row: int, col: int, additional_offset: tuple[int, int] = (0, 0)) -> tuple[int, int, int]:
     """
@@ -239,6 +325,7 @@ def take_tile_positition(row: int, col: int, additional_offset: tuple[int, int]
 
     This function takes the row and column indices of a tile, along with an optional additional offset,
     and calculates the x and y coordinates of the tile's top-left corner, as well as the size of the tile.
+    The board is centred and fills BOARD_PX whatever its size; the gap between tiles shrinks with them.
 
     Parameters:
     row (int): The row index of the tile.
@@ -248,151 +335,263 @@ def take_tile_positition(row: int, col: int, additional_offset: tuple[int, int]
     Returns:
     tuple[int, int, int]: A tuple containing the x and y coordinates of the tile's top-left corner, and the size of the tile.
     """
-    tile_size = 600 // BOARD_SIZE
-    draw_size = tile_size - 8
-    x = col * tile_size - 300 + 4 + additional_offset[0]
-    y = 300 - row * tile_size - 4 + additional_offset[1]
+    tile_size = BOARD_PX // BOARD_SIZE
+    gap = min(8, tile_size // 8)
+    draw_size = tile_size - gap
+    left = -tile_size * BOARD_SIZE // 2
+    x = left + col * tile_size + gap // 2 + additional_offset[0]
+    y = -left - row * tile_size - gap // 2 + additional_offset[1]
     return x, y, draw_size
 
-def draw_square(x: int, y: int, draw_size: int) -> None:
+def draw_tile(row: int, col: int, number: int, additional_offset: tuple[int, int] = (0, 0)) -> None:
     """
-    Draws a square on the turtle canvas.
+    Draws a tile on the puzzle board.
 
-    This function takes the x and y coordinates of the top-left corner of the square,
-    as well as the size of the square, and draws it on the turtle canvas.
+    This function takes the row and column indices of the tile, the number to be drawn on the tile,
+    and an optional additional offset, and moves that tile's sprite and label there.
 
     Parameters:
-    x (int): The x coordinate of the top-left corner of the square.
-    y (int): The y coordinate of the top-left corner of the square.
-    draw_size (int): The size of the square.
+    row (int): The row index of the tile.
+    col (int): The column index of the tile.
+    number (int): The number to be drawn on the tile.
+    additional_offset (tuple[int, int]): An optional additional offset for the tile position. Default is (0, 0).
 
     Returns:
     None
     """
-    t.penup()
-    t.goto(x, y)
-    t.pendown()
-    t.fillcolor(color)
-    t.begin_fill()
-    for _ in range(4):
-        t.forward(draw_size)
-        t.right(90)
-    t.end_fill()
+    x, y, draw_size = take_tile_positition(row, col, additional_offset)
+    TILE_LAYER.place(number, x, y, draw_size)
 
-def write_number(x: int, y: int, draw_size: int, number: int) -> None:
+def check_tile_click(x: int, y: int) -> None:
     """
-    Writes the number on the tile.
+    Checks if a tile is clicked and performs the necessary actions.
 
-    This function takes the x and y coordinates of the top-left corner of the tile,
-    the size of the tile, and the number to be written.
-    It writes the number on the tile using the turtle graphics library.
+    This function takes the x and y coordinates of the click and determines the row and column indices of the clicked tile.
+    It then queues a slide of the clicked tile; clicks outside the board are ignored.
 
     Parameters:
-    x (int): The x coordinate of the top-left corner of the tile.
-    y (int): The y coordinate of the top-left corner of the tile.
-    draw_size (int): The size of the tile.
-    number (int): The number to be written.
+    x (int): The x coordinate of the click.
+    y (int): The y coordinate of the click.
 
     Returns:
     None
     """
-    t.penup()
-    t.goto(x + draw_size / 2, y - draw_size / 2 - 20)
-    t.write(number, align="center", font=("Times", 18, "normal"))
+    tile_size = BOARD_PX // BOARD_SIZE
+    left = -tile_size * BOARD_SIZE // 2
+    row = int((-left - y) // tile_size)
+    col = int((x - left) // tile_size)
+    if not (0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE):
+        return
+    cancel_auto_solve()  # A click takes over from a running auto-solve
+    queue_slide(row, col)
 
-def draw_tile(row: int, col: int, number: int, additional_offset: tuple[int, int] = (0, 0)) -> None:
+def queue_slide(row: int, col: int) -> None:
     """
-    Draws a tile on the puzzle board.
+    Queues a slide of the tile at (row, col) and starts the animation if it is idle.
 
-    This function takes the row and column indices of the tile, the number to be drawn on the tile,
-    and an optional additional offset, and draws the tile on the puzzle board.
+    Slides are played in the order they were queued. Whether a slide is possible is
+    decided when its turn comes, against the board the earlier slides leave behind.
 
     Parameters:
     row (int): The row index of the tile.
     col (int): The column index of the tile.
-    number (int): The number to be drawn on the tile.
-    additional_offset (tuple[int, int]): An optional additional offset for the tile position. Default is (0, 0).
 
     Returns:
     None
     """
-    x, y, draw_size = take_tile_positition(row, col, additional_offset)
-    if number > 0:
-        draw_square(x, y, draw_size)
-        write_number(x, y, draw_size, number)
+    PENDING_SLIDES.append((row, col))
+    if ANIMATION is None:
+        animate_frame()
 
-def check_tile_click(x: int, y: int) -> None:
+def slide_tile(row: int, col: int) -> tuple[int, str] | None:
     """
-    Checks if a tile is clicked and performs the necessary actions.
+    Slides the tile at (row, col) into the empty tile if they are adjacent.
 
-    This function takes the x and y coordinates of the click and determines the row and column indices of the clicked tile.
-    It then checks if the clicked tile can be swapped with the empty tile and performs the swap if possible.
-    After the swap, it updates the puzzle board and checks if the puzzle is solved.
+    This function swaps the tile with the empty tile on the board; the animation draws the movement.
 
     Parameters:
-    x (int): The x coordinate of the click.
-    y (int): The y coordinate of the click.
+    row (int): The row index of the tile.
+    col (int): The column index of the tile.
 
     Returns:
-    None
+    tuple[int, str] | None: The tile number and the direction it slides, or None if it cannot slide.
     """
     global EMPTY_TILE
-    tile_size = 600 // BOARD_SIZE
-    row = int((300 - y) // tile_size)
-    col = int((x + 300) // tile_size)
     clicked_number = TILES[row, col]
     if (abs(EMPTY_TILE[0] - row) == 1 and EMPTY_TILE[1] == col) or \
             (abs(EMPTY_TILE[1] - col) == 1 and EMPTY_TILE[0] == row):
         direction = swap_TILES(EMPTY_TILE, (row, col))
         EMPTY_TILE = (row, col)
-        draw_puzzle(clicked_number, direction)
-        check_solved_and_notify()
+        return clicked_number, direction
+    return None
+
+def start_next_slide(started: float):
+    """
+    Takes the next possible slide off the queue (clicks first, then auto-solve slides) and applies it to the board.
+
+    The more slides are waiting, the shorter this one is, down to MIN_SLIDE_MS, so a burst
+    of clicks or a long solution catches up instead of falling behind.
+
+    Parameters:
+    started (float): The time.perf_counter() value the slide starts at.
+
+    Returns:
+    tuple | None: The new ANIMATION, or None if nothing is waiting.
+    """
+    while PENDING_SLIDES or SOLUTION_MOVES:
+        row, col = PENDING_SLIDES.popleft() if PENDING_SLIDES else SOLUTION_MOVES.pop(0)
+        slide = slide_tile(row, col)
+        if slide is not None:
+            waiting = len(PENDING_SLIDES) + len(SOLUTION_MOVES)
+            seconds = max(MIN_SLIDE_MS, SLIDE_MS / (1 + waiting)) / 1000
+            return slide[0], slide[1], started, seconds
+    return None
+
+def animate_frame() -> None:
+    """
+    Draws the slide animation at the current time and schedules the next frame.
+
+    Positions are interpolated from the clock, so a slide takes the same time on any
+    machine and late frames are skipped rather than slowing the slide down. When a
+    frame comes so late that slides have ended, they are all finished in this frame,
+    each next slide starting where the one before ended. A renderer that never runs
+    timer callbacks, such as the null renderer, gets every queued slide finished at once.
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    """
+    global ANIMATION
+    now = time.perf_counter()
+    instant = not get_renderer().runs_timers  # No next frame would ever come
+    while True:
+        if ANIMATION is None:
+            ANIMATION = start_next_slide(now)
+            if ANIMATION is None:
+                return
+        tile, direction, started, seconds = ANIMATION
+        progress = 1 if instant else (now - started) / seconds
+        if progress < 1:
+            draw_puzzle(tile, direction, progress)
+            spent_ms = (time.perf_counter() - now) * 1000
+            screen.ontimer(animate_frame, max(1, int(FRAME_MS - spent_ms)))
+            return
+        draw_tile(*TILE_INDEX.position(tile), tile)
+        ANIMATION = None
+        if check_ifsolved():
+            PENDING_SLIDES.clear()
+            SOLUTION_MOVES.clear()
+            check_solved_and_notify()
+            return
+        ANIMATION = start_next_slide(started + seconds)
+        if ANIMATION is None:
+            draw_puzzle(tile, direction)  # Only the finished tile, already in place; flushes the frame
+            return
+
+def auto_solve() -> None:
+    """
+    Solves the current puzzle automatically.
+
+    This function starts the solver in a background thread and plays its slides back one by one
+    as they arrive, so the window keeps responding during a long search.
+    Clicking a tile while the puzzle is being solved or the solution is playing stops the auto-solve.
+
+    Parameters:
+    None
 
-def animate_tile_movement(tile_number: int, direction: str) -> None:
+    Returns:
+    None
+    """
+    global SOLVE_JOB
+    if check_ifsolved() or SOLVE_JOB is not None or SOLUTION_MOVES or PENDING_SLIDES:
+        return
+    job = SOLVE_JOB = SolveJob(TILES)
+    if get_renderer().runs_timers:
+        screen.ontimer(lambda: play_solution(job), POLL_MS)
+    else:
+        job.wait()  # Nothing would poll the job, so play the solution as soon as it is found
+        play_solution(job)
+
+def cancel_auto_solve() -> None:
+    """
+    Stops a running auto-solve and drops the slides it has not played yet.
+
+    Parameters:
+    None
+
+    Returns:
+    None
+    """
+    global SOLVE_JOB
+    if SOLVE_JOB is not None:
+        SOLVE_JOB.cancel()
+        SOLVE_JOB = None
+    SOLUTION_MOVES.clear()
+
+def play_solution(job: SolveJob) -> None:
     """
-    Animates the movement of a tile on the puzzle board.
+    Hands the slides that have arrived from the solver to the animation, and checks again
+    after POLL_MS until the solver has finished.
+
+    Parameters:
+    job (SolveJob): The solve being played; a cancelled or replaced job stops here.
 
-    This function takes the tile number and the direction of the movement as input.
-    It animates the movement of the tile by redrawing the puzzle board with the tile in its new position.
+    Returns:
+    None
+    """
+    global SOLVE_JOB
+    if job is not SOLVE_JOB:
+        return
+    moves = job.drain()
+    if moves:
+        SOLUTION_MOVES.extend(moves)
+        if ANIMATION is None:
+            animate_frame()
+    if job.finished:
+        SOLVE_JOB = None
+        if job.error is not None:
+            print(f"Auto-solve failed: {job.error}")
+        else:
+            print(f"Auto-solve: {job.length} moves, {'optimal' if job.optimal else 'not optimal'}")
+    else:
+        screen.ontimer(lambda: play_solution(job), POLL_MS)
+
+def animate_tile_movement(tile_number: int, direction: str, progress: float = 1.0) -> None:
+    """
+    Draws one frame of a tile's movement on the puzzle board.
+
+    This function takes the tile number, the direction of the movement and how far it has got.
+    It moves only that tile's sprite; the other tiles are not redrawn.
 
     Parameters:
     tile_number (int): The number of the tile to animate.
     direction (str): The direction of the tile movement.
+    progress (float): How far the tile has got, from 0 (its old cell) to 1 (its new cell).
 
     Returns:
     None
     """
-    steps: int = 10
-    tile_size: int = 600 // BOARD_SIZE
-    x_dir: float = tile_size / steps
-    y_dir: float = tile_size / steps
-    for step in range(steps):
-        t.clear()
-        for i in range(BOARD_SIZE):
-            for j in range(BOARD_SIZE):
-                if TILES[i, j] == tile_number:
-                    if direction == "up":
-                        draw_tile(i, j, tile_number, additional_offset=(0, y_dir * step - tile_size))
-                    elif direction == "down":
-                        draw_tile(i, j, tile_number, additional_offset=(0, -y_dir * step + tile_size))
-                    elif direction == "right":
-                        draw_tile(i, j, tile_number, additional_offset=(x_dir * step - tile_size, 0))
-                    elif direction == "left":
-                        draw_tile(i, j, tile_number, additional_offset=(-x_dir * step + tile_size, 0))
-                else:
-                    draw_tile(i, j, TILES[i, j])
-        turtle.update()
-    t.clear()
-    for i in range(BOARD_SIZE):
-        for j in range(BOARD_SIZE):
-            draw_tile(i, j, TILES[i, j])
-    turtle.update()
+    tile_size: int = BOARD_PX // BOARD_SIZE
+    remaining: float = (1 - min(progress, 1.0)) * tile_size
+    row, col = TILE_INDEX.position(tile_number)
+    if direction == "up":
+        draw_tile(row, col, tile_number, additional_offset=(0, -remaining))
+    elif direction == "down":
+        draw_tile(row, col, tile_number, additional_offset=(0, remaining))
+    elif direction == "right":
+        draw_tile(row, col, tile_number, additional_offset=(-remaining, 0))
+    elif direction == "left":
+        draw_tile(row, col, tile_number, additional_offset=(remaining, 0))
 
 def main() -> None:
     """
     The main function of the program.
 
-    This function initializes the game, sets up the click event handler, and starts the turtle main loop.
+    This function initializes the game, sets up the click, auto-solve (S) and frame-time (F) key handlers,
+    starts building the solver's databases in the background if this board size needs them,
+    and starts the turtle main loop.
 
     Parameters:
     None
@@ -401,8 +600,13 @@ def main() -> None:
     None
     """
     initial_game()
+    if BOARD_SIZE:
+        start_database_build(BOARD_SIZE)
     screen.onclick(check_tile_click)
-    turtle.mainloop()
+    screen.onkey(auto_solve, 's')
+    screen.onkey(report_frame_times, 'f')
+    screen.listen()
+    screen.mainloop()
 
 
 if __name__ == "__main__":
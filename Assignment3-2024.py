@@ -1,11 +1,20 @@
-import turtle
-from random import randrange 
-from random import sample
+import argparse
+from collections import deque
+from random import Random
+
+from game_loop import Scheduler
+from game_profile import Profiler
+from renderer import NullRenderer, TextLayer, get_renderer, set_renderer
+from snake_autopilot import Autopilot
+from snake_grid import MONSTER, CellPool, OccupancyGrid
+from snake_pursuit import FIELD_MIN_MONSTERS, distance_field, downhill_move, greedy_moves
+from snake_replay import END, MAX_SEED, ReplayRecorder, load_replay
 # CONSTANTS
 
 HEAD_CURR_POS = [12, 12] # Snake head position
 HEAD_TARGET_POS = [] # Snake head target position
-SNAKE_TAIL_POS = [] # Snake tail position
+SNAKE_TAIL_POS = deque() # Snake tail cells packed as y * 25 + x, nearest the head first
+SNAKE_TAIL_STAMPS = deque() # Stamp id of each tail block, in the same order
 SNAKE_TAIL_LENGTH = 0 # Snake tail length
 SNAKE_TAIL_DEFAULT = 5 # Snake tail default length
 MONSTER_TARGET_POS = [12, 12] # Monster target position
@@ -16,34 +25,55 @@ SNAKE_MOTION = 'Paused' # Snake motion
 PREVIOUS_MOTION = 'Paused' # Previous motion
 SNAKE_SPEED = 250 # Snake speed by default
 MONSTER_SPEED = 400 # Monster speed by default
-IS_START_TIME = True # Start time flag
 IS_END_TIME = False # End time flag
 FOOD_TO_EAT = [1, 2, 3, 4, 5] # Food to eat
 FOOD_TO_HIDE = [] # Food to hide
 ONLY_COUNT = 0 
+GAME_LOOP = None # Fixed-timestep scheduler that runs every timed part of the game
+FRAME_STEP = 50 # Simulation step in milliseconds, a divisor of every game interval
+RNG = Random() # Source of all game randomness, seeded by seed_game()
+GAME_SEED = None # Seed of the current game
+RECORDER = None # Replay recorder of the current game, if recording
+RECORD_PATH = None # File the replay is saved to
+REPLAY_EVENTS = deque() # (tick, key) events still to play back when replaying
+GAME_SPEED = 1 # Simulation speed relative to the wall clock
+GRID = OccupancyGrid() # Cell kinds of the 25x25 board for O(1) collision, food and contact checks
+AUTOPILOT = None # Autopilot that plays the game instead of the player, if any
+TEXT = TextLayer() # Status bar, food and profile labels, redrawn only when they change
+STATUS_DIRTY = False # Whether the status bar must be redrawn at the end of the frame
+STATUS_FONT = ('Arial', 16, 'bold') # Font of the status bar
+FOOD_FONT = ('Arial', 13, 'normal') # Font of the food numbers
+PROFILER = None # Latency histograms of the game's subsystems, when profiling
+PROFILE_PATH = None # File the profile is dumped to as JSON on exit
+PROFILE_KEY = 'F2' # Key that shows and hides the profile overlay
+PROFILE_OVERLAY = False # Whether the profile overlay is shown
+# Functions timed under each subsystem when profiling
+PROFILED_SUBSYSTEMS = {
+    'movement': ('snake_move', 'snake_expand', 'monsters_move', 'autopilot_move'),
+    'collision': ('is_game_over', 'check_contact'),
+    'food': ('eat_food', 'relocate_food'),
+    'render': ('display_snake_step', 'draw_status_bar', 'show_food'),
+    'clock': ('refresh_time',),
+}
 
 
 
 def setup_screen() -> None:
     '''
     Set up the game screen by creating a turtle screen object.
-    Configure the screen size and title. Initializes the game status bar to display game metrics.
-    Uses turtle.tracer(0) to turn off animation for manual screen updates.
+    Configure the screen size and title. The status bar is drawn by the text layer.
+    Uses tracer(0) to turn off animation for manual screen updates.
+    The screen comes from the shared renderer, so nothing is drawn until this runs.
 
     Args: None
     Returns: None
     '''
-    global game_screen, game_status
-    turtle.tracer(0)
-    game_screen = turtle.Screen()
+    global game_screen
+    game_screen = get_renderer().screen()
+    game_screen.tracer(0)
     game_screen.setup(width=580, height=660)
     game_screen.title('Hungry Snake By Dylan.CAI')
 
-    game_status = turtle.Turtle()
-    game_status.hideturtle()
-    game_status.penup()
-    game_status.goto(-240, 240)
-
 
 
 def setup_snake()-> None:
@@ -59,17 +89,18 @@ def setup_snake()-> None:
     global snake_head, snake_tail
 
     
-    snake_tail = turtle.Turtle(shape="square") # Set up the snake tail
+    snake_tail = get_renderer().turtle(shape="square") # Set up the snake tail
     snake_tail.color('black')
     snake_tail.hideturtle()
     snake_tail.penup()
     snake_tail.pencolor('blue')
     
     
-    snake_head = turtle.Turtle(shape="square") # Set up the snake head
+    snake_head = get_renderer().turtle(shape="square") # Set up the snake head
     snake_head.color('red')
     snake_head.setheading(90)  
     snake_head.penup()
+    GRID.move_head(None, HEAD_CURR_POS)
 
 
 
@@ -93,41 +124,63 @@ def setup_monsters()-> None:
     
     # Set up the monsters
     for _ in range(4):  
-        monster = turtle.Turtle(shape='square')
+        monster = get_renderer().turtle(shape='square')
         monster.color('purple')
         monster.penup()
         
-        target_pos = [randrange(0, 24), randrange(0, 24)]
+        target_pos = [RNG.randrange(0, 24), RNG.randrange(0, 24)]
         while 7 <= target_pos[0] <= 17 and 7 <= target_pos[1] <= 17:
-            target_pos = [randrange(0, 24), randrange(0, 24)]
+            target_pos = [RNG.randrange(0, 24), RNG.randrange(0, 24)]
         
         monsters.append(monster)
         monster_target_pos.append(target_pos)
         monster_curr_pos.append(target_pos)
+        GRID.add_monster(target_pos)
 
 
 
 def refresh_status_bar()-> None:
     '''
     Refresh the game status bar.
+    While the game loop runs, only mark the status bar for redrawing:
+    draw_status_bar redraws it once at the end of the frame,
+    however many contacts and clock ticks asked for it in that frame.
+    Before the game starts, draw it straight away.
+
+    Args: None
+    Returns: None
+    '''
+
+    global STATUS_DIRTY
+    STATUS_DIRTY = True
+    if GAME_LOOP is None:
+        draw_status_bar()
+
+
+def draw_status_bar()-> None:
+    '''
+    Draw the status bar if it was marked for redrawing.
     Record the game contact, time, and snake motion.
-    Update the game status bar.
+    The game loop runs this once per frame, before the screen is flushed.
+    The text layer leaves the canvas alone if the text has not changed.
 
     Args: None
     Returns: None
     '''
-    
-    game_status.clear()
-    game_status.write('Contact:' + str(GAME_CONTACT) + ' Time: ' + str(GAME_TIME)+ 's'
-                   + ' Motion:' + SNAKE_MOTION, font=('Arial', 16, 'bold'))
-    # Update the game status bar
+
+    global STATUS_DIRTY
+    if not STATUS_DIRTY:
+        return
+    STATUS_DIRTY = False
+    TEXT.show('status', 'Contact:' + str(GAME_CONTACT) + ' Time: ' + str(GAME_TIME) + 's'
+              + ' Motion:' + SNAKE_MOTION, -240, 240, STATUS_FONT)
 
 
 def refresh_time()-> None:
     '''
     Refresh the game time.
-    Refresh the game time every second.
-    If the game is not paused, increment the game time.
+    The game loop runs this every second.
+    If the game is not over, increment the game time.
     If the game is over, return.
 
     Args: None
@@ -135,20 +188,11 @@ def refresh_time()-> None:
     '''
         
     global GAME_TIME
-    global IS_START_TIME
-    global IS_END_TIME
 
     # Refresh the game time
-    if IS_START_TIME:
-        IS_START_TIME = False
-        game_screen.ontimer(refresh_time, 1000)
-    else:
-        if not IS_END_TIME:
-            GAME_TIME += 1
-            refresh_status_bar()
-            game_screen.ontimer(refresh_time, 1000)
-        else:
-            return
+    if not IS_END_TIME:
+        GAME_TIME += 1
+        refresh_status_bar()
 
 
 def display_frame()-> None:
@@ -166,7 +210,7 @@ def display_frame()-> None:
     global game_introduction
 
     # Display the game frame
-    game_screen_frame = turtle.Turtle()
+    game_screen_frame = get_renderer().turtle()
     game_screen_frame.hideturtle()
     game_screen_frame.pensize(2)
     game_screen_frame.penup()
@@ -190,7 +234,7 @@ def display_frame()-> None:
     game_screen_frame.fd(80)
 
     # Display the game introduction
-    game_introduction = turtle.Turtle()
+    game_introduction = get_renderer().turtle()
     game_introduction.hideturtle()
     game_introduction.penup()
     game_introduction.goto(-200, 100)
@@ -217,62 +261,64 @@ def display_snake()-> None:
     snake_head.goto(-240 + HEAD_CURR_POS[0] * 20, -280 + HEAD_CURR_POS[1] * 20)
     
     # Display the snake tail
-    for each_block_location in SNAKE_TAIL_POS:
-        snake_tail.goto(-240 + each_block_location[0] * 20, -280 + each_block_location[1] * 20)
-        snake_tail.stamp()
+    snake_tail.clearstamps()
+    SNAKE_TAIL_STAMPS.clear()
+    for each_block_cell in SNAKE_TAIL_POS:
+        block_x, block_y = GRID.unpack(each_block_cell)
+        snake_tail.goto(-240 + block_x * 20, -280 + block_y * 20)
+        SNAKE_TAIL_STAMPS.append(snake_tail.stamp())
     game_screen.update()
 
 
+def display_snake_step(retracted)-> None:
+    '''
+    Display one step of the snake.
+    Move the snake head to the current position.
+    Stamp the new tail block where the head was.
+    If the tail retracted, remove the oldest stamp at the tail end.
+    Only two stamps change, however long the snake is.
+    The game loop flushes the screen at the end of the frame.
+
+    Args: retracted
+    Returns: None
+    '''
+    
+    snake_head.goto(-240 + HEAD_CURR_POS[0] * 20, -280 + HEAD_CURR_POS[1] * 20)
+
+    if SNAKE_TAIL_POS:
+        block_x, block_y = GRID.unpack(SNAKE_TAIL_POS[0])
+        snake_tail.goto(-240 + block_x * 20, -280 + block_y * 20)
+        SNAKE_TAIL_STAMPS.appendleft(snake_tail.stamp())
+    if retracted:
+        snake_tail.clearstamp(SNAKE_TAIL_STAMPS.pop())
+
+
 def display_food()-> None:
     '''
     Display the food.
-    Set the food to the current position.
-    Randomly set the food position.
-    Ensure that the food is not placed in the center of the screen.
-    Ensure that the food is not placed on top of each other.
+    Show the number of every food not eaten yet at its current position.
     The format of the food is a number from 1 to 5.
     The font is Arial, size 13, and normal.
 
     Args: None
     Returns: None
     '''
-    
-    global food_1
-    global food_2
-    global food_3
-    global food_4
-    global food_5
 
-    # Display the food
-    food_1 = turtle.Turtle()
-    food_1.penup()
-    food_1.hideturtle()
-    food_1.goto(-240 + food_pos_1[0] * 20, -290 + food_pos_1[1] * 20)
-    food_1.write('1', font=('Arial', 13, 'normal'))
+    for number, pos in enumerate([food_pos_1, food_pos_2, food_pos_3, food_pos_4, food_pos_5], start=1):
+        if pos != [-1, -1]:
+            show_food(number, pos)
 
-    food_2 = turtle.Turtle()
-    food_2.penup()
-    food_2.hideturtle()
-    food_2.goto(-240 + food_pos_2[0] * 20, -290 + food_pos_2[1] * 20)
-    food_2.write('2', font=('Arial', 13, 'normal'))
 
-    food_3 = turtle.Turtle()
-    food_3.penup()
-    food_3.hideturtle()
-    food_3.goto(-240 + food_pos_3[0] * 20, -290 + food_pos_3[1] * 20)
-    food_3.write('3', font=('Arial', 13, 'normal'))
+def show_food(number, pos)-> None:
+    '''
+    Show the number of one food at a position.
+    Only a food label that moved is redrawn.
 
-    food_4 = turtle.Turtle()
-    food_4.penup()
-    food_4.hideturtle()
-    food_4.goto(-240+ food_pos_4[0] * 20, -290 + food_pos_4[1] * 20)
-    food_4.write('4', font=('Arial', 13, 'normal'))
+    Args: number, pos
+    Returns: None
+    '''
 
-    food_5 = turtle.Turtle()
-    food_5.penup()
-    food_5.hideturtle()
-    food_5.goto(-240 + food_pos_5[0] * 20, -290 + food_pos_5[1] * 20)
-    food_5.write('5', font=('Arial', 13, 'normal'))
+    TEXT.show(('food', number), str(number), -240 + pos[0] * 20, -290 + pos[1] * 20, FOOD_FONT)
 
 
 def display_monsters()-> None:
@@ -303,7 +349,7 @@ def display_game_over()-> None:
     Returns: None
     '''
     
-    game_over_sign = turtle.Turtle()
+    game_over_sign = get_renderer().turtle()
     game_over_sign.penup()
     game_over_sign.hideturtle()
     game_over_sign.pencolor('red')
@@ -325,7 +371,7 @@ def display_game_win()-> None:
     '''
     
     # Display the game win sign
-    game_win_congratulation = turtle.Turtle()
+    game_win_congratulation = get_renderer().turtle()
     game_win_congratulation.penup()
     game_win_congratulation.hideturtle()
     game_win_congratulation.pencolor('red')
@@ -333,37 +379,14 @@ def display_game_win()-> None:
     game_win_congratulation.write('Winner!!!', font=('Arial', 18, 'bold'))
 
 
-def is_food_valid(pos_1, pos_2, pos_3, pos_4, pos_5)-> bool:
-    '''
-    Check if the food is valid.
-    If the food is not placed in the center of the screen and not placed on top of each other, return True.
-    Use a list to store the food positions.
-    Compare the length of the list with 5.
-    
-    Args: pos_1, pos_2, pos_3, pos_4, pos_5
-    Returns: bool
-    '''
-    
-    # Check if the food is valid
-    pos_list = []
-    for pos in [pos_1, pos_2, pos_3, pos_4, pos_5]:
-        if pos not in pos_list:
-            pos_list.append(pos)
-    if len(pos_list) == 5 and [12, 12] not in pos_list:
-        return True
-    else:
-        
-        return 
-
-
 def set_food()-> None:
     '''
     Set up the food.
     Set the food positions.
     Use a list to store the food positions.
-    Randomly set the food positions.
-    Ensure that the food is not placed in the center of the screen.
-    Ensure that the food is not placed on top of each other.
+    Draw the food positions from a pool of the empty cells in the food area.
+    The snake head and monsters are not empty, so no food lands on them.
+    Each cell is drawn once, so no food is placed on top of another.
     Record the original food positions.
     Set boundary, status bar upper boundary, and game area lower boundary.
     
@@ -381,15 +404,13 @@ def set_food()-> None:
     
     game_area_lower_boundary = 3 # Game area lower boundary
 
-    # Set up the food positions
-    food_positions = []
-
-    for _ in range(5):
-        pos_x = randrange(boundary, 25 - boundary)
-        pos_y = randrange(game_area_lower_boundary, 25 - status_bar_upper_boundary)
-        food_positions.append([pos_x, pos_y])
+    # Draw five distinct empty cells of the food area; the snake head and monsters already fill theirs
+    food_area = CellPool(GRID.size * GRID.size, (GRID.index([x, y])
+                                                 for y in range(game_area_lower_boundary, 25 - status_bar_upper_boundary)
+                                                 for x in range(boundary, 25 - boundary)
+                                                 if GRID.is_free([x, y])))
+    food_positions = [list(GRID.unpack(food_area.pop_random(RNG))) for _ in range(5)]
 
-    
     food_pos_1, food_pos_2, food_pos_3, food_pos_4, food_pos_5 = food_positions
 
     # Set up the original food positions
@@ -399,10 +420,8 @@ def set_food()-> None:
     original_food_pos_4 = list(food_pos_4)
     original_food_pos_5 = list(food_pos_5)
 
-    # Check if the food is valid
-    if not is_food_valid(food_pos_1, food_pos_2, food_pos_3, food_pos_4, food_pos_5):
-        set_food()  
-
+    for number, pos in enumerate(food_positions, start=1):
+        GRID.set_food(pos, number)
 
 
 def set_snake_direction_up()-> None:
@@ -443,6 +462,181 @@ def set_snake_paused()-> None:
         SNAKE_MOTION = PREVIOUS_MOTION  
 
 
+KEY_HANDLERS = {
+    'Up': set_snake_direction_up,
+    'Down': set_snake_direction_down,
+    'Left': set_snake_direction_left,
+    'Right': set_snake_direction_right,
+    'space': set_snake_paused,
+}
+
+
+def seed_game(seed=None)-> None:
+    '''
+    Seed the game randomness.
+    The same seed and the same key presses always give the same game.
+    Without a seed, a fresh random one is drawn and remembered in GAME_SEED.
+
+    Args: seed
+    Returns: None
+    '''
+
+    global GAME_SEED
+    GAME_SEED = Random().getrandbits(64) if seed is None else seed
+    RNG.seed(GAME_SEED)
+
+
+def next_tick()-> int:
+    '''
+    Return the game-loop tick that a key pressed now takes effect in.
+    Keys pressed before the game starts take effect in tick 0.
+
+    Args: None
+    Returns: int
+    '''
+
+    if GAME_LOOP is None:
+        return 0
+    return GAME_LOOP.sim_ms // FRAME_STEP + 1
+
+
+def press_key(key, tick=None)-> None:
+    '''
+    Handle a key press.
+    Record it for the replay while the game is running, then apply it.
+
+    Args: key, tick (default: the next tick)
+    Returns: None
+    '''
+
+    if RECORDER is not None and (GAME_LOOP is None or GAME_LOOP.running):
+        RECORDER.record(next_tick() if tick is None else tick, key)
+    KEY_HANDLERS[key]()
+
+
+def play_replay_events()-> None:
+    '''
+    Apply the replayed key presses of the current tick.
+    The game loop runs this first in every tick while replaying.
+    Stop the game at the end of the replay.
+
+    Args: None
+    Returns: None
+    '''
+
+    tick = GAME_LOOP.sim_ms // FRAME_STEP
+    while REPLAY_EVENTS and REPLAY_EVENTS[0][0] <= tick:
+        _, key = REPLAY_EVENTS.popleft()
+        if key == END:
+            stop_game(tick)
+            return
+        press_key(key, tick)
+
+
+def profile_game(path=None)-> None:
+    '''
+    Switch on profiling, before main() runs.
+    Wrap every function of PROFILED_SUBSYSTEMS so its calls are timed under its subsystem;
+    the game loop adds the screen updates, whole frames and the interval of every task.
+    The stats are dumped to path as JSON on exit, if a path is given.
+
+    Args: path
+    Returns: None
+    '''
+
+    global PROFILER, PROFILE_PATH
+    PROFILER = Profiler()
+    PROFILE_PATH = path
+    for subsystem, names in PROFILED_SUBSYSTEMS.items():
+        for name in names:
+            globals()[name] = PROFILER.wrap(subsystem, globals()[name])
+
+
+def toggle_profile_overlay()-> None:
+    '''
+    Show or hide the profile overlay.
+
+    Args: None
+    Returns: None
+    '''
+
+    global PROFILE_OVERLAY
+    PROFILE_OVERLAY = not PROFILE_OVERLAY
+    refresh_profile_overlay()
+
+
+def refresh_profile_overlay()-> None:
+    '''
+    Redraw the profile overlay: p50, p99 and worst latency per subsystem,
+    and the actual interval of every task next to the one it was scheduled with.
+    The game loop runs this every second while profiling.
+
+    Args: None
+    Returns: None
+    '''
+
+    if PROFILE_OVERLAY:
+        TEXT.show('profile', '\n'.join(PROFILER.summary_lines()), -240, -280, ('Courier', 9, 'normal'))
+    else:
+        TEXT.hide('profile')
+
+
+def dump_profile()-> None:
+    '''
+    Dump the profile to PROFILE_PATH as JSON, if profiling to a file.
+
+    Args: None
+    Returns: None
+    '''
+
+    if PROFILER is not None and PROFILE_PATH:
+        PROFILER.dump(PROFILE_PATH)
+
+
+def autopilot_move()-> None:
+    '''
+    Let the autopilot steer the snake.
+    The game loop runs this in every tick before the snake moves.
+    Press the key the autopilot chooses, like a player would, when it differs from the current motion.
+    Do nothing while the player has paused the game.
+
+    Args: None
+    Returns: None
+    '''
+
+    if SNAKE_MOTION == 'Paused' and PREVIOUS_MOTION != 'Paused':
+        return
+    foods = [food_pos_1, food_pos_2, food_pos_3, food_pos_4, food_pos_5]
+    key = AUTOPILOT.choose(HEAD_CURR_POS, SNAKE_TAIL_POS, monster_curr_pos, foods, SNAKE_TAIL_DEFAULT)
+    if key is not None and key != SNAKE_MOTION:
+        press_key(key, GAME_LOOP.sim_ms // FRAME_STEP)
+
+
+def stop_game(end_tick=None)-> None:
+    '''
+    Stop the game loop and save the replay, if recording.
+
+    Args: end_tick (default: the next tick)
+    Returns: None
+    '''
+
+    GAME_LOOP.stop()
+    save_recording(end_tick)
+
+
+def save_recording(end_tick=None)-> None:
+    '''
+    Finish and save the replay of the current game, once.
+
+    Args: end_tick (default: the next tick)
+    Returns: None
+    '''
+
+    if RECORDER is not None and not RECORDER.finished:
+        RECORDER.finish(next_tick() if end_tick is None else end_tick)
+        RECORDER.save(RECORD_PATH)
+
+
 def is_snake_movable(target_position):
     '''
     Check if the snake is movable to the target position.
@@ -459,11 +653,12 @@ def is_snake_movable(target_position):
 def snake_move()-> None:
     '''
     Move the snake.
+    The game loop runs this every SNAKE_SPEED milliseconds.
     Catch the snake motion.
     If the snake is paused, return.
     If the snake is not paused, move the snake.
-    Update the snake tail position.
-    Expand the snake tail.
+    Push the old head cell onto the tail and retract the tail end,
+    unless the snake is still growing.
     Check if the snake has eaten the food.
     Check if the snake has contacted the monster.
     
@@ -471,8 +666,7 @@ def snake_move()-> None:
     Returns: None
     '''
     
-    global SNAKE_MOTION, SNAKE_SPEED, HEAD_TARGET_POS, HEAD_CURR_POS, SNAKE_TAIL_LENGTH, SNAKE_TAIL_POS, SNAKE_TAIL_DEFAULT
-    tail_to_expand_pos = [12, 12]
+    global SNAKE_MOTION, SNAKE_SPEED, HEAD_TARGET_POS, HEAD_CURR_POS, SNAKE_TAIL_LENGTH, SNAKE_TAIL_DEFAULT
 
     # Move the snake
     if is_game_over():
@@ -489,40 +683,38 @@ def snake_move()-> None:
                 HEAD_TARGET_POS = [HEAD_CURR_POS[0] + 1, HEAD_CURR_POS[1]]
 
             if is_snake_movable(HEAD_TARGET_POS):
-                if SNAKE_TAIL_LENGTH > 0:
-                    tail_to_expand_pos = SNAKE_TAIL_POS[-1]
-                    SNAKE_TAIL_POS = [HEAD_CURR_POS] + SNAKE_TAIL_POS[:-1]
+                head_cell = GRID.index(HEAD_CURR_POS)
+                SNAKE_TAIL_POS.appendleft(head_cell)
+                GRID.add_tail_cell(head_cell)
 
+                GRID.move_head(HEAD_CURR_POS, HEAD_TARGET_POS)
                 HEAD_CURR_POS = HEAD_TARGET_POS
 
-                if SNAKE_TAIL_DEFAULT > 0:
-                    snake_expand(tail_to_expand_pos)
+                retracted = SNAKE_TAIL_DEFAULT <= 0
+                if retracted:
+                    GRID.remove_tail_cell(SNAKE_TAIL_POS.pop())
+                else:
+                    snake_expand()
 
-                snake_tail.clearstamps()
-                display_snake()
+                display_snake_step(retracted)
                 eat_food()
                 check_contact()  # Check contact after the snake moves
-            game_screen.ontimer(snake_move, SNAKE_SPEED)
-        else:
-            game_screen.ontimer(snake_move, SNAKE_SPEED)
 
-def snake_expand(to_expand_pos)-> None:
+def snake_expand()-> None:
     '''
     Expand the snake tail.
-    Expand the snake by one block.
+    Expand the snake by one block: the tail end stays put for this step.
     If the snake is expanded, set the snake speed to 400.
     Slow down the snake speed.
     
-    Args: to_expand_pos
+    Args: None
     Returns: None
     '''
     
     global SNAKE_TAIL_LENGTH
     global SNAKE_TAIL_DEFAULT
-    global SNAKE_TAIL_POS
     global SNAKE_SPEED
 
-    SNAKE_TAIL_POS.append(to_expand_pos)
     SNAKE_TAIL_LENGTH += 1
     SNAKE_TAIL_DEFAULT -= 1
 
@@ -577,10 +769,12 @@ def set_MONSTER_SPEED()-> None:
 def monsters_move()-> None:
     '''
     Move the monsters.
+    The game loop runs this every MONSTER_SPEED milliseconds.
     Move the monsters to the target position.
     If the game is over, return.
-    If the monster is movable, move the monster.
-    Use the precise pixel measurements to check the contact with the monster.
+    With few monsters, each chosen monster takes the greedy dx/dy steps towards the head.
+    With FIELD_MIN_MONSTERS or more, compute one distance field from the snake head instead,
+    and each chosen monster steps to its free neighbour nearest the head, routing around the others.
     If the monster contacts with the snake, increment the game contact.
     Randomly set the target position of the monsters.
     Ensure that the monsters are not placed in the center of the screen.
@@ -594,41 +788,35 @@ def monsters_move()-> None:
         return
 
     # Randomly choose 1 or 2 monsters to move
-    num_monsters_to_move = min(len(monsters), randrange(1, 3))
-    monsters_to_move = sample(list(enumerate(monsters)), num_monsters_to_move)
+    num_monsters_to_move = min(len(monsters), RNG.randrange(1, 3))
+    monsters_to_move = RNG.sample(list(enumerate(monsters)), num_monsters_to_move)
+
+    if len(monsters) < FIELD_MIN_MONSTERS:
+        for index, monster in monsters_to_move:
+            for move in greedy_moves(monster_curr_pos[index], HEAD_CURR_POS):
+                if is_monster_movable(move) and not GRID.has(move, MONSTER):
+                    GRID.move_monster(monster_curr_pos[index], move)
+                    monster_curr_pos[index] = move
+                    monster.goto(-230 + move[0] * 20, -270 + move[1] * 20)
+        return
+
+    # One BFS per tick, then O(1) per monster
+    field = distance_field(GRID.index(HEAD_CURR_POS), GRID.cells, MONSTER)
 
     for index, monster in monsters_to_move:
-        curr_pos = monster_curr_pos[index]
-        target_pos = monster_target_pos[index]
-
-        dx = HEAD_CURR_POS[0] - curr_pos[0]
-        dy = HEAD_CURR_POS[1] - curr_pos[1]
-
-        suggested_moves = []
-        if dy >= dx and dy >= -dx and dy >= 0:
-            suggested_moves.append([curr_pos[0], curr_pos[1] + 1])
-        if dy <= dx and dy <= -dx and dy <= 0:
-            suggested_moves.append([curr_pos[0], curr_pos[1] - 1])
-        if -dx <= dy <= dx and dx >= 0:
-            suggested_moves.append([curr_pos[0] + 1, curr_pos[1]])
-        if dx <= dy <= -dx and dx <= 0:
-            suggested_moves.append([curr_pos[0] - 1, curr_pos[1]])
-
-        for move in suggested_moves:
-            if is_monster_movable(move) and move not in monster_curr_pos:
-                monster_curr_pos[index] = move
-                monster.goto(-230 + move[0] * 20, -270 + move[1] * 20)
-
-    turtle.update()  # Force screen update to reflect changes
-    if not IS_END_TIME:
-        game_screen.ontimer(monsters_move, MONSTER_SPEED)  # Continue moving monsters at a set interval
+        move = downhill_move(field, monster_curr_pos[index], GRID.cells, MONSTER)
+        if move is not None:
+            GRID.move_monster(monster_curr_pos[index], move)
+            monster_curr_pos[index] = move
+            monster.goto(-230 + move[0] * 20, -270 + move[1] * 20)
 
 
 
 
 def check_contact_with_monster(monster_index)-> None:
     '''
-    Check the contact with the monster using precise pixel measurements.
+    Check the contact with one monster.
+    Look up the cells the monster overlaps in the occupancy grid.
     If the monster is contact with the snake, increment the game contact.
     
     Args: monster_index
@@ -636,19 +824,9 @@ def check_contact_with_monster(monster_index)-> None:
     '''
     
     global GAME_CONTACT
-    curr_pos = monster_curr_pos[monster_index]
-    monster_pixel_x = -230 + curr_pos[0] * 20
-    monster_pixel_y = -270 + curr_pos[1] * 20
-
-    # Check the contact with the monster using pixel distance
-    for block in SNAKE_TAIL_POS:
-        snake_pixel_x = -240 + block[0] * 20
-        snake_pixel_y = -280 + block[1] * 20
-
-        if -10 < (monster_pixel_x - snake_pixel_x) < 10 and -10 < (monster_pixel_y - snake_pixel_y) < 10:
-            GAME_CONTACT += 1
-            refresh_status_bar()
-            return
+    if GRID.monster_touches_tail(monster_curr_pos[monster_index]):
+        GAME_CONTACT += 1
+        refresh_status_bar()
 
 
 
@@ -665,42 +843,24 @@ def eat_food()-> None:
     
     global SNAKE_TAIL_DEFAULT
 
-    if food_pos_1 == HEAD_CURR_POS:
-        food_1.clear()
-        food_pos_1[0] = -1  
-        food_pos_1[1] = -1
-        FOOD_TO_EAT.remove(1)
-        SNAKE_TAIL_DEFAULT += 1
-    if food_pos_2 == HEAD_CURR_POS:
-        food_2.clear()
-        food_pos_2[0] = -1
-        food_pos_2[1] = -1
-        FOOD_TO_EAT.remove(2)
-        SNAKE_TAIL_DEFAULT += 2
-    if food_pos_3 == HEAD_CURR_POS:
-        food_3.clear()
-        food_pos_3[0] = -1
-        food_pos_3[1] = -1
-        FOOD_TO_EAT.remove(3)
-        SNAKE_TAIL_DEFAULT += 3
-    if food_pos_4 == HEAD_CURR_POS:
-        food_4.clear()
-        food_pos_4[0] = -1
-        food_pos_4[1] = -1
-        FOOD_TO_EAT.remove(4)
-        SNAKE_TAIL_DEFAULT += 4
-    if food_pos_5 == HEAD_CURR_POS:
-        food_5.clear()
-        food_pos_5[0] = -1
-        food_pos_5[1] = -1
-        FOOD_TO_EAT.remove(5)
-        SNAKE_TAIL_DEFAULT += 5
+    # The food under the head, 0 if there is none
+    number = GRID.food_at(HEAD_CURR_POS)
+    if not number:
+        return
+
+    food_pos = (food_pos_1, food_pos_2, food_pos_3, food_pos_4, food_pos_5)[number - 1]
+    TEXT.hide(('food', number))
+    GRID.clear_food(food_pos)
+    food_pos[0] = -1
+    food_pos[1] = -1
+    FOOD_TO_EAT.remove(number)
+    SNAKE_TAIL_DEFAULT += number
 
 
 def is_game_over()-> bool:
     '''
     Check if the game is over due to collision with a monster.
-    If the snake head is within 10 pixels of a monster, display the game over sign.
+    If a monster is on the snake head cell, display the game over sign.
     If the snake tail length is 20, display the game win sign.
 
     Args: None   
@@ -710,17 +870,17 @@ def is_game_over()-> bool:
     global IS_END_TIME
     
     # Check collision with monsters only
-    for pos in monster_curr_pos:
-        if -10 < (pos[0] * 20 - HEAD_CURR_POS[0] * 20) < 10 and \
-           -10 < (pos[1] * 20 - HEAD_CURR_POS[1] * 20) < 10:
-            display_game_over()
-            IS_END_TIME = True
-            return True
+    if GRID.has(HEAD_CURR_POS, MONSTER):
+        display_game_over()
+        IS_END_TIME = True
+        stop_game()
+        return True
 
     # Check if the player has won the game (optional winning condition)
     if SNAKE_TAIL_LENGTH == 20:
         display_game_win()
         IS_END_TIME = True
+        stop_game()
         return True
     
     return False
@@ -730,7 +890,8 @@ def check_contact()-> None:
     '''
     Check the contact.
     Determine if the snake has contacted the monster.
-    Use precise pixel measurements to check the contact.
+    Each monster checks the four tail cells it overlaps in the occupancy grid,
+    the same cells the pixel test within 20 pixels used to find.
        
     Args: None
     Returns: None
@@ -739,20 +900,22 @@ def check_contact()-> None:
     # Check the contact
     global GAME_CONTACT
     for monster_pos in monster_curr_pos:
-        monster_pixel_x = -230 + monster_pos[0] * 20
-        monster_pixel_y = -270 + monster_pos[1] * 20
-        for snake_block in SNAKE_TAIL_POS:
-            snake_pixel_x = -240 + snake_block[0] * 20
-            snake_pixel_y = -280 + snake_block[1] * 20
-            if -20 <= (monster_pixel_x - snake_pixel_x) <= 20 and -20 <= (monster_pixel_y - snake_pixel_y) <= 20:
-                GAME_CONTACT += 1
-                refresh_status_bar()
-                return
+        if GRID.monster_touches_tail(monster_pos):
+            GAME_CONTACT += 1
+            refresh_status_bar()
+            return
 
 
 def start_game(x, y)-> None:
     '''
     Start the game.
+    Run the snake, the monsters, the clock and the food relocation on one game loop.
+    The snake and the monsters move straight away, each at its own speed.
+    The clock ticks every second and the food moves every 5 seconds.
+    The loop flushes the screen once per frame, redrawing the status bar first if anything changed it.
+    When profiling, the profile overlay is refreshed every second.
+    When replaying, the recorded key presses are applied first in every tick.
+    Otherwise the autopilot, if enabled, steers the snake before every tick.
     
     Args: x, y
     Returns: None
@@ -760,15 +923,25 @@ def start_game(x, y)-> None:
 
     global game_introduction
     global GAME_TIME
+    global GAME_LOOP
     game_introduction.clear()
     game_screen.onclick(None)
 
     display_food() 
-    game_screen.ontimer(relocate_food, 5000)
-    refresh_time() 
-    snake_move()  
     set_MONSTER_SPEED()  
-    monsters_move()  
+    GAME_LOOP = Scheduler(game_screen, FRAME_STEP, speed=GAME_SPEED, profiler=PROFILER)
+    if REPLAY_EVENTS:
+        GAME_LOOP.every(play_replay_events, FRAME_STEP, delay=0)
+    elif AUTOPILOT is not None:
+        GAME_LOOP.every(autopilot_move, FRAME_STEP, delay=0)
+    GAME_LOOP.every(snake_move, lambda: SNAKE_SPEED, delay=0)
+    GAME_LOOP.every(monsters_move, lambda: MONSTER_SPEED, delay=0)
+    GAME_LOOP.every(refresh_time, 1000)
+    GAME_LOOP.every(relocate_food, 5000)
+    GAME_LOOP.every_frame(draw_status_bar)
+    if PROFILER is not None:
+        GAME_LOOP.every(refresh_profile_overlay, 1000)
+    GAME_LOOP.start()
     return x, y
 
 
@@ -776,18 +949,19 @@ def start_game(x, y)-> None:
 def relocate_food()-> None:
     '''
     Relocate the food.
+    The game loop runs this every 5 seconds.
     Use a list to store the food positions.
-    And a list to store the food objects.
-    Randomly set the food positions.
-    Ensure that the food is not placed in the center of the screen.
-    Ensure that the food is not placed on top of each other.
+    Only the labels of the foods that moved are redrawn.
+    Draw each new position from the grid's pool of empty cells.
+    The old cells and the new ones already drawn are not empty, so no food is placed on top of another,
+    nor on the snake or a monster.
+    If the board has no empty cell left, the food stays where it is.
     
     Args: None
     Returns: None
     '''
     
     global food_pos_1, food_pos_2, food_pos_3, food_pos_4, food_pos_5
-    global food_1, food_2, food_3, food_4, food_5
     global IS_END_TIME  
 
     
@@ -795,52 +969,41 @@ def relocate_food()-> None:
         return
 
     food_positions = [food_pos_1, food_pos_2, food_pos_3, food_pos_4, food_pos_5]
-    food_objects = [food_1, food_2, food_3, food_4, food_5]
     new_positions = []  
 
     
     for i, pos in enumerate(food_positions):
-        if pos != [-1, -1]:  
-            
-            food_objects[i].clear()
-
-            
-            new_pos = [randrange(0, 25), randrange(0, 25)]
-            while new_pos in food_positions or not is_food_valid(new_pos, *(food_positions[:i] + new_positions[i+1:])):
-                new_pos = [randrange(0, 25), randrange(0, 25)]
-            new_positions.append(new_pos)
-
-           
-            food_objects[i].goto(-240 + new_pos[0] * 20, -290 + new_pos[1] * 20)
-            food_objects[i].write(str(i+1), font=('Arial', 13, 'normal'))
-        else:
-            new_positions.append(pos)  
+        cell = GRID.random_free_cell(RNG) if pos != [-1, -1] else None
+        if cell is None:
+            new_positions.append(pos)
+            continue
 
-   
-    food_pos_1, food_pos_2, food_pos_3, food_pos_4, food_pos_5 = new_positions
+        new_pos = list(GRID.unpack(cell))
+        GRID.set_food(new_pos, i + 1)
+        new_positions.append(new_pos)
 
-    
-    game_screen.ontimer(relocate_food, 5000)
+        show_food(i + 1, new_pos)
 
-def is_food_valid(pos, *other_positions)-> bool:
-    '''
-    Check if the food is valid.
-    If the food is not placed in the center of the screen and not placed on top of each other, return True.
-    And return False otherwise.
+    # Free the old cells only now, so no food was moved onto another's old cell
+    for pos, new_pos in zip(food_positions, new_positions):
+        if new_pos is not pos:
+            GRID.clear_food(pos)
+
+    food_pos_1, food_pos_2, food_pos_3, food_pos_4, food_pos_5 = new_positions
 
-    Args: pos, *other_positions
-    Returns: bool
-    '''
-    
-    return all(pos != other for other in other_positions if other != [-1, -1])
 
 def main()-> None:
     '''
     Main function.
+    Seed the game if it has no seed yet.
+    Keys and clicks are bound only when a player is playing, not during a replay.
+    The profile overlay key works in both.
     
     Args: None
     Returns: None
     '''
+    if GAME_SEED is None:
+        seed_game()
     setup_screen()
     setup_monsters()  
     setup_snake()
@@ -848,15 +1011,104 @@ def main()-> None:
     display_snake()
     display_monsters()  
     set_food()
-    game_screen.onkey(set_snake_direction_up, 'Up')
-    game_screen.onkey(set_snake_direction_down, 'Down')
-    game_screen.onkey(set_snake_direction_left, 'Left')
-    game_screen.onkey(set_snake_direction_right, 'Right')
-    game_screen.onkey(set_snake_paused, 'space')
+    if PROFILER is not None:
+        game_screen.onkey(toggle_profile_overlay, PROFILE_KEY)
+        game_screen.listen()
+    if REPLAY_EVENTS:
+        return
+    for key in KEY_HANDLERS:
+        game_screen.onkey(lambda key=key: press_key(key), key)
     game_screen.onclick(start_game)
     game_screen.listen()
 
-if __name__ == '__main__':
+
+def replay_game(path, speed=0, record_path=None)-> None:
+    '''
+    Replay a recorded game.
+    With speed 0, re-simulate it as fast as possible without drawing and print the result.
+    Otherwise show it on screen at that many times real speed.
+    Optionally record the replay again, which reproduces the file byte for byte.
+
+    Args: path, speed, record_path
+    Returns: None
+    '''
+
+    global RECORDER, RECORD_PATH, GAME_SPEED
+    seed, events = load_replay(path)
+    seed_game(seed)
+    REPLAY_EVENTS.extend(events)
+    if record_path:
+        RECORDER = ReplayRecorder(seed)
+        RECORD_PATH = record_path
+    if speed:
+        GAME_SPEED = speed
+    else:
+        set_renderer(NullRenderer())
     main()
-    game_screen.listen()
-    game_screen.mainloop()
\ No newline at end of file
+    start_game(0, 0)
+    if not speed:
+        while GAME_LOOP.running:
+            GAME_LOOP.tick()
+        print('Replay finished at tick', GAME_LOOP.sim_ms // FRAME_STEP, '- Contact:', GAME_CONTACT,
+              'Time:', str(GAME_TIME) + 's', 'Length:', SNAKE_TAIL_LENGTH, 'Food left:', FOOD_TO_EAT)
+
+
+def parse_seed(text):
+    '''
+    Parse a --seed value.
+    Seeds run from 0 to MAX_SEED, so every seed fits in a replay header.
+
+    Args: text
+    Returns: int
+    '''
+
+    seed = int(text)
+    if not 0 <= seed <= MAX_SEED:
+        raise argparse.ArgumentTypeError(f'must be from 0 to {MAX_SEED}, not {seed}')
+    return seed
+
+
+def parse_args():
+    '''
+    Parse the command line options for seeding, recording and replaying games, the autopilot and profiling.
+
+    Args: None
+    Returns: argparse.Namespace
+    '''
+
+    parser = argparse.ArgumentParser(description='Hungry Snake')
+    parser.add_argument('--seed', type=parse_seed, help=f'seed for a reproducible game, from 0 to {MAX_SEED}')
+    parser.add_argument('--record', metavar='FILE', help='save the key presses of the game as a replay')
+    parser.add_argument('--replay', metavar='FILE', help='play back a recorded game')
+    parser.add_argument('--speed', type=float, default=0,
+                        help='replay speed: 0 re-simulates without drawing, N shows the game at N times real speed')
+    parser.add_argument('--autopilot', action='store_true', help='let the snake play itself, starting straight away')
+    parser.add_argument('--profile', metavar='FILE',
+                        help=f'time the game subsystems, show them with {PROFILE_KEY} and dump them as JSON on exit')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.profile:
+        profile_game(args.profile)
+    try:
+        if args.replay:
+            replay_game(args.replay, args.speed, args.record)
+            if args.speed:
+                game_screen.mainloop()
+        else:
+            seed_game(args.seed)
+            if args.record:
+                RECORDER = ReplayRecorder(GAME_SEED)
+                RECORD_PATH = args.record
+            if args.autopilot:
+                AUTOPILOT = Autopilot()
+            main()
+            if AUTOPILOT is not None:
+                start_game(0, 0)
+            game_screen.listen()
+            game_screen.mainloop()
+    finally:
+        save_recording()
+        dump_profile()
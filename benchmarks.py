@@ -0,0 +1,306 @@
+"""Benchmark suite for the hot paths of the three games.
+
+Each benchmark loads a game script with importlib, draws nothing (the null
+renderer), and times one hot path for several values of one parameter, a
+board size or a tail length:
+
+- Assignment1-2024.py: is_solvable on n x n boards of odd width, the only
+  boards its inversion-count rule is right for, then move_tile and is_solved.
+- Assignment2-2024.py: execute_move, shuffle_puzzle, check_ifsolved and
+  draw_puzzle after a move, on n x n boards.
+- Assignment3-2024.py: snake_move, check_contact and monsters_move, one call
+  each per simulated tick, with the snake held at several tail lengths while
+  the autopilot steers it.
+
+Functions that do not depend on a size (move_tile and is_solved work on the
+3 x 3 board only) run at size 3. Every case is timed over several rounds,
+after one warm-up round, and the fastest round counts, which filters out
+noise from the rest of the machine.
+
+Results are written as JSON, mapping 'name[param]' to nanoseconds per call.
+Given a baseline file, the run fails (exit status 1) when any case is more
+than --threshold percent slower than its baseline. A baseline file that is
+missing or unreadable is an error (exit status 2), except with
+--save-baseline, which writes it:
+
+    python benchmarks.py --output results.json --baseline bench_baseline.json
+    python benchmarks.py --baseline bench_baseline.json --save-baseline
+
+Times in nanoseconds only compare on the machine that measured them, so the
+baseline is not kept in the repository (bench_baseline.json is ignored).
+Save it once on each machine that runs the comparison, such as a CI runner,
+and keep it there between runs.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import random
+import sys
+import time
+
+from renderer import NullRenderer, set_renderer
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_game(filename: str):
+    """
+    Load a game script as a fresh module, drawing with the null renderer.
+
+    Args: filename (relative to this directory)
+    Returns: module
+    """
+
+    set_renderer(NullRenderer())
+    name = 'bench_' + filename.replace('-', '_').removesuffix('.py')
+    spec = importlib.util.spec_from_file_location(name, os.path.join(HERE, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def bench_assignment1(size: int, number: int) -> dict:
+    """
+    Time is_solvable on a shuffled size x size board, and move_tile and is_solved on the 3 x 3 board.
+    is_solvable only counts inversions, which decides solvability for odd widths alone.
+
+    Args: size (odd), number (calls per round)
+    Returns: dict of name to seconds per call
+    """
+
+    if size % 2 == 0:
+        raise ValueError(f'is_solvable is only right for odd widths, not {size}')
+    game = load_game('Assignment1-2024.py')
+    rng = random.Random(size)
+    board = list(range(1, size * size)) + [' ']
+    rng.shuffle(board)
+    started = time.perf_counter()
+    for _ in range(number):
+        game.is_solvable(board)
+    results = {'a1.is_solvable': (time.perf_counter() - started) / number}
+    if size != 3:
+        return results
+
+    # A random walk of valid moves: left, right, up and down move the tile next to the blank.
+    moves = ('a', 'd', 'w', 's')
+    blank = 8
+    walk = []
+    for _ in range(number):
+        options = [move for move, ok in zip(moves, (blank % 3 != 2, blank % 3 != 0, blank < 6, blank >= 3)) if ok]
+        move = rng.choice(options)
+        blank += {'a': 1, 'd': -1, 'w': 3, 's': -3}[move]
+        walk.append(move)
+    chessboard = list(game.SOLVED_CHESSBOARD)
+    tile_index = game.create_index(chessboard)
+    started = time.perf_counter()
+    for move in walk:
+        game.move_tile(chessboard, move, moves, tile_index)
+    results['a1.move_tile'] = (time.perf_counter() - started) / number
+
+    started = time.perf_counter()
+    for _ in range(number):
+        game.is_solved(chessboard)
+    results['a1.is_solved'] = (time.perf_counter() - started) / number
+    return results
+
+
+def bench_assignment2(size: int, number: int) -> dict:
+    """
+    Time execute_move, shuffle_puzzle, check_ifsolved and draw_puzzle after a move on a size x size board.
+
+    Args: size, number (calls per round)
+    Returns: dict of name to seconds per call
+    """
+
+    game = load_game('Assignment2-2024.py')
+    random.seed(size)
+    game.BOARD_SIZE = size
+    game.color = 'Pale Green'
+    game.generate_solvable_puzzle(size)
+    steps = [game.generate_move() for _ in range(number)]
+    results = {}
+
+    started = time.perf_counter()
+    for x_dir, y_dir in steps:
+        game.execute_move(x_dir, y_dir)
+    results['a2.execute_move'] = (time.perf_counter() - started) / number
+
+    rounds = max(1, number // 75)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        game.shuffle_puzzle()
+    results['a2.shuffle_puzzle'] = (time.perf_counter() - started) / rounds
+
+    started = time.perf_counter()
+    for _ in range(number):
+        game.check_ifsolved()
+    results['a2.check_ifsolved'] = (time.perf_counter() - started) / number
+
+    game.draw_puzzle()
+    elapsed = 0.0
+    for x_dir, y_dir in steps:
+        game.execute_move(x_dir, y_dir)
+        started = time.perf_counter()
+        game.draw_puzzle()
+        elapsed += time.perf_counter() - started
+    results['a2.draw_puzzle'] = elapsed / number
+    return results
+
+
+def _snake_fixture(length: int, seed: int):
+    # A started game whose snake has grown to the given tail length and stops growing there.
+    from snake_autopilot import Autopilot
+
+    game = load_game('Assignment3-2024.py')
+    game.seed_game(seed)
+    game.main()
+    game.start_game(0, 0)
+    pilot = Autopilot()
+    game.SNAKE_TAIL_DEFAULT = length
+    while game.SNAKE_TAIL_LENGTH < length and not game.IS_END_TIME:
+        _steer(game, pilot)
+        game.snake_move()
+    game.SNAKE_TAIL_DEFAULT = 0
+    return game, pilot
+
+
+def _steer(game, pilot) -> None:
+    foods = [game.food_pos_1, game.food_pos_2, game.food_pos_3, game.food_pos_4, game.food_pos_5]
+    key = pilot.choose(game.HEAD_CURR_POS, game.SNAKE_TAIL_POS, game.monster_curr_pos, foods)
+    if key is not None:
+        game.KEY_HANDLERS[key]()
+
+
+def bench_assignment3(tail_length: int, number: int) -> dict:
+    """
+    Time one simulated tick of snake_move, check_contact and monsters_move with a tail of `tail_length` blocks.
+    The autopilot steers between ticks, untimed; a game that ends is replaced by a fresh one.
+
+    Args: tail_length (below the winning 20), number (ticks per round)
+    Returns: dict of name to seconds per call
+    """
+
+    seed = 1
+    game, pilot = _snake_fixture(tail_length, seed)
+    elapsed = {'a3.snake_move': 0.0, 'a3.check_contact': 0.0, 'a3.monsters_move': 0.0}
+    for _ in range(number):
+        if game.IS_END_TIME:
+            seed += 1
+            game, pilot = _snake_fixture(tail_length, seed)
+        _steer(game, pilot)
+        game.SNAKE_TAIL_DEFAULT = 0
+        started = time.perf_counter()
+        game.snake_move()
+        moved = time.perf_counter()
+        game.check_contact()
+        checked = time.perf_counter()
+        game.monsters_move()
+        elapsed['a3.snake_move'] += moved - started
+        elapsed['a3.check_contact'] += checked - moved
+        elapsed['a3.monsters_move'] += time.perf_counter() - checked
+    return {name: seconds / number for name, seconds in elapsed.items()}
+
+
+# (benchmark, parameter values: board sizes, or tail lengths for a3, calls per round)
+SUITES = (
+    (bench_assignment1, (3, 11, 31), 2000),
+    (bench_assignment2, (3, 5, 10, 15), 300),
+    (bench_assignment3, (1, 10, 19), 300),
+)
+
+
+def run_suite(rounds: int = 5, scale: float = 1.0, only: str = '') -> dict:
+    """
+    Run every benchmark for every parameter value and return the fastest round of each case, after one warm-up round.
+
+    Args: rounds, scale (multiplies the calls per round), only (report only the cases whose name contains it)
+    Returns: dict of 'name[param]' to nanoseconds per call
+    """
+
+    results = {}
+    for benchmark, params, number in SUITES:
+        for param in params:
+            best = {}
+            benchmark(param, max(1, int(number * scale)))  # warm-up round, not counted
+            for _ in range(rounds):
+                for name, seconds in benchmark(param, max(1, int(number * scale))).items():
+                    best[name] = min(seconds, best.get(name, seconds))
+            for name, seconds in best.items():
+                if only in name:
+                    results[f'{name}[{param}]'] = round(seconds * 1e9, 1)
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Return the cases that are more than threshold percent slower than their baseline.
+
+    Args: results, baseline (both 'name[param]' to ns per call), threshold (percent)
+    Returns: list of (case, baseline ns, current ns, change in percent)
+    """
+
+    regressions = []
+    for case, current in results.items():
+        before = baseline.get(case)
+        if before:
+            change = 100 * (current - before) / before
+            if change > threshold:
+                regressions.append((case, before, current, change))
+    return regressions
+
+
+def main(argv=None) -> int:
+    """
+    Run the suite, print and save the results, and check them against a baseline.
+
+    Args: argv (default: the command line)
+    Returns: int (exit status: 1 if any case regressed; argument errors exit with 2)
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmark the hot paths of the three games.')
+    parser.add_argument('--output', metavar='FILE', help='write the results as JSON')
+    parser.add_argument('--baseline', metavar='FILE', help='compare against the results in this JSON file')
+    parser.add_argument('--save-baseline', action='store_true', help='write the results to the baseline file instead')
+    parser.add_argument('--threshold', type=float, default=20.0, help='percent slowdown that fails the run (default 20)')
+    parser.add_argument('--rounds', type=int, default=5, help='timed rounds per case; the fastest counts (default 5)')
+    parser.add_argument('--scale', type=float, default=1.0, help='multiply the calls per round, e.g. 0.1 for a quick run')
+    parser.add_argument('--only', default='', help='report only the cases whose name contains this, e.g. a3.')
+    args = parser.parse_args(argv)
+    if args.save_baseline and not args.baseline:
+        parser.error('--save-baseline needs --baseline FILE')
+
+    # Read the baseline before the run, so a missing or broken file fails at once instead of passing.
+    baseline = {}
+    if args.baseline and not args.save_baseline:
+        try:
+            with open(args.baseline) as baseline_file:
+                baseline = json.load(baseline_file)
+        except (OSError, ValueError) as error:
+            parser.error(f'cannot read baseline {args.baseline}: {error}')
+        if not isinstance(baseline, dict):
+            parser.error(f'baseline {args.baseline} is not a JSON object of results')
+
+    results = run_suite(args.rounds, args.scale, args.only)
+    for case, current in results.items():
+        before = baseline.get(case)
+        change = f'{100 * (current - before) / before:+7.1f}%' if before else ''
+        print(f'{case:<28}{current / 1000:12.2f} us {change}')
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2, sort_keys=True)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for case, before, current, change in regressions:
+        print(f'REGRESSION {case}: {before / 1000:.2f} us -> {current / 1000:.2f} us ({change:+.1f}%)')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
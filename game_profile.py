@@ -0,0 +1,223 @@
+"""Per-tick profiling for the turtle games.
+
+A Profiler keeps one latency histogram per subsystem (movement, collision,
+food, render, screen update, ...). Functions are timed by wrapping them, so
+a game only pays for profiling when it is switched on. Time is charged to
+the innermost timed call: if snake_move calls eat_food, the time spent in
+eat_food counts as food, not as movement.
+
+A Profiler also checks how regularly a task runs: interval(name, period_ms)
+records the wall-clock time since the task last started, next to the period
+it was then scheduled with. The game loop reports every task it runs.
+
+Histograms use fixed 1-2-5 buckets from 1 microsecond to 1 second, so
+recording is O(1) and a long session takes constant memory. Percentiles are
+read off the bucket bounds.
+"""
+
+import bisect
+import json
+import time
+
+# Upper bounds of the histogram buckets in seconds; the last bucket is open-ended.
+BUCKET_BOUNDS = tuple(mantissa * 10 ** exponent / 1e6 for exponent in range(6) for mantissa in (1, 2, 5)) + (1.0,)
+
+
+class LatencyHistogram:
+    """
+    Counts durations in fixed 1-2-5 buckets and keeps their count, total and maximum.
+    """
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """
+        Add one duration.
+
+        Args: seconds
+        Returns: None
+        """
+
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Return the upper bound of the bucket holding the given fraction of durations.
+        Durations beyond the last bound report the maximum.
+
+        Args: fraction (0..1)
+        Returns: float (seconds)
+        """
+
+        if not self.count:
+            return 0.0
+        wanted = fraction * self.count
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS, self.buckets):
+            seen += count
+            if seen >= wanted:
+                return min(bound, self.max)
+        return self.max
+
+    def mean(self) -> float:
+        """
+        Return the mean duration.
+
+        Args: None
+        Returns: float (seconds)
+        """
+
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict:
+        """
+        Return the histogram as plain data in milliseconds, for JSON.
+
+        Args: None
+        Returns: dict
+        """
+
+        return {'count': self.count,
+                'mean_ms': 1000 * self.mean(),
+                'p50_ms': 1000 * self.percentile(0.5),
+                'p99_ms': 1000 * self.percentile(0.99),
+                'max_ms': 1000 * self.max,
+                'buckets_ms': {f'{1000 * bound:g}': count
+                               for bound, count in zip(BUCKET_BOUNDS + (float('inf'),), self.buckets) if count}}
+
+
+class Profiler:
+    """
+    Latency histograms per subsystem, plus the actual versus expected interval of timed tasks.
+    """
+
+    def __init__(self):
+        self.latency = {}
+        self.intervals = {}
+        self.expected = {}
+        self._last_run = {}
+        self._stack = []
+        self.started = time.perf_counter()
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """
+        Return the latency histogram of a subsystem, creating it on first use.
+
+        Args: name
+        Returns: LatencyHistogram
+        """
+
+        if name not in self.latency:
+            self.latency[name] = LatencyHistogram()
+        return self.latency[name]
+
+    def begin(self, name: str) -> None:
+        """
+        Start timing a call charged to the given subsystem. Calls to begin and end must nest.
+
+        Args: name
+        Returns: None
+        """
+
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def end(self) -> None:
+        """
+        Stop timing the innermost call and charge its time, less that of nested calls.
+
+        Args: None
+        Returns: None
+        """
+
+        name, started, nested = self._stack.pop()
+        elapsed = time.perf_counter() - started
+        self.histogram(name).record(elapsed - nested)
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    def wrap(self, name: str, function):
+        """
+        Return a function that runs the given one, timed as the given subsystem.
+
+        Args: name, function
+        Returns: function
+        """
+
+        def timed(*args, **kwargs):
+            self.begin(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.end()
+
+        timed.__name__ = function.__name__
+        timed.__doc__ = function.__doc__
+        return timed
+
+    def interval(self, name: str, period_ms: float, started=None) -> None:
+        """
+        Record that a task started at `started` (default: now) and is meant to start again
+        period_ms later, and check its previous period against the time actually taken.
+
+        Args: name, period_ms, started (time.perf_counter() value)
+        Returns: None
+        """
+
+        now = time.perf_counter() if started is None else started
+        last = self._last_run.get(name)
+        self._last_run[name] = (now, period_ms)
+        if last is None:
+            return
+        if name not in self.intervals:
+            self.intervals[name] = LatencyHistogram()
+            self.expected[name] = 0.0
+        self.intervals[name].record(now - last[0])
+        self.expected[name] += last[1]
+
+    def summary_lines(self) -> list:
+        """
+        Return one line of text per subsystem and per timed task, for an on-screen overlay.
+
+        Args: None
+        Returns: list of str
+        """
+
+        lines = [f'{"latency":<24}{"p50":>7}{"p99":>7}{"max":>8}']
+        lines += [f'{name:<24}{1000 * h.percentile(0.5):7.2f}{1000 * h.percentile(0.99):7.2f}{1000 * h.max:8.2f} ms'
+                  for name, h in self.latency.items()]
+        lines.append(f'{"interval":<24}{"mean":>7}{"want":>7}{"max":>8}')
+        lines += [f'{name:<24}{1000 * h.mean():7.0f}{self.expected[name] / h.count:7.0f}{1000 * h.max:8.0f} ms'
+                  for name, h in self.intervals.items()]
+        return lines
+
+    def to_dict(self) -> dict:
+        """
+        Return every histogram as plain data, for JSON.
+
+        Args: None
+        Returns: dict
+        """
+
+        return {'seconds': time.perf_counter() - self.started,
+                'latency': {name: h.to_dict() for name, h in self.latency.items()},
+                'intervals': {name: dict(h.to_dict(), expected_mean_ms=self.expected[name] / h.count)
+                              for name, h in self.intervals.items()}}
+
+    def dump(self, path: str) -> None:
+        """
+        Write the statistics to a JSON file.
+
+        Args: path
+        Returns: None
+        """
+
+        with open(path, 'w') as stats_file:
+            json.dump(self.to_dict(), stats_file, indent=2)
@@ -0,0 +1,641 @@
+"""Auto-solver for the N x N sliding-puzzle boards used by Assignment2-2024.py.
+
+Boards are numpy arrays (or nested lists) with 0 for the blank and the goal
+1, 2, ..., N*N-1 followed by the blank. Solutions are returned as the list of
+(row, col) tile positions to slide into the blank, in order.
+
+- 3x3 boards use the optimal solver in puzzle_solver.
+- 4x4 boards use IDA* over additive disjoint pattern databases (6-6-3). The
+  heuristic is the larger of the database sum for the board and for its mirror
+  image in the main diagonal. Each database is built once by a retrograde
+  breadth-first search, saved as a uint8 .npy file and memory-mapped on later
+  runs. The build takes a few minutes, so run it ahead of time with
+  `python puzzle_autosolve.py --build`; the GUI starts it in a separate
+  process when the game opens. A search only waits for a build when called
+  with build=True, and a build checks the cancel event before every chunk
+  of states it expands.
+- Larger boards, and 4x4 searches that exceed their node budget, fall back to a
+  row-and-column reduction that places tiles one line at a time and finishes the
+  last 3x3 block optimally. It is not optimal but never stalls. find_solution
+  says whether the solution it returns is optimal.
+
+On uniform random 4x4 boards the median search takes about 0.1 s and three in
+four finish within 0.5 s. About one board in a hundred uses the whole budget of
+MAX_NODES (about 4 s) and falls back. solve_tiles is therefore not meant for
+the Tk thread; Assignment2-2024.py runs it through puzzle_worker.
+
+Solutions go through the persistent cache in solution_cache, so asking again
+for a board, or for its mirror image, costs a lookup instead of a search.
+"""
+
+import argparse
+import os
+import sys
+import threading
+from collections import deque
+
+import numpy as np
+
+from board_gen import is_solvable
+from puzzle_solver import solve_packed
+from solution_cache import get_cache
+
+PDB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pdb_cache')
+PDB_GROUPS = {4: ((1, 5, 6, 9, 10, 13), (7, 8, 11, 12, 14, 15), (2, 3, 4))}
+MAX_NODES = 2_000_000  # About 4 s of pure Python; the GUI searches in a background thread
+BUILD_CHUNK = 1 << 18  # States expanded at a time while building, which bounds the build's memory
+UNSEEN = 255
+_pdb_cache = {}
+_pdb_lock = threading.Lock()  # One thread at a time loads or builds databases
+
+
+class SolveCancelled(Exception):
+    """Raised by solve_tiles when its cancel event is set during a search or a database build."""
+
+
+def _neighbours(size: int) -> list[tuple[int, ...]]:
+    """
+    Return, for every cell of a size x size board, the cells next to it.
+
+    Parameters:
+    size (int): The width of the board.
+
+    Returns:
+    list[tuple[int, ...]]: The neighbouring cells of each cell.
+    """
+    result = []
+    for cell in range(size * size):
+        row, col = divmod(cell, size)
+        options = []
+        if row > 0:
+            options.append(cell - size)
+        if row < size - 1:
+            options.append(cell + size)
+        if col > 0:
+            options.append(cell - 1)
+        if col < size - 1:
+            options.append(cell + 1)
+        result.append(tuple(options))
+    return result
+
+
+def build_pattern_database(size: int, pattern: tuple[int, ...], cancel=None) -> np.ndarray:
+    """
+    Builds an additive pattern database by retrograde breadth-first search.
+
+    States are the cells of the pattern tiles plus the blank, one base-(size*size)
+    digit each. Only moves of pattern tiles cost 1, so the databases of disjoint
+    patterns can be added. The stored table keeps the minimum over blank cells.
+
+    Parameters:
+    size (int): The width of the board.
+    pattern (tuple[int, ...]): The tiles tracked by this database.
+    cancel (threading.Event | None): Give up (raise SolveCancelled) soon after it is set.
+
+    Returns:
+    np.ndarray: A uint8 array indexed by sum(cell(tile_j) * cells**j).
+    """
+    cells = size * size
+    k = len(pattern)
+    blank_weight = cells ** k
+    weights = cells ** np.arange(k, dtype=np.int64)
+    dist = np.full(cells ** (k + 1), UNSEEN, dtype=np.uint8)
+    goal = sum((tile - 1) * cells ** j for j, tile in enumerate(pattern)) + (cells - 1) * blank_weight
+    dist[goal] = 0
+    frontier = np.array([goal], dtype=np.int64)
+    depth = 0
+    while frontier.size:
+        # Close the level under free blank moves, then step once with a pattern tile.
+        level = [frontier]
+        current = frontier
+        while current.size:
+            current = _unseen_successors(current, size, weights, blank_weight, dist, False, cancel)
+            dist[current] = depth
+            level.append(current)
+        frontier = _unseen_successors(np.concatenate(level), size, weights, blank_weight, dist, True, cancel)
+        depth += 1
+        dist[frontier] = depth
+    return dist.reshape(cells, blank_weight).min(axis=0)
+
+
+def _unseen_successors(states: np.ndarray, size: int, weights: np.ndarray, blank_weight: int,
+                       dist: np.ndarray, tile_moves: bool, cancel=None) -> np.ndarray:
+    """
+    Returns the distinct successors of a batch of states that have no distance yet.
+
+    States are expanded BUILD_CHUNK at a time and filtered before they are
+    collected, so a level of millions of states never needs all its successors
+    in memory at once.
+
+    Parameters:
+    states (np.ndarray): Encoded states.
+    size (int): The width of the board.
+    weights (np.ndarray): Digit weights of the pattern tiles.
+    blank_weight (int): Digit weight of the blank.
+    dist (np.ndarray): Distances found so far, UNSEEN for none.
+    tile_moves (bool): Follow the moves of pattern tiles (True) or the free blank moves (False).
+    cancel (threading.Event | None): Give up (raise SolveCancelled) before the next chunk once it is set.
+
+    Returns:
+    np.ndarray: The sorted, distinct unseen successors.
+    """
+    found = [np.empty(0, dtype=np.int64)]
+    for start in range(0, states.size, BUILD_CHUNK):
+        if cancel is not None and cancel.is_set():
+            raise SolveCancelled
+        for tile_hit, successors in _expand(states[start:start + BUILD_CHUNK], size, weights, blank_weight):
+            successors = successors[tile_hit] if tile_moves else successors[~tile_hit]
+            found.append(successors[dist[successors] == UNSEEN])
+    return np.unique(np.concatenate(found))
+
+
+def _expand(states: np.ndarray, size: int, weights: np.ndarray, blank_weight: int):
+    """
+    Yields the successors of a batch of pattern-database states, one blank direction at a time.
+
+    Parameters:
+    states (np.ndarray): Encoded states.
+    size (int): The width of the board.
+    weights (np.ndarray): Digit weights of the pattern tiles.
+    blank_weight (int): Digit weight of the blank.
+
+    Returns:
+    Iterator of (tile_hit, successors): whether the blank swapped with a pattern
+    tile, and the encoded successor states.
+    """
+    cells = size * size
+    blank = states // blank_weight
+    digits = (states[:, None] // weights[None, :]) % cells
+    rows, cols = blank // size, blank % size
+    for delta, mask in ((-size, rows > 0), (size, rows < size - 1), (-1, cols > 0), (1, cols < size - 1)):
+        source, source_blank = states[mask], blank[mask]
+        target = source_blank + delta
+        hits = digits[mask] == target[:, None]
+        moved = (hits * weights[None, :]).sum(axis=1) * (source_blank - target)
+        yield hits.any(axis=1), source + delta * blank_weight + moved
+
+
+def load_pattern_database(size: int, pattern: tuple[int, ...], build: bool = True, cancel=None) -> memoryview | None:
+    """
+    Returns a pattern database, building and saving it on first use if allowed.
+
+    The .npy file is opened with np.load(mmap_mode='r'), so later sessions only
+    page in the entries the search touches. Loading and building hold a module
+    lock, so two threads never build the same database at once. Each process
+    saves through its own temporary file and renames it into place.
+
+    Parameters:
+    size (int): The width of the board.
+    pattern (tuple[int, ...]): The tiles tracked by this database.
+    build (bool): Build the database if it is not on disk; otherwise return None.
+    cancel (threading.Event | None): Give up (raise SolveCancelled) soon after it is set,
+        while waiting for the lock or building.
+
+    Returns:
+    memoryview | None: The database as a flat read-only view of uint8 values.
+    """
+    key = (size, pattern)
+    if key in _pdb_cache:
+        return _pdb_cache[key]
+    while not _pdb_lock.acquire(timeout=0.05):
+        if cancel is not None and cancel.is_set():
+            raise SolveCancelled
+    try:
+        if key in _pdb_cache:
+            return _pdb_cache[key]  # Another thread loaded it while this one waited
+        path = _pdb_path(size, pattern)
+        try:
+            table = np.load(path, mmap_mode='r')
+        except (OSError, ValueError):
+            if not build:
+                return None
+            table = build_pattern_database(size, pattern, cancel)
+            temp_path = f'{path[:-len(".npy")]}.{os.getpid()}.tmp.npy'
+            try:
+                os.makedirs(PDB_DIR, exist_ok=True)
+                np.save(temp_path, table)
+                os.replace(temp_path, path)
+                table = np.load(path, mmap_mode='r')
+            except OSError:
+                pass  # Keep the in-memory table when the cache directory is read-only.
+        _pdb_cache[key] = memoryview(table)
+        return _pdb_cache[key]
+    finally:
+        _pdb_lock.release()
+
+
+def _pdb_path(size: int, pattern: tuple[int, ...]) -> str:
+    return os.path.join(PDB_DIR, f"pdb_{size}x{size}_{'-'.join(map(str, pattern))}.npy")
+
+
+def pattern_databases(size: int, build: bool = True, cancel=None) -> list[memoryview] | None:
+    """
+    Returns the pattern databases of a board size, or None if any is missing and may not be built.
+
+    Parameters:
+    size (int): The width of the board.
+    build (bool): Build the missing databases, which takes minutes.
+    cancel (threading.Event | None): Give up (raise SolveCancelled) soon after it is set.
+
+    Returns:
+    list[memoryview] | None: One table per group of PDB_GROUPS[size].
+    """
+    tables = [load_pattern_database(size, pattern, build, cancel) for pattern in PDB_GROUPS[size]]
+    return None if None in tables else tables
+
+
+def databases_on_disk(size: int) -> bool:
+    """
+    Checks whether every pattern database of a board size has been built and saved.
+
+    Parameters:
+    size (int): The width of the board.
+
+    Returns:
+    bool: True if a search can start without building anything.
+    """
+    return all(os.path.exists(_pdb_path(size, pattern)) for pattern in PDB_GROUPS.get(size, ()))
+
+
+def build_pattern_databases(size: int = 4) -> None:
+    """
+    Builds and saves every pattern database of a board size that is not on disk yet.
+
+    Parameters:
+    size (int): The width of the board.
+
+    Returns:
+    None
+    """
+    if size in PDB_GROUPS:
+        pattern_databases(size)
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+def _pdb_ida_star(board: list[int], size: int, tables: list[memoryview], max_nodes: int, cancel=None) -> list[int]:
+    """
+    Solves a board optimally with IDA* over the additive pattern databases.
+
+    The board's mirror image in the main diagonal, with every tile renamed after
+    the goal cell it lands on, needs as many moves as the board itself. Its
+    database sum is kept up to date alongside the board's, and the search uses
+    the larger of the two.
+
+    Parameters:
+    board (list[int]): The tiles in row-major order, 0 for the blank.
+    size (int): The width of the board.
+    tables (list[memoryview]): The pattern databases of PDB_GROUPS[size].
+    max_nodes (int): Give up (raise _BudgetExceeded) after this many expansions.
+    cancel (threading.Event | None): Give up (raise SolveCancelled) soon after it is set.
+
+    Returns:
+    list[int]: The cells of the tiles to slide, in order.
+    """
+    cells = size * size
+    groups = PDB_GROUPS[size]
+    group_of = [0] * cells
+    weight_of = [0] * cells
+    for g, pattern in enumerate(groups):
+        for j, tile in enumerate(pattern):
+            group_of[tile] = g
+            weight_of[tile] = cells ** j
+    # mirror_cell[c] is the cell c lands on in the mirror image; mirror_tile[t] is the name tile t takes there.
+    mirror_cell = [(cell % size) * size + cell // size for cell in range(cells)]
+    mirror_tile = [0] + [mirror_cell[tile - 1] + 1 for tile in range(1, cells)]
+    indexes = [0] * len(groups)
+    mirror_indexes = [0] * len(groups)
+    for cell, tile in enumerate(board):
+        if tile:
+            indexes[group_of[tile]] += cell * weight_of[tile]
+            mirror = mirror_tile[tile]
+            mirror_indexes[group_of[mirror]] += mirror_cell[cell] * weight_of[mirror]
+    board = list(board)
+    neighbours = _neighbours(size)
+    path = []
+    nodes = 0
+
+    def search(blank: int, g: int, h: int, mirror_h: int, bound: int, previous: int) -> int:
+        nonlocal nodes
+        nodes += 1
+        if nodes > max_nodes:
+            raise _BudgetExceeded
+        if cancel is not None and not nodes & 1023 and cancel.is_set():
+            raise SolveCancelled
+        if h == 0:
+            return -1
+        smallest = 1 << 30
+        for cell in neighbours[blank]:
+            if cell == previous:
+                continue
+            tile = board[cell]
+            group = group_of[tile]
+            table = tables[group]
+            old = indexes[group]
+            new = old + (blank - cell) * weight_of[tile]
+            child_h = h - table[old] + table[new]
+            mirror = mirror_tile[tile]
+            mirror_group = group_of[mirror]
+            mirror_table = tables[mirror_group]
+            mirror_old = mirror_indexes[mirror_group]
+            mirror_new = mirror_old + (mirror_cell[blank] - mirror_cell[cell]) * weight_of[mirror]
+            child_mirror_h = mirror_h - mirror_table[mirror_old] + mirror_table[mirror_new]
+            f = g + 1 + (child_h if child_h > child_mirror_h else child_mirror_h)
+            if f > bound:
+                smallest = min(smallest, f)
+                continue
+            board[blank], board[cell] = tile, 0
+            indexes[group] = new
+            mirror_indexes[mirror_group] = mirror_new
+            path.append(cell)
+            result = search(cell, g + 1, child_h, child_mirror_h, bound, blank)
+            if result < 0:
+                return result
+            path.pop()
+            mirror_indexes[mirror_group] = mirror_old
+            indexes[group] = old
+            board[blank], board[cell] = 0, tile
+            smallest = min(smallest, result)
+        return smallest
+
+    h = sum(table[index] for table, index in zip(tables, indexes))
+    mirror_h = sum(table[index] for table, index in zip(tables, mirror_indexes))
+    bound = max(h, mirror_h)
+    blank = board.index(0)
+    while True:
+        result = search(blank, 0, h, mirror_h, bound, -1)
+        if result < 0:
+            return path
+        bound = result
+
+
+def _reduction_solve(board: list[int], size: int) -> list[int]:
+    """
+    Solves a board of any size >= 3 by reducing it one row and one column at a time.
+
+    Tiles are steered into place with short breadth-first searches while solved
+    cells stay locked. The last two tiles of each line are finished together
+    inside a 3x2 window, and the final 3x3 block is solved optimally.
+
+    Parameters:
+    board (list[int]): The tiles in row-major order, 0 for the blank.
+    size (int): The width of the board.
+
+    Returns:
+    list[int]: The cells of the tiles to slide, in order.
+    """
+    board = list(board)
+    where = [0] * (size * size)
+    for cell, tile in enumerate(board):
+        where[tile] = cell
+    neighbours = _neighbours(size)
+    locked = bytearray(size * size)
+    moves = []
+
+    def slide(cell: int) -> None:
+        blank = where[0]
+        tile = board[cell]
+        board[blank], board[cell] = tile, 0
+        where[tile], where[0] = blank, cell
+        moves.append(cell)
+
+    def cell_path(start: int, goals: set[int], blocked: int = -1) -> list[int] | None:
+        if start in goals:
+            return []
+        parent = {start: start}
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            for nxt in neighbours[cell]:
+                if nxt in parent or locked[nxt] or nxt == blocked:
+                    continue
+                parent[nxt] = cell
+                if nxt in goals:
+                    path = [nxt]
+                    while parent[path[-1]] != start:
+                        path.append(parent[path[-1]])
+                    return path[::-1]
+                queue.append(nxt)
+        return None
+
+    def joint_path(tile_cell: int, goals: set[int]) -> list[int]:
+        # Breadth-first search over (tile, blank) pairs, used when the greedy route is blocked.
+        start = (tile_cell, where[0])
+        parent = {start: None}
+        queue = deque([start])
+        while queue:
+            state = queue.popleft()
+            tile_at, blank = state
+            if tile_at in goals:
+                path = []
+                while parent[state] is not None:
+                    state, cell = parent[state]
+                    path.append(cell)
+                return path[::-1]
+            for nxt in neighbours[blank]:
+                if locked[nxt]:
+                    continue
+                child = (blank, nxt) if nxt == tile_at else (tile_at, nxt)
+                if child not in parent:
+                    parent[child] = (state, nxt)
+                    queue.append(child)
+        raise RuntimeError("Tile cannot reach its target cell.")
+
+    def place(tile: int, goals: set[int]) -> None:
+        while where[tile] not in goals:
+            route = cell_path(where[tile], goals)
+            blank_route = cell_path(where[0], {route[0]}, where[tile])
+            if blank_route is None:
+                for cell in joint_path(where[tile], goals):
+                    slide(cell)
+                return
+            for cell in blank_route:
+                slide(cell)
+            slide(where[tile])
+
+    def window_finish(targets: list[tuple[int, int]], window: list[int]) -> None:
+        # Breadth-first search over the cells of two tiles and the blank inside a small area.
+        (tile_a, goal_a), (tile_b, goal_b) = targets
+        inside = set(window)
+        start = (where[tile_a], where[tile_b], where[0])
+        parent = {start: None}
+        queue = deque([start])
+        while queue:
+            state = queue.popleft()
+            a, b, blank = state
+            if a == goal_a and b == goal_b:
+                path = []
+                while parent[state] is not None:
+                    state, cell = parent[state]
+                    path.append(cell)
+                for cell in reversed(path):
+                    slide(cell)
+                return
+            for nxt in neighbours[blank]:
+                if nxt not in inside:
+                    continue
+                child = (blank if nxt == a else a, blank if nxt == b else b, nxt)
+                if child not in parent:
+                    parent[child] = (state, nxt)
+                    queue.append(child)
+        raise RuntimeError("Window cannot be finished.")
+
+    def finish_line(line: int, first: int, cell_at) -> None:
+        # cell_at(r, c) addresses the board directly for rows and through a transpose for columns.
+        for offset in range(first, size - 2):
+            goal = cell_at(line, offset)
+            place(goal + 1, {goal})
+            locked[goal] = 1
+        p, q = cell_at(line, size - 2), cell_at(line, size - 1)
+        if board[p] != p + 1 or board[q] != q + 1:
+            # Bring both tiles into a 3x2 window at the end of the line, then finish them together.
+            window = [cell_at(line + r, size - 2 + c) for r in range(3) for c in range(2)]
+            parked = cell_at(line + 1, size - 2)
+            place(p + 1, {parked})
+            locked[parked] = 1
+            try:
+                place(q + 1, set(window) - {parked})
+                route = cell_path(where[0], set(window), where[q + 1])
+                if route is None:
+                    raise RuntimeError("Blank cannot enter the window.")
+                for cell in route:
+                    slide(cell)
+                region = window
+            except RuntimeError:
+                # Parking can wall the second tile into a corner of a 4x4 remainder;
+                # search the whole (small) unlocked area instead.
+                region = None
+            locked[parked] = 0
+            if region is None:
+                region = [cell for cell in range(size * size) if not locked[cell]]
+            window_finish([(p + 1, p), (q + 1, q)], region)
+        locked[p] = locked[q] = 1
+
+    for line in range(size - 3):
+        finish_line(line, line, lambda r, c: r * size + c)
+        finish_line(line, line + 1, lambda r, c: c * size + r)
+
+    # Relabel the remaining 3x3 block and finish it optimally.
+    corner = size - 3
+    block = [(corner + r) * size + corner + c for r in range(3) for c in range(3)]
+    packed = 0
+    for local, cell in enumerate(block):
+        tile = board[cell]
+        if tile:
+            row, col = divmod(tile - 1, size)
+            packed |= ((row - corner) * 3 + col - corner + 1) << (4 * local)
+    local_blank = block.index(where[0])
+    blank_step = {'left': 1, 'right': -1, 'up': 3, 'down': -3}
+    for move in solve_packed(packed)[0]:
+        local_blank += blank_step[move]
+        slide(block[local_blank])
+    return moves
+
+
+def find_solution(tiles, max_nodes: int = MAX_NODES, use_cache: bool = True, cancel=None,
+                  build: bool = True) -> tuple[list[tuple[int, int]], bool]:
+    """
+    Finds a sequence of tile slides that solves the given board, and says whether it is optimal.
+
+    3x3 and 4x4 boards are solved optimally (4x4 falls back to the reduction
+    solver when IDA* would exceed max_nodes, or when its databases are not built
+    and build is False); larger boards use the reduction. Cached optimal solutions are returned without searching. A cached solution
+    that is not optimal is only returned if a new 4x4 search does no better.
+    New solutions are cached.
+
+    Parameters:
+    tiles: A square numpy array or nested list with 0 for the blank.
+    max_nodes (int): Node budget for the 4x4 pattern-database search.
+    use_cache (bool): Look up and store the solution in the persistent cache.
+    cancel (threading.Event | None): Stop searching (raise SolveCancelled) once it is set,
+        so a solve running in another thread can be abandoned.
+    build (bool): Build missing 4x4 pattern databases first, which takes minutes.
+
+    Returns:
+    tuple[list[tuple[int, int]], bool]: The (row, col) of each tile to slide into the blank,
+    and whether no shorter solution exists.
+    """
+    tiles = np.asarray(tiles)
+    size = tiles.shape[0]
+    board = [int(tile) for tile in tiles.ravel()]
+    if not is_solvable(board, size):
+        raise ValueError("The puzzle is not solvable.")
+    cache = get_cache() if use_cache else None
+    cached = cache.lookup(board) if cache else None
+    if cached is not None and (cached[1] or size not in PDB_GROUPS):
+        return _to_positions(cached[0], size), cached[1]
+    cells = None
+    optimal = size == 3  # The reduction finishes a 3x3 board with the optimal solver
+    tables = pattern_databases(size, build, cancel) if size in PDB_GROUPS else None
+    if tables is not None:
+        try:
+            cells = _pdb_ida_star(board, size, tables, max_nodes, cancel)
+            optimal = True
+        except _BudgetExceeded:
+            pass
+    if cells is None and cached is not None:
+        return _to_positions(cached[0], size), False
+    if cells is None:
+        cells = _reduction_solve(board, size)
+    if cancel is not None and cancel.is_set():
+        raise SolveCancelled
+    if cache:
+        cache.put(board, cells, optimal)
+    return _to_positions(cells, size), optimal
+
+
+def solve_tiles(tiles, max_nodes: int = MAX_NODES, use_cache: bool = True, cancel=None) -> list[tuple[int, int]]:
+    """
+    Finds a sequence of tile slides that solves the given board; see find_solution.
+
+    Parameters:
+    tiles: A square numpy array or nested list with 0 for the blank.
+    max_nodes (int): Node budget for the 4x4 pattern-database search.
+    use_cache (bool): Look up and store the solution in the persistent cache.
+    cancel (threading.Event | None): Stop searching (raise SolveCancelled) once it is set.
+
+    Returns:
+    list[tuple[int, int]]: The (row, col) of each tile to slide into the blank.
+    """
+    return find_solution(tiles, max_nodes, use_cache, cancel)[0]
+
+
+def _to_positions(cells: list[int], size: int) -> list[tuple[int, int]]:
+    """
+    Converts flat cell indexes into (row, col) positions.
+
+    Parameters:
+    cells (list[int]): Flat cell indexes.
+    size (int): The width of the board.
+
+    Returns:
+    list[tuple[int, int]]: The matching (row, col) positions.
+    """
+    return [divmod(cell, size) for cell in cells]
+
+
+def main(argv=None) -> int:
+    """
+    Builds the pattern databases ahead of time, so the first 4x4 auto-solve does not wait for them.
+
+    Parameters:
+    argv (list[str] | None): The arguments, or None for the command line.
+
+    Returns:
+    int: The exit status.
+    """
+    parser = argparse.ArgumentParser(description='Sliding-puzzle auto-solver.')
+    parser.add_argument('--build', action='store_true', help=f'build the pattern databases in {PDB_DIR}')
+    args = parser.parse_args(argv)
+    if not args.build:
+        parser.print_help()
+        return 0
+    for size in PDB_GROUPS:
+        build_pattern_databases(size)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
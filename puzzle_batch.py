@@ -0,0 +1,164 @@
+"""Batch solving of 8-tile puzzle boards across processes.
+
+Boards are read one per line, in row-major order, either as nine tiles
+separated by spaces or commas ("1 2 3 4 5 6 7 _ 8") or as nine characters
+("123456708"). The blank may be written 0, _ or a dot. Blank lines and lines
+starting with # are skipped.
+
+Lines are sent to a ProcessPoolExecutor in chunks. Each worker keeps its own
+bounded cache of the boards it has solved most recently, so repeated positions
+cost nothing. Only a bounded window of chunks is in flight at a time, and
+results are written in input order as each chunk comes in, one JSON object per
+line:
+
+    {"line": 3, "board": "123456708", "length": 1, "moves": "a", "nodes": 2}
+
+Lines that are not a solvable board give {"line": ..., "board": ..., "error": ...}.
+"""
+
+import json
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from puzzle_solver import CELLS, MOVE_NAMES, pack_board, solve_packed
+
+CHUNK_SIZE = 32
+SOLVED_CACHE_SIZE = 1 << 16  # Boards each worker remembers; about 30 MB at most
+_BLANKS = {'0', '_', '.'}
+
+
+def parse_board(text: str) -> list[int, str]:
+    """
+    Parse one line into a chessboard list (numbers 1-8 and ' ').
+
+    Raises ValueError unless the line holds each of 1-8 and one blank exactly once.
+
+    Args: str
+    Returns: list[int, str]
+    """
+
+    text = text.strip()
+    tokens = re.split(r'[\s,]+', text) if re.search(r'[\s,]', text) else list(text)
+    if len(tokens) != CELLS:
+        raise ValueError(f"Expected {CELLS} tiles, got {len(tokens)}.")
+    if not all(token in _BLANKS or token.isdigit() for token in tokens):
+        raise ValueError("Tiles must be numbers, with 0, _ or . for the blank.")
+    chessboard = [' ' if token in _BLANKS else int(token) for token in tokens]
+    if sorted(tile for tile in chessboard if tile != ' ') != list(range(1, CELLS)):
+        raise ValueError("A board needs the tiles 1-8 and one blank, each exactly once.")
+    return chessboard
+
+
+@lru_cache(maxsize=SOLVED_CACHE_SIZE)
+def _solve(packed: int) -> tuple[list[str], int]:
+    # Worker-local cache of solve_packed; unsolvable boards raise and are not cached.
+    return solve_packed(packed)
+
+
+def _init_worker() -> None:
+    # A forked worker starts with a copy of the parent's cache; start each run empty.
+    _solve.cache_clear()
+
+
+def solve_line(number: int, text: str, letters: tuple[str, str, str, str]) -> dict:
+    """
+    Solve the board on one input line and describe the result as a JSON-ready dict.
+
+    Args: int (line number), str (line), tuple[str, str, str, str] (letters for left, right, up, down)
+    Returns: dict
+    """
+
+    board = text.strip()
+    try:
+        moves, nodes = _solve(pack_board(parse_board(text)))
+    except ValueError as error:
+        return {'line': number, 'board': board, 'error': str(error)}
+    return {'line': number, 'board': board, 'length': len(moves),
+            'moves': ''.join(letters[MOVE_NAMES.index(move)] for move in moves), 'nodes': nodes}
+
+
+def solve_chunk(chunk: list[tuple[int, str]], letters: tuple[str, str, str, str]) -> list[dict]:
+    """
+    Solve a chunk of numbered lines in order.
+
+    Args: list[tuple[int, str]], tuple[str, str, str, str]
+    Returns: list[dict]
+    """
+
+    return [solve_line(number, text, letters) for number, text in chunk]
+
+
+def _chunks(lines, size: int):
+    chunk = []
+    for number, text in enumerate(lines, start=1):
+        if not text.strip() or text.lstrip().startswith('#'):
+            continue
+        chunk.append((number, text))
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def solve_chunks(lines, letters: tuple[str, str, str, str], workers: int | None = None,
+                 chunk_size: int = CHUNK_SIZE):
+    """
+    Solve the boards on the given lines and yield the results one chunk at a time, in input order.
+
+    With one worker everything runs in this process; otherwise a pool of processes
+    solves up to four chunks per worker at a time while earlier results are yielded.
+
+    Args: iterable of str, tuple[str, str, str, str], int | None (default: one per CPU), int
+    Returns: iterator of list[dict]
+    """
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker()
+        for chunk in _chunks(lines, chunk_size):
+            yield solve_chunk(chunk, letters)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        pending = deque()
+        for chunk in _chunks(lines, chunk_size):
+            pending.append(pool.submit(solve_chunk, chunk, letters))
+            if len(pending) >= 4 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def solve_stream(lines, letters: tuple[str, str, str, str], workers: int | None = None, chunk_size: int = CHUNK_SIZE):
+    """
+    Solve the boards on the given lines and yield the result of each, in input order.
+
+    Args: iterable of str, tuple[str, str, str, str], int | None (default: one per CPU), int
+    Returns: iterator of dict
+    """
+
+    for results in solve_chunks(lines, letters, workers, chunk_size):
+        yield from results
+
+
+def run_batch(lines, letters: tuple[str, str, str, str], output, workers: int | None = None) -> int:
+    """
+    Solve every board on the given lines and write one JSON object per board to output.
+
+    Output is flushed once per chunk, so results show up as they are solved without
+    a system call per line.
+
+    Args: iterable of str, tuple[str, str, str, str], writable text file, int | None
+    Returns: int (the number of lines that were not solvable boards)
+    """
+
+    failures = 0
+    for results in solve_chunks(lines, letters, workers):
+        failures += sum('error' in result for result in results)
+        output.write(''.join(json.dumps(result) + '\n' for result in results))
+        output.flush()
+    return failures
@@ -0,0 +1,149 @@
+"""Headless, vectorised simulator for batches of sliding-puzzle boards.
+
+This is the game logic of Assignment2-2024.py (execute_move, shuffle_puzzle,
+check_ifsolved) without turtle. N boards live in one (N, size, size) integer
+array, 0 marks the blank, and every call advances all of them at once.
+"""
+
+import numpy as np
+
+# (x_dir, y_dir) pairs in the same order as generate_move in Assignment2-2024.py.
+DIRECTIONS = np.array([(-1, 0), (1, 0), (0, -1), (0, 1)], dtype=np.int64)
+
+
+def tile_dtype(size: int) -> np.dtype:
+    """
+    Returns the smallest integer dtype that can hold every tile of a size x size board.
+
+    Parameters:
+    size (int): The width of the board.
+
+    Returns:
+    np.dtype: int8 up to 11x11, int16 above.
+    """
+    return np.dtype(np.int8) if size * size <= 128 else np.dtype(np.int16)
+
+
+def goal_board(size: int) -> np.ndarray:
+    """
+    Returns the solved configuration of a size x size board.
+
+    Parameters:
+    size (int): The width of the board.
+
+    Returns:
+    np.ndarray: The solved board, 1..size*size-1 followed by the blank.
+    """
+    return np.append(np.arange(1, size * size), 0).astype(tile_dtype(size)).reshape((size, size))
+
+
+def new_boards(count: int, size: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Creates a batch of solved boards.
+
+    Parameters:
+    count (int): The number of boards.
+    size (int): The width of each board.
+
+    Returns:
+    tuple[np.ndarray, np.ndarray]: The (count, size, size) boards and the flat index of each blank.
+    """
+    boards = np.broadcast_to(goal_board(size), (count, size, size)).copy()
+    blanks = np.full(count, size * size - 1, dtype=np.int64)
+    return boards, blanks
+
+
+def execute_moves(boards: np.ndarray, blanks: np.ndarray, x_dirs: np.ndarray, y_dirs: np.ndarray) -> np.ndarray:
+    """
+    Moves the blank of every board by (x_dir, y_dir), in place.
+
+    Like execute_move, a move that would leave the board is ignored. The tiles are
+    indexed by (board, row, col), so sliced or transposed batches are updated in
+    place too, not through a reshaped copy.
+
+    Parameters:
+    boards (np.ndarray): The (N, size, size) boards, updated in place; any memory layout.
+    blanks (np.ndarray): The flat blank index of each board, updated in place.
+    x_dirs (np.ndarray): The column step of each board's move.
+    y_dirs (np.ndarray): The row step of each board's move.
+
+    Returns:
+    np.ndarray: A boolean mask of the boards whose move was applied.
+    """
+    size = boards.shape[1]
+    rows = blanks // size + y_dirs
+    cols = blanks % size + x_dirs
+    valid = (rows >= 0) & (rows < size) & (cols >= 0) & (cols < size)
+    index = np.flatnonzero(valid)
+    old_rows, old_cols = np.divmod(blanks[index], size)
+    new_rows, new_cols = rows[index], cols[index]
+    boards[index, old_rows, old_cols] = boards[index, new_rows, new_cols]
+    boards[index, new_rows, new_cols] = 0
+    blanks[index] = new_rows * size + new_cols
+    return valid
+
+
+def random_moves(count: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Draws one random move per board, like generate_move.
+
+    Parameters:
+    count (int): The number of boards.
+    rng (np.random.Generator): The random generator to draw from.
+
+    Returns:
+    tuple[np.ndarray, np.ndarray]: The x and y directions of the moves.
+    """
+    choice = DIRECTIONS[rng.integers(0, 4, size=count)]
+    return choice[:, 0], choice[:, 1]
+
+
+def shuffle_boards(boards: np.ndarray, blanks: np.ndarray, steps: int = 75, rng: np.random.Generator | None = None) -> None:
+    """
+    Shuffles every board with its own random walk, like shuffle_puzzle.
+
+    Parameters:
+    boards (np.ndarray): The (N, size, size) boards, updated in place.
+    blanks (np.ndarray): The flat blank index of each board, updated in place.
+    steps (int): The number of random moves per board. Default is 75.
+    rng (np.random.Generator): The random generator to draw from. Default is a fresh one.
+
+    Returns:
+    None
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    for _ in range(steps):
+        x_dirs, y_dirs = random_moves(len(boards), rng)
+        execute_moves(boards, blanks, x_dirs, y_dirs)
+
+
+def solved_mask(boards: np.ndarray) -> np.ndarray:
+    """
+    Checks which boards are solved, like check_ifsolved.
+
+    Parameters:
+    boards (np.ndarray): The (N, size, size) boards.
+
+    Returns:
+    np.ndarray: A boolean mask, True where the board is solved.
+    """
+    size = boards.shape[1]
+    return (boards.reshape(len(boards), size * size) == goal_board(size).ravel()).all(axis=1)
+
+
+def manhattan_distances(boards: np.ndarray) -> np.ndarray:
+    """
+    Computes the Manhattan distance of every board, a simple measure of shuffle quality.
+
+    Parameters:
+    boards (np.ndarray): The (N, size, size) boards.
+
+    Returns:
+    np.ndarray: The summed distance of all tiles from their goal cells, per board.
+    """
+    size = boards.shape[1]
+    tiles = boards.reshape(len(boards), size * size).astype(np.int64)
+    cells = np.arange(size * size)
+    goal = tiles - 1
+    distance = np.abs(goal // size - cells // size) + np.abs(goal % size - cells % size)
+    return np.where(tiles > 0, distance, 0).sum(axis=1)
@@ -0,0 +1,235 @@
+"""Optimal solver for the 3x3 (8-tile) sliding puzzle.
+
+The board is packed into a single integer, 4 bits per cell in row-major order,
+with 0 standing for the blank. The search is IDA* guided by Manhattan distance
+plus linear conflicts, both read from small per-row and per-column tables.
+"""
+
+from itertools import permutations
+
+SIZE = 3
+CELLS = SIZE * SIZE
+GOAL = sum(((i + 1) % CELLS) << (4 * i) for i in range(CELLS))
+
+# Moves are named after the direction the *tile* travels, as in Assignment1-2024.py,
+# so the blank travels the opposite way.
+MOVE_NAMES = ('left', 'right', 'up', 'down')
+_BLANK_STEP = {'left': 1, 'right': -1, 'up': SIZE, 'down': -SIZE}
+_NEIGHBOURS = []
+for _index in range(CELLS):
+    _options = []
+    for _name in MOVE_NAMES:
+        _target = _index + _BLANK_STEP[_name]
+        if 0 <= _target < CELLS and (_target // SIZE == _index // SIZE or _target % SIZE == _index % SIZE):
+            _options.append((_target, _name))
+    _NEIGHBOURS.append(tuple(_options))
+_OPPOSITE = {'left': 'right', 'right': 'left', 'up': 'down', 'down': 'up'}
+
+
+def _line_cost(tiles: tuple[int, int, int], line: int, along_row: bool) -> int:
+    """
+    Return the Manhattan and linear-conflict cost contributed by one row or column.
+
+    For a row this is the horizontal distance of every tile plus two moves for each
+    tile that belongs in this row but must step aside to let the others pass;
+    columns are the same with the axes swapped.
+
+    Args: tuple[int, int, int], int, bool
+    Returns: int
+    """
+
+    cost = 0
+    in_line = []
+    for offset, tile in enumerate(tiles):
+        if tile == 0:
+            continue
+        goal_row, goal_col = divmod(tile - 1, SIZE)
+        goal_line, goal_offset = (goal_row, goal_col) if along_row else (goal_col, goal_row)
+        cost += abs(offset - goal_offset)
+        if goal_line == line:
+            in_line.append(goal_offset)
+    # Every tile outside the longest correctly ordered subsequence has to step aside.
+    longest = [1] * len(in_line)
+    for i in range(len(in_line)):
+        for j in range(i):
+            if in_line[j] < in_line[i]:
+                longest[i] = max(longest[i], longest[j] + 1)
+    return cost + 2 * (len(in_line) - max(longest, default=0))
+
+
+def _build_line_tables() -> tuple[list[list[int]], list[list[int]]]:
+    """
+    Precompute the cost of every possible 12-bit row and column key.
+
+    Args: None
+    Returns: tuple[list[list[int]], list[list[int]]]
+    """
+
+    row_tables, col_tables = [], []
+    for line in range(SIZE):
+        rows, cols = [0] * 4096, [0] * 4096
+        for tiles in permutations(range(CELLS), SIZE):
+            key = tiles[0] | (tiles[1] << 4) | (tiles[2] << 8)
+            rows[key] = _line_cost(tiles, line, True)
+            cols[key] = _line_cost(tiles, line, False)
+        row_tables.append(rows)
+        col_tables.append(cols)
+    return row_tables, col_tables
+
+
+_ROW_TABLES, _COL_TABLES = _build_line_tables()
+
+
+def pack_board(chessboard: list[int, str]) -> int:
+    """
+    Pack a chessboard list (numbers 1-8 and ' ') into a 36-bit integer.
+
+    Args: list[int, str]
+    Returns: int
+    """
+
+    packed = 0
+    for i, tile in enumerate(chessboard):
+        if tile != ' ':
+            packed |= int(tile) << (4 * i)
+    return packed
+
+
+def unpack_board(packed: int) -> list[int, str]:
+    """
+    Unpack an integer produced by pack_board back into a chessboard list.
+
+    Args: int
+    Returns: list[int, str]
+    """
+
+    chessboard = []
+    for i in range(CELLS):
+        tile = (packed >> (4 * i)) & 0xF
+        chessboard.append(tile if tile else ' ')
+    return chessboard
+
+
+def blank_index(packed: int) -> int:
+    """
+    Return the index of the blank cell in a packed board.
+
+    Args: int
+    Returns: int
+    """
+
+    for i in range(CELLS):
+        if not (packed >> (4 * i)) & 0xF:
+            return i
+    raise ValueError("Packed board has no blank cell.")
+
+
+def apply_move(packed: int, move: str) -> int:
+    """
+    Return the packed board after sliding a tile in the given direction.
+
+    Raises ValueError when no tile can slide that way.
+
+    Args: int, str
+    Returns: int
+    """
+
+    blank = blank_index(packed)
+    for target, name in _NEIGHBOURS[blank]:
+        if name == move:
+            tile = (packed >> (4 * target)) & 0xF
+            return packed - (tile << (4 * target)) + (tile << (4 * blank))
+    raise ValueError(f"Move {move!r} is not possible from this position.")
+
+
+def heuristic(packed: int) -> int:
+    """
+    Return the Manhattan distance plus linear conflicts of a packed board.
+
+    Args: int
+    Returns: int
+    """
+
+    rows = _ROW_TABLES
+    cols = _COL_TABLES
+    return (rows[0][packed & 0xFFF] + rows[1][(packed >> 12) & 0xFFF] + rows[2][(packed >> 24) & 0xFFF]
+            + cols[0][(packed & 0xF) | ((packed >> 8) & 0xF0) | ((packed >> 16) & 0xF00)]
+            + cols[1][((packed >> 4) & 0xF) | ((packed >> 12) & 0xF0) | ((packed >> 20) & 0xF00)]
+            + cols[2][((packed >> 8) & 0xF) | ((packed >> 16) & 0xF0) | ((packed >> 24) & 0xF00)])
+
+
+def is_packed_solvable(packed: int) -> bool:
+    """
+    Check whether a packed 3x3 board can reach the goal (even inversion count).
+
+    Args: int
+    Returns: bool
+    """
+
+    tiles = [t for t in ((packed >> (4 * i)) & 0xF for i in range(CELLS)) if t]
+    inversions = sum(1 for i in range(len(tiles)) for j in range(i + 1, len(tiles)) if tiles[i] > tiles[j])
+    return inversions % 2 == 0
+
+
+def solve_packed(packed: int) -> tuple[list[str], int]:
+    """
+    Find an optimal move sequence for a packed board with IDA*.
+
+    Returns the moves (tile directions 'left', 'right', 'up', 'down') and the number
+    of nodes expanded. Raises ValueError for unsolvable boards.
+
+    Args: int
+    Returns: tuple[list[str], int]
+    """
+
+    if not is_packed_solvable(packed):
+        raise ValueError("The chessboard is not solvable.")
+
+    path: list[str] = []
+    nodes = 0
+
+    def search(state: int, blank: int, g: int, bound: int, previous: str) -> int:
+        nonlocal nodes
+        nodes += 1
+        h = heuristic(state)
+        f = g + h
+        if f > bound:
+            return f
+        if h == 0:
+            return -1
+        smallest = 1 << 30
+        for target, name in _NEIGHBOURS[blank]:
+            if name == previous:
+                continue
+            shift = 4 * target
+            tile = (state >> shift) & 0xF
+            path.append(name)
+            result = search(state - (tile << shift) + (tile << (4 * blank)), target, g + 1, bound, _OPPOSITE[name])
+            if result < 0:
+                return result
+            path.pop()
+            if result < smallest:
+                smallest = result
+        return smallest
+
+    blank = blank_index(packed)
+    bound = heuristic(packed)
+    while True:
+        result = search(packed, blank, 0, bound, '')
+        if result < 0:
+            return path, nodes
+        bound = result
+
+
+def solve(chessboard: list[int, str]) -> list[str]:
+    """
+    Return an optimal list of moves that solves the given chessboard.
+
+    Each move names the direction a tile slides ('left', 'right', 'up', 'down'),
+    matching the order of the letters returned by get_valid_moves.
+
+    Args: list[int, str]
+    Returns: list[str]
+    """
+
+    return solve_packed(pack_board(chessboard))[0]
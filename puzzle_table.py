@@ -0,0 +1,163 @@
+"""Exact distance table for every solvable 3x3 board.
+
+A breadth-first search from the solved board records the optimal distance of all
+9!/2 = 181,440 solvable boards in one byte each. A board is indexed by the
+position of its blank and the Lehmer rank of its tile order; solvable tile
+orders are even permutations, so halving that rank keeps the index dense.
+An odd tile order has no entry of its own, so it is rejected before ranking.
+The table is written to a cache file once and memory-mapped afterwards.
+"""
+
+import mmap
+import os
+from collections import deque
+
+from puzzle_solver import CELLS, GOAL, MOVE_NAMES, apply_move, pack_board
+
+TABLE_SIZE = CELLS * 40320 // 2
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'puzzle_table.bin')
+UNREACHABLE = 0xFF
+_FACTORIALS = (5040, 720, 120, 24, 6, 2, 1, 1)
+_table = None
+
+
+def rank_packed(packed: int) -> int:
+    """
+    Return the table index of a packed board.
+
+    Raises ValueError for an unsolvable board (an odd tile order), which would
+    otherwise share the index of the even order next to it.
+
+    Args: int
+    Returns: int
+    """
+
+    blank = -1
+    rank = 0
+    inversions = 0
+    seen = 0
+    order = 0
+    for i in range(CELLS):
+        tile = (packed >> (4 * i)) & 0xF
+        if tile == 0:
+            blank = i
+            continue
+        # Lehmer digit: tiles smaller than this one that have not been placed yet.
+        digit = tile - 1 - (seen & ((1 << tile) - 1)).bit_count()
+        rank += digit * _FACTORIALS[order]
+        inversions += digit
+        seen |= 1 << tile
+        order += 1
+    if inversions & 1:
+        raise ValueError("The chessboard is not solvable.")
+    return blank * 20160 + rank // 2
+
+
+def rank_board(chessboard: list[int, str]) -> int:
+    """
+    Return the table index of a chessboard list.
+
+    Args: list[int, str]
+    Returns: int
+    """
+
+    return rank_packed(pack_board(chessboard))
+
+
+def build_table() -> bytearray:
+    """
+    Run a breadth-first search from the solved board and record every distance.
+
+    Args: None
+    Returns: bytearray
+    """
+
+    table = bytearray([UNREACHABLE]) * TABLE_SIZE
+    table[rank_packed(GOAL)] = 0
+    frontier = deque([GOAL])
+    while frontier:
+        state = frontier.popleft()
+        next_distance = table[rank_packed(state)] + 1
+        for move in MOVE_NAMES:
+            try:
+                neighbour = apply_move(state, move)
+            except ValueError:
+                continue
+            index = rank_packed(neighbour)
+            if table[index] == UNREACHABLE:
+                table[index] = next_distance
+                frontier.append(neighbour)
+    return table
+
+
+def load_table(path: str = CACHE_PATH):
+    """
+    Return the distance table, memory-mapping the cache file when it exists.
+
+    The table is built and written to the cache file on first use. A cache file
+    of the wrong size is rebuilt.
+
+    Args: str
+    Returns: mmap.mmap or bytearray
+    """
+
+    global _table
+    if _table is not None:
+        return _table
+    try:
+        with open(path, 'rb') as cache:
+            table = mmap.mmap(cache.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(table) == TABLE_SIZE:
+            _table = table
+            return _table
+        table.close()
+    except (OSError, ValueError):
+        pass
+    _table = build_table()
+    try:
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as cache:
+            cache.write(_table)
+        os.replace(temp_path, path)
+    except OSError:
+        pass  # A read-only install still gets the in-memory table.
+    return _table
+
+
+def distance(chessboard: list[int, str]) -> int:
+    """
+    Return the optimal number of moves needed to solve a chessboard.
+
+    Raises ValueError if the chessboard is not solvable.
+
+    Args: list[int, str]
+    Returns: int
+    """
+
+    return load_table()[rank_board(chessboard)]
+
+
+def best_move(chessboard: list[int, str]) -> str | None:
+    """
+    Return a move ('left', 'right', 'up', 'down') that lies on an optimal solution.
+
+    Returns None when the chessboard is already solved. Raises ValueError if it
+    is not solvable.
+
+    Args: list[int, str]
+    Returns: str | None
+    """
+
+    table = load_table()
+    packed = pack_board(chessboard)
+    current = table[rank_packed(packed)]
+    if current == 0:
+        return None
+    for move in MOVE_NAMES:
+        try:
+            neighbour = apply_move(packed, move)
+        except ValueError:
+            continue
+        if table[rank_packed(neighbour)] == current - 1:
+            return move
+    raise ValueError("The distance table is corrupt.")
@@ -0,0 +1,146 @@
+"""Background solving for the turtle sliding-puzzle GUI.
+
+A SolveJob runs find_solution on a copy of the board in a daemon thread, so the
+Tk main loop keeps handling events while a 4x4 or 5x5 search is running. IDA*
+only knows its solution once the search ends, so the slides are put on a
+thread-safe queue then, all at once; the GUI polls the job from a
+screen.ontimer callback with drain(), which never blocks, and plays the slides
+while it keeps polling.
+
+Cancelling sets an event that the search checks every 1024 nodes; the job
+also stops handing out slides at once, so a cancelled solve has no visible
+effect even before its thread notices.
+
+A job never builds the 4x4 pattern databases: that takes minutes of numpy work
+that would hold up the Tk thread. start_database_build runs the build in a
+separate, low-priority process instead, and until it is done 4x4 boards get
+the reduction solver's (not optimal) solution.
+"""
+
+import multiprocessing
+import os
+import queue
+import threading
+from functools import partial
+
+import numpy as np
+
+from puzzle_autosolve import PDB_GROUPS, SolveCancelled, build_pattern_databases, databases_on_disk, find_solution
+
+_DONE = object()  # Queued after the last slide
+
+
+class SolveJob:
+    """
+    One solve running in a worker thread; its (row, col) slides arrive through a queue.
+
+    Once finished, `length` is the number of slides and `optimal` whether no
+    shorter solution exists.
+    """
+
+    def __init__(self, tiles, solve=partial(find_solution, build=False)):
+        self.error = None
+        self.finished = False
+        self.length = 0
+        self.optimal = False
+        self._moves = queue.SimpleQueue()
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(solve, np.array(tiles)), daemon=True)
+        self._thread.start()
+
+    def _run(self, solve, tiles) -> None:
+        try:
+            moves, self.optimal = solve(tiles, cancel=self._cancel)
+            self.length = len(moves)
+            for move in moves:
+                self._moves.put(move)
+        except SolveCancelled:
+            pass
+        except Exception as error:  # Reported to the GUI thread through self.error
+            self.error = error
+        finally:
+            self._moves.put(_DONE)
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Whether cancel() has been called.
+
+        Args: None
+        Returns: bool
+        """
+
+        return self._cancel.is_set()
+
+    def cancel(self) -> None:
+        """
+        Stop the job: no more slides are handed out, and the search gives up at its next check.
+
+        Args: None
+        Returns: None
+        """
+
+        self._cancel.set()
+
+    def wait(self) -> None:
+        """
+        Block until the search has finished or given up; drain() then returns every slide.
+
+        Args: None
+        Returns: None
+        """
+
+        self._thread.join()
+
+    def drain(self, limit: int | None = None) -> list[tuple[int, int]]:
+        """
+        Return the slides that have arrived since the last call, without waiting.
+
+        Sets finished once the last slide has been handed out.
+
+        Args: limit (most slides to return; default all)
+        Returns: list[tuple[int, int]]
+        """
+
+        moves = []
+        while not self._cancel.is_set() and (limit is None or len(moves) < limit):
+            try:
+                move = self._moves.get_nowait()
+            except queue.Empty:
+                break
+            if move is _DONE:
+                self.finished = True
+                break
+            moves.append(move)
+        return moves
+
+
+_builds = {}  # Board size -> the process building its pattern databases
+
+
+def _build_quietly(size: int) -> None:
+    # Runs in the build process; yield the CPU to the game window.
+    if hasattr(os, 'nice'):
+        os.nice(10)
+    build_pattern_databases(size)
+
+
+def start_database_build(size: int):
+    """
+    Start building the pattern databases of a board size in a separate process, unless they are on disk or being built.
+
+    The process is a daemon, so closing the game stops it. A database is only
+    renamed into place once complete, so a build cut short starts again next time.
+
+    Args: size (int)
+    Returns: multiprocessing.Process | None
+    """
+
+    if size not in PDB_GROUPS or databases_on_disk(size):
+        return None
+    process = _builds.get(size)
+    if process is None or (not process.is_alive() and process.exitcode):
+        process = multiprocessing.get_context('spawn').Process(target=_build_quietly, args=(size,), daemon=True)
+        process.start()
+        _builds[size] = process
+    return process
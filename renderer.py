@@ -0,0 +1,361 @@
+"""Drawing backends for the turtle games.
+
+Assignment2-2024.py and Assignment3-2024.py never touch the turtle module
+directly. They ask get_renderer() for screens and turtles, and Lazy defers even
+that until the first drawing call, so importing a game module costs nothing.
+
+- TurtleRenderer imports turtle (and Tk) the first time it is used.
+- NullRenderer hands out objects that accept every turtle call and do nothing.
+  It is the default when no display is available, e.g. on a headless Linux box.
+  Its ontimer never calls back, so code that animates through timers checks
+  `runs_timers` and does the work at once instead.
+
+Set GAME_RENDERER=null or GAME_RENDERER=turtle to override the choice.
+"""
+
+import os
+import sys
+import time
+
+_renderer = None
+
+
+def has_display() -> bool:
+    """
+    Check whether a graphical display is available to open a window on.
+
+    Args: None
+    Returns: bool
+    """
+
+    if sys.platform.startswith(('linux', 'freebsd', 'openbsd')):
+        return bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+    return True
+
+
+class NullTurtle:
+    '''
+    A turtle or screen stand-in whose methods accept any arguments and do nothing.
+    Queries that the games read back return harmless values.
+    '''
+
+    def __init__(self, *args, **kwargs):
+        self._stamps = 0
+
+    def __getattr__(self, name):
+        return _ignore
+
+    def stamp(self) -> int:
+        self._stamps += 1
+        return self._stamps
+
+    def numinput(self, title, prompt, default=None, minval=None, maxval=None):
+        return default
+
+    def textinput(self, title, prompt):
+        return None
+
+    def window_width(self) -> int:
+        return 0
+
+    def window_height(self) -> int:
+        return 0
+
+
+def _ignore(*args, **kwargs) -> None:
+    return None
+
+
+class NullRenderer:
+    '''
+    Renderer that draws nothing. Used for tests, tools, batch jobs and headless machines.
+    '''
+
+    name = 'null'
+    runs_timers = False
+
+    def screen(self) -> NullTurtle:
+        return NullTurtle()
+
+    def turtle(self, **kwargs) -> NullTurtle:
+        return NullTurtle()
+
+
+class TurtleRenderer:
+    '''
+    Renderer backed by the standard turtle module, imported on first use.
+    '''
+
+    name = 'turtle'
+    runs_timers = True
+
+    def __init__(self):
+        self._module = None
+
+    def _turtle_module(self):
+        if self._module is None:
+            import turtle
+            self._module = turtle
+        return self._module
+
+    def screen(self):
+        return self._turtle_module().Screen()
+
+    def turtle(self, **kwargs):
+        return self._turtle_module().Turtle(**kwargs)
+
+
+def get_renderer():
+    """
+    Return the renderer shared by the games, choosing one on first use.
+
+    Args: None
+    Returns: TurtleRenderer | NullRenderer
+    """
+
+    global _renderer
+    if _renderer is None:
+        choice = os.environ.get('GAME_RENDERER', '').lower()
+        if choice == 'null' or (choice != 'turtle' and not has_display()):
+            _renderer = NullRenderer()
+        else:
+            _renderer = TurtleRenderer()
+    return _renderer
+
+
+def set_renderer(renderer) -> None:
+    """
+    Replace the shared renderer, e.g. with NullRenderer() in a batch job.
+
+    Objects already created by the previous renderer keep drawing with it.
+
+    Args: renderer
+    Returns: None
+    """
+
+    global _renderer
+    _renderer = renderer
+
+
+class Lazy:
+    '''
+    Proxy that builds its target with factory() on first attribute access.
+    Lets modules keep global `t` and `screen` names without creating them at import time.
+    '''
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._target = None
+
+    def __getattr__(self, name):
+        if self._target is None:
+            self._target = self._factory()
+        return getattr(self._target, name)
+
+
+class TileLayer:
+    '''
+    Retained-mode drawing of sliding-puzzle tiles.
+    Every tile owns one square sprite and one label turtle for its number. Placing a
+    tile only touches that tile's canvas items, and only if its position changed, so
+    a move costs O(1) canvas operations whatever the board size. Labels use `font`
+    on large tiles and a smaller size on small ones, so numbers on a 15x15 board still
+    fit. `ops` counts the canvas operations issued so far.
+    '''
+
+    def __init__(self):
+        self.sprites = {}
+        self.labels = {}
+        self.placed = {}
+        self.color = None
+        self.font = ('Times', 18, 'normal')
+        self.ops = 0
+
+    def font_for(self, draw_size: int) -> tuple:
+        """
+        Return the label font for tiles of the given size: `font`, shrunk to fit small tiles.
+
+        Args: draw_size
+        Returns: tuple (family, size, style)
+        """
+
+        family, size, style = self.font
+        return family, max(8, min(size, draw_size * 2 // 5)), style
+
+    def build(self, numbers, color: str) -> None:
+        """
+        Create the sprite and label of every numbered tile, reusing existing ones.
+        New sprites take the layer's current colour; use recolour to change it.
+
+        Args: numbers (iterable of tile numbers, 0 is skipped), color
+        Returns: None
+        """
+
+        renderer = get_renderer()
+        if self.color is None:
+            self.color = color
+        for number in numbers:
+            number = int(number)
+            if number <= 0 or number in self.sprites:
+                continue
+            sprite = renderer.turtle(shape='square')
+            sprite.speed(0)
+            sprite.penup()
+            sprite.color('black', self.color)
+            label = renderer.turtle()
+            label.speed(0)
+            label.hideturtle()
+            label.penup()
+            self.sprites[number] = sprite
+            self.labels[number] = label
+            self.ops += 2
+
+    def place(self, number: int, x: float, y: float, draw_size: int) -> None:
+        """
+        Move a tile so that its top-left corner is at (x, y); does nothing if it is already there.
+
+        Args: number, x, y, draw_size
+        Returns: None
+        """
+
+        number = int(number)
+        if number <= 0 or self.placed.get(number) == (x, y, draw_size):
+            return
+        sprite = self.sprites[number]
+        label = self.labels[number]
+        previous = self.placed.get(number)
+        if previous is None or previous[2] != draw_size:
+            sprite.shapesize(draw_size / 20, draw_size / 20)
+            self.ops += 1
+        font = self.font_for(draw_size)
+        sprite.goto(x + draw_size / 2, y - draw_size / 2)
+        label.clear()
+        label.goto(x + draw_size / 2, y - draw_size / 2 - font[1] - 2)
+        label.write(number, align='center', font=font)
+        self.placed[number] = (x, y, draw_size)
+        self.ops += 4
+
+    def recolour(self, color: str) -> None:
+        """
+        Change the fill colour of every tile, skipping the work if nothing changes.
+
+        Args: color
+        Returns: None
+        """
+
+        if color == self.color:
+            return
+        for sprite in self.sprites.values():
+            sprite.fillcolor(color)
+            self.ops += 1
+        self.color = color
+
+
+class TextLayer:
+    '''
+    Retained-mode text labels.
+    Every label key owns one hidden turtle, created on first use, and remembers the
+    text, position and font it last wrote. Showing a label again with the same content
+    touches no canvas item, so callers can refresh labels freely. `ops` counts the
+    canvas operations issued so far.
+    '''
+
+    def __init__(self):
+        self.writers = {}
+        self.shown = {}
+        self.ops = 0
+
+    def show(self, key, text: str, x: float, y: float, font=('Arial', 8, 'normal')) -> None:
+        """
+        Show a label with the given text at (x, y); does nothing if it already shows exactly that.
+
+        Args: key, text, x, y, font
+        Returns: None
+        """
+
+        content = (text, x, y, font)
+        if self.shown.get(key) == content:
+            return
+        writer = self.writers.get(key)
+        if writer is None:
+            writer = get_renderer().turtle()
+            writer.hideturtle()
+            writer.penup()
+            self.writers[key] = writer
+            self.ops += 1
+        previous = self.shown.get(key)
+        if previous is not None:
+            writer.clear()
+            self.ops += 1
+        if previous is None or previous[1:3] != (x, y):
+            writer.goto(x, y)
+            self.ops += 1
+        writer.write(text, font=font)
+        self.shown[key] = content
+        self.ops += 1
+
+    def hide(self, key) -> None:
+        """
+        Remove a label from the canvas; does nothing if it is not shown.
+
+        Args: key
+        Returns: None
+        """
+
+        if self.shown.pop(key, None) is not None:
+            self.writers[key].clear()
+            self.ops += 1
+
+
+class FrameCounter:
+    '''
+    Records how long each frame takes and how many canvas operations it issued.
+    '''
+
+    def __init__(self, history: int = 240):
+        self.history = history
+        self.times = []
+        self.op_counts = []
+        self._started = None
+        self._ops_at_start = 0
+
+    def begin(self, layer: TileLayer) -> None:
+        """
+        Mark the start of a frame drawn with the given tile layer.
+
+        Args: layer
+        Returns: None
+        """
+
+        self._started = time.perf_counter()
+        self._ops_at_start = layer.ops
+
+    def end(self, layer: TileLayer) -> None:
+        """
+        Mark the end of the current frame and record its time and canvas operations.
+
+        Args: layer
+        Returns: None
+        """
+
+        if self._started is None:
+            return
+        self.times.append(time.perf_counter() - self._started)
+        self.op_counts.append(layer.ops - self._ops_at_start)
+        del self.times[:-self.history], self.op_counts[:-self.history]
+        self._started = None
+
+    def summary(self) -> dict:
+        """
+        Return frame count, mean and worst frame time (ms) and mean canvas operations per frame.
+
+        Args: None
+        Returns: dict
+        """
+
+        if not self.times:
+            return {'frames': 0, 'mean_ms': 0.0, 'max_ms': 0.0, 'mean_ops': 0.0}
+        return {'frames': len(self.times),
+                'mean_ms': 1000 * sum(self.times) / len(self.times),
+                'max_ms': 1000 * max(self.times),
+                'mean_ops': sum(self.op_counts) / len(self.op_counts)}
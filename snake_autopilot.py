@@ -0,0 +1,265 @@
+'''
+Autopilot for the Snake game, for soak tests and throughput benchmarks.
+
+The snake follows a fixed Hamiltonian cycle, so it visits every cell in turn
+and, as long as its body lies behind the head along the cycle, it never runs
+into itself. A 25x25 board has an odd number of cells and no Hamiltonian
+cycle, so the cycle covers columns 0..23, the columns monsters can reach, and
+column 24 is a spare lane the snake only enters to get away from a monster.
+
+Before every move an A* search looks for a path from the head to the food
+the snake would reach first, around the snake body and the cells a monster
+can reach in one step. Its first step is taken as a shortcut when it skips
+ahead along the cycle without overtaking the food or the tail end. When the
+next cell of the cycle is in reach of a monster, the snake steps to the safe
+neighbour furthest from the monsters instead.
+
+Autopilot.choose returns a key name ('Up', 'Down', 'Left' or 'Right'), so the
+same decisions drive the game through its key handlers and, through
+engine_actions, a SnakeEngine batch. Run this module to time the decisions
+and play a batch of headless games.
+'''
+
+import heapq
+import time
+
+from snake_pursuit import GRID_SIZE, neighbour_table
+
+# (x, y) step of each key.
+KEY_STEPS = {'Up': (0, 1), 'Down': (0, -1), 'Left': (-1, 0), 'Right': (1, 0)}
+STEP_KEYS = {step: key for key, step in KEY_STEPS.items()}
+
+
+def hamiltonian_cycle(width: int, height: int) -> list:
+    '''
+    Return a Hamiltonian cycle over the cells (x, y) with x < width and y < height.
+    Columns are walked up and down in turn above row 0, which leads back to the start.
+    The width must be even.
+
+    Args: width, height
+    Returns: list of (x, y), each cell next to the one before and the last next to the first
+    '''
+
+    if width % 2 or height < 2:
+        raise ValueError('a Hamiltonian cycle needs an even width and a height of at least 2')
+    cycle = []
+    for x in range(width):
+        rows = range(1, height) if x % 2 == 0 else range(height - 1, 0, -1)
+        cycle.extend((x, y) for y in rows)
+    cycle.extend((x, 0) for x in range(width - 1, -1, -1))
+    return cycle
+
+
+def astar_first_step(start: int, goal: int, blocked, size: int = GRID_SIZE, max_cost=None):
+    '''
+    Return the first cell of a shortest path from start to goal, or None if there is none.
+    The search uses the Manhattan distance as its heuristic and never enters blocked cells;
+    the goal itself must be free. With max_cost, paths longer than that count as none,
+    which bounds the search.
+
+    Args: start, goal (packed cells), blocked (bytearray, nonzero for blocked cells), size, max_cost
+    Returns: int or None
+    '''
+
+    if start == goal or blocked[goal]:
+        return None
+    neighbours = neighbour_table(size)
+    goal_y, goal_x = divmod(goal, size)
+    came_from = {start: start}
+    cost = {start: 0}
+    # Ties go to the deeper cell, so on an open board the search runs straight at the goal.
+    heap = [(0, 0, start)]
+    while heap:
+        estimate, depth, cell = heapq.heappop(heap)
+        g = -depth
+        if max_cost is not None and estimate > max_cost:
+            return None
+        if cell == goal:
+            while came_from[cell] != start:
+                cell = came_from[cell]
+            return cell
+        if g > cost[cell]:
+            continue
+        for neighbour in neighbours[cell]:
+            if blocked[neighbour] or cost.get(neighbour, g + 2) <= g + 1:
+                continue
+            cost[neighbour] = g + 1
+            came_from[neighbour] = cell
+            y, x = divmod(neighbour, size)
+            heapq.heappush(heap, (g + 1 + abs(x - goal_x) + abs(y - goal_y), -g - 1, neighbour))
+    return None
+
+
+class Autopilot:
+    '''
+    Chooses the snake's moves from a precomputed Hamiltonian cycle with A*-checked shortcuts.
+    '''
+
+    def __init__(self, size: int = GRID_SIZE):
+        self.size = size
+        self.cycle = [y * size + x for x, y in hamiltonian_cycle(size - size % 2, size)]
+        self.order = [-1] * (size * size)
+        for index, cell in enumerate(self.cycle):
+            self.order[cell] = index
+        self.neighbours = neighbour_table(size)
+        self.blocked = bytearray(size * size)
+
+    def _ahead(self, start: int, cell: int) -> int:
+        # Distance from start to cell going forward along the cycle.
+        return (self.order[cell] - self.order[start]) % len(self.cycle)
+
+    def choose(self, head, tail, monsters, foods, to_grow: int = 0):
+        '''
+        Return the key for the next move, or None if the snake is at a loss.
+
+        Args: head ([x, y]), tail (packed cells, nearest the head first), monsters (list of [x, y]),
+              foods (list of [x, y], [-1, -1] once eaten), to_grow (blocks still to be added)
+        Returns: str or None
+        '''
+
+        size = self.size
+        here = head[1] * size + head[0]
+        danger = set()
+        for x, y in monsters:
+            cell = y * size + x
+            danger.add(cell)
+            danger.update(self.neighbours[cell])
+        safe = [cell for cell in self.neighbours[here] if cell not in danger]
+        if not safe:
+            return None
+
+        if self.order[here] < 0:
+            # Off the cycle: head back onto it, or stay out of reach.
+            on_cycle = [cell for cell in safe if self.order[cell] >= 0]
+            step = on_cycle[0] if on_cycle else None
+        else:
+            step = self._shortcut(here, tail, danger, foods, to_grow)
+            if step is None:
+                following = self.cycle[(self.order[here] + 1) % len(self.cycle)]
+                if following not in danger:
+                    step = following
+        if step is None:
+            step = max(safe, key=lambda cell: (self._clearance(cell, monsters), -self._ahead_or_far(here, cell)))
+        step_y, step_x = divmod(step, size)
+        return STEP_KEYS[(step_x - head[0], step_y - head[1])]
+
+    def _ahead_or_far(self, start: int, cell: int) -> int:
+        if self.order[start] < 0 or self.order[cell] < 0:
+            return len(self.cycle)
+        return self._ahead(start, cell)
+
+    def _clearance(self, cell: int, monsters) -> int:
+        y, x = divmod(cell, self.size)
+        return min((abs(x - monster_x) + abs(y - monster_y) for monster_x, monster_y in monsters), default=self.size)
+
+    def _shortcut(self, here: int, tail, danger, foods, to_grow: int):
+        # The food reached first along the cycle; food in the spare lane counts from its cycle neighbour.
+        size = self.size
+        target = None
+        target_ahead = len(self.cycle)
+        for x, y in foods:
+            if x < 0:
+                continue
+            cell = y * size + x
+            anchor = cell if self.order[cell] >= 0 else cell - 1
+            ahead = self._ahead(here, anchor)
+            if 0 < ahead < target_ahead:
+                target, target_ahead = cell, ahead
+        if target is None:
+            return None
+
+        # Skip no further than the tail end, leaving room for the blocks still to grow.
+        room = len(self.cycle)
+        if tail:
+            end = tail[-1]
+            if self.order[end] >= 0:
+                room = self._ahead(here, end) - to_grow - 1
+
+        # A shortcut is a neighbour further ahead than the next cell; without one, skip the search.
+        limit = min(target_ahead, room - 1)
+        if not any(self.order[cell] >= 0 and 1 < self._ahead(here, cell) <= limit and cell not in danger
+                   for cell in self.neighbours[here]):
+            return None
+
+        blocked = self.blocked
+        for cell in danger:
+            blocked[cell] = 1
+        for cell in tail:
+            blocked[cell] = 1
+        try:
+            # A path no shorter than the way round the cycle is not worth taking.
+            step = astar_first_step(here, target, blocked, size, target_ahead - 1)
+        finally:
+            for cell in danger:
+                blocked[cell] = 0
+            for cell in tail:
+                blocked[cell] = 0
+        if step is None or self.order[step] < 0:
+            return None
+        ahead = self._ahead(here, step)
+        if ahead > target_ahead or ahead >= room:
+            return None
+        return step
+
+
+def engine_actions(engine, pilot: Autopilot):
+    '''
+    Return the autopilot's actions for every SnakeEngine game whose snake moves in the next tick.
+    A game gets an action only when the key differs from its current motion.
+
+    Args: engine (SnakeEngine), pilot
+    Returns: np.ndarray of actions
+    '''
+
+    import numpy as np
+    from snake_engine import DOWN, LEFT, NOOP, RIGHT, UP
+
+    codes = {'Up': UP, 'Down': DOWN, 'Left': LEFT, 'Right': RIGHT}
+    actions = np.full(engine.count, NOOP, dtype=np.int8)
+    for game in np.flatnonzero(~engine.done & (engine.snake_due <= engine.sim_ms)):
+        tail = [y * pilot.size + x for x, y in engine.tail_cells(game)]
+        foods = engine.food[game].tolist()
+        key = pilot.choose(engine.head[game].tolist(), tail, engine.monsters[game].tolist(), foods,
+                           int(engine.to_grow[game]))
+        if key is not None and codes[key] != engine.motion[game]:
+            actions[game] = codes[key]
+    return actions
+
+
+def main() -> None:
+    '''
+    Time the autopilot's decisions and play a batch of headless games with it.
+
+    Args: None
+    Returns: None
+    '''
+
+    import numpy as np
+    from snake_engine import SnakeEngine
+
+    games, ticks = 64, 6000
+    pilot = Autopilot()
+    engine = SnakeEngine(games, np.random.default_rng(1))
+    decisions = 0
+    thinking = 0.0
+    started = time.perf_counter()
+    for _ in range(ticks):
+        if engine.done.all():
+            break
+        moving = int((~engine.done & (engine.snake_due <= engine.sim_ms)).sum())
+        before = time.perf_counter()
+        actions = engine_actions(engine, pilot)
+        thinking += time.perf_counter() - before
+        decisions += moving
+        engine.step(actions)
+    elapsed = time.perf_counter() - started
+    print(f'{decisions} decisions, {1000 * thinking / max(decisions, 1):.3f} ms each')
+    print(f'{games} games, {engine.sim_ms // 50} ticks in {elapsed:.1f} s: '
+          f'{int(engine.won.sum())} won, {int((engine.done & ~engine.won).sum())} caught, '
+          f'{int((~engine.done).sum())} still playing')
+    print(f'mean length {engine.tail_length.mean():.1f}, mean contact {engine.contact.mean():.1f}, '
+          f'mean time {engine.game_time.mean():.0f} s')
+
+
+if __name__ == '__main__':
+    main()
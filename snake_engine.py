@@ -0,0 +1,285 @@
+"""Headless, vectorised simulator for batches of Snake games.
+
+This is the game logic of Assignment3-2024.py (snake_move, monsters_move,
+eat_food, check_contact, is_game_over, refresh_time and relocate_food)
+without turtle. N games live in numpy arrays and every call to step advances
+all of them by one 50 ms tick of the game loop, running each timed part of the
+game when it falls due, exactly as the Scheduler does for the real game.
+
+Positions are (x, y) cells on the 25x25 board; tail blocks are packed as
+y * 25 + x, like the occupancy grid. Monsters occupy cells 0..23 and touch the
+2x2 block of snake cells from their own cell to one cell up and right. With
+four monsters the game chases the head with the greedy dx/dy rule of
+snake_pursuit.greedy_moves, and so does the engine.
+
+The rules match the game's, but the random draws do not, so one seed gives
+different games here and in Assignment3-2024.py:
+
+- Initial food: set_food pops five cells from a pool of the free cells in the
+  food area, while _place_food samples the area and rejects taken cells.
+  Both give five distinct cells, clear of the head and the monsters.
+- Relocated food: relocate_food picks from the occupancy grid's free-cell
+  pool, while _relocate_food samples the whole board and rejects taken cells.
+- Monsters: setup_monsters redraws each monster in the centre square as it
+  goes, while _place_monsters draws them all and then redraws those in the
+  centre. Monster moves take the same draws in the same order, but from
+  numpy's generator rather than random.Random.
+
+snake_lockstep.py checks the engine against the game tick by tick, lining up
+these draws; run it after changing either side.
+"""
+
+import numpy as np
+
+from snake_pursuit import MONSTER_STEPS
+
+GRID_SIZE = 25
+CELLS = GRID_SIZE * GRID_SIZE
+MONSTERS = 4
+FOODS = 5
+WIN_LENGTH = 20
+TAIL_CAPACITY = 32  # ring buffer size, a power of two above WIN_LENGTH
+FRAME_STEP = 50
+MONSTER_SPEED = 500
+CLOCK_INTERVAL = 1000
+FOOD_INTERVAL = 5000
+
+# Actions, matching the key bindings in main(): nothing, Up, Down, Left, Right, space.
+NOOP, UP, DOWN, LEFT, RIGHT, PAUSE = range(6)
+# (x, y) step of each motion; motion 0 is 'Paused'.
+DIRECTIONS = np.array([(0, 0), (0, 1), (0, -1), (-1, 0), (1, 0)], dtype=np.int16)
+# Monster moves in the order monsters_move tries them: up, down, right, left.
+
+
+class SnakeEngine:
+    """
+    A batch of Snake games advanced in lockstep.
+
+    Attributes:
+    count (int): The number of games.
+    head (np.ndarray): (N, 2) head cell of each game.
+    tail (np.ndarray): (N, TAIL_CAPACITY) ring buffer of packed tail cells.
+    tail_front (np.ndarray): Index in `tail` of the block nearest the head.
+    tail_length (np.ndarray): SNAKE_TAIL_LENGTH of each game.
+    tail_grid (np.ndarray): (N, 625) number of tail blocks on each cell.
+    to_grow (np.ndarray): SNAKE_TAIL_DEFAULT, the blocks still to be added.
+    snake_speed (np.ndarray): SNAKE_SPEED in milliseconds.
+    motion (np.ndarray): 0 paused, then UP, DOWN, LEFT, RIGHT.
+    monsters (np.ndarray): (N, 4, 2) monster cells.
+    food (np.ndarray): (N, 5, 2) food cells, (-1, -1) once eaten.
+    contact (np.ndarray): GAME_CONTACT of each game.
+    game_time (np.ndarray): GAME_TIME in seconds.
+    done (np.ndarray): True once a game is over.
+    won (np.ndarray): True if a game ended with a full-length snake.
+    sim_ms (int): Simulation time of the next tick.
+    """
+
+    def __init__(self, count: int, rng: np.random.Generator | None = None):
+        self.count = count
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Starts every game afresh, like main() followed by a click on the screen.
+
+        Returns:
+        None
+        """
+        n = self.count
+        self.head = np.full((n, 2), GRID_SIZE // 2, dtype=np.int16)
+        self.tail = np.zeros((n, TAIL_CAPACITY), dtype=np.int16)
+        self.tail_front = np.zeros(n, dtype=np.int64)
+        self.tail_length = np.zeros(n, dtype=np.int16)
+        self.tail_grid = np.zeros((n, CELLS), dtype=np.uint8)
+        self.to_grow = np.full(n, 5, dtype=np.int16)
+        self.snake_speed = np.full(n, 250, dtype=np.int32)
+        self.snake_due = np.zeros(n, dtype=np.int64)
+        self.motion = np.zeros(n, dtype=np.int8)
+        self.previous_motion = np.zeros(n, dtype=np.int8)
+        self.contact = np.zeros(n, dtype=np.int32)
+        self.game_time = np.zeros(n, dtype=np.int32)
+        self.done = np.zeros(n, dtype=bool)
+        self.won = np.zeros(n, dtype=bool)
+        self.sim_ms = 0
+        self.monsters = self._place_monsters()
+        self.food = self._place_food()
+
+    def _place_monsters(self) -> np.ndarray:
+        # Like setup_monsters: anywhere in 0..23 except the centre square 7..17.
+        monsters = self.rng.integers(0, GRID_SIZE - 1, size=(self.count, MONSTERS, 2), dtype=np.int16)
+        while True:
+            central = ((monsters >= 7) & (monsters <= 17)).all(axis=2)
+            if not central.any():
+                return monsters
+            monsters[central] = self.rng.integers(0, GRID_SIZE - 1, size=(int(central.sum()), 2), dtype=np.int16)
+
+    def _place_food(self) -> np.ndarray:
+        # Like set_food: away from the edges and the status bar, on a cell free of other food, the head and monsters.
+        food = np.empty((self.count, FOODS, 2), dtype=np.int16)
+        centre = np.array([GRID_SIZE // 2, GRID_SIZE // 2], dtype=np.int16)
+        for i in range(FOODS):
+            redo = np.ones(self.count, dtype=bool)
+            while redo.any():
+                rows = np.flatnonzero(redo)
+                food[rows, i, 0] = self.rng.integers(3, GRID_SIZE - 3, size=len(rows))
+                food[rows, i, 1] = self.rng.integers(3, GRID_SIZE - 1, size=len(rows))
+                taken = ((food[:, :i] == food[:, i:i + 1]).all(axis=2).any(axis=1) | (food[:, i] == centre).all(axis=1)
+                         | (self.monsters == food[:, i:i + 1]).all(axis=2).any(axis=1))
+                redo = taken
+        return food
+
+    def apply_actions(self, actions: np.ndarray) -> None:
+        """
+        Applies one key press per game, like the set_snake_direction_* and set_snake_paused handlers.
+
+        Parameters:
+        actions (np.ndarray): NOOP, UP, DOWN, LEFT, RIGHT or PAUSE for each game.
+
+        Returns:
+        None
+        """
+        actions = np.asarray(actions)
+        turn = (actions >= UP) & (actions <= RIGHT)
+        self.motion[turn] = actions[turn]
+        pause = actions == PAUSE
+        pausing = pause & (self.motion != 0)
+        resuming = pause & (self.motion == 0)
+        self.previous_motion[pausing] = self.motion[pausing]
+        self.motion[pausing] = 0
+        self.motion[resuming] = self.previous_motion[resuming]
+
+    def step(self, actions: np.ndarray | None = None) -> np.ndarray:
+        """
+        Applies the actions, then advances every game by one 50 ms tick.
+
+        In each tick the snake, the monsters, the clock and the food relocation
+        run in that order, each only if it is due, and a game that ends stops
+        running for good.
+
+        Parameters:
+        actions (np.ndarray): One action per game, or None for no key presses.
+
+        Returns:
+        np.ndarray: The done mask.
+        """
+        if actions is not None:
+            self.apply_actions(actions)
+        t = self.sim_ms
+        self._snake_move(np.flatnonzero(~self.done & (self.snake_due <= t)))
+        if t % MONSTER_SPEED == 0:
+            self._monsters_move(np.flatnonzero(~self.done))
+        if t and t % CLOCK_INTERVAL == 0:
+            self.game_time[~self.done] += 1
+        if t and t % FOOD_INTERVAL == 0:
+            self._relocate_food(np.flatnonzero(~self.done))
+        self.sim_ms += FRAME_STEP
+        return self.done
+
+    def _end_over(self, games: np.ndarray) -> np.ndarray:
+        # is_game_over: a monster on the head loses, a full-length tail wins.
+        caught = (self.monsters[games] == self.head[games, None, :]).all(axis=2).any(axis=1)
+        full = self.tail_length[games] == WIN_LENGTH
+        over = caught | full
+        self.done[games[over]] = True
+        self.won[games[full & ~caught]] = True
+        return games[~over]
+
+    def _snake_move(self, games: np.ndarray) -> None:
+        games = self._end_over(games)
+        target = self.head[games] + DIRECTIONS[self.motion[games]]
+        movable = (self.motion[games] != 0) & ((target >= 0) & (target < GRID_SIZE)).all(axis=1)
+        moved = games[movable]
+        target = target[movable]
+
+        # Push the old head cell onto the tail.
+        old_cells = self.head[moved, 1].astype(np.int64) * GRID_SIZE + self.head[moved, 0]
+        front = (self.tail_front[moved] - 1) % TAIL_CAPACITY
+        self.tail_front[moved] = front
+        self.tail[moved, front] = old_cells
+        self.tail_grid[moved, old_cells] += 1
+        self.head[moved] = target
+
+        # Grow (snake_expand, update_snake_speed) or retract the tail end.
+        growing = self.to_grow[moved] > 0
+        grow = moved[growing]
+        self.tail_length[grow] += 1
+        self.to_grow[grow] -= 1
+        self.snake_speed[grow] = np.where(self.to_grow[grow] > 0, 400, 200)
+        shrink = moved[~growing]
+        end = (self.tail_front[shrink] + self.tail_length[shrink]) % TAIL_CAPACITY
+        self.tail_grid[shrink, self.tail[shrink, end]] -= 1
+
+        # eat_food: food i is worth i + 1 blocks.
+        eaten = (self.food[moved] == self.head[moved, None, :]).all(axis=2)
+        self.to_grow[moved] += (eaten * np.arange(1, FOODS + 1)).sum(axis=1).astype(np.int16)
+        food = self.food[moved]
+        food[eaten] = -1
+        self.food[moved] = food
+
+        # check_contact: at most one contact per move.
+        self.contact[moved] += self._touching(moved)
+        self.snake_due[games] += self.snake_speed[games]
+
+    def _touching(self, games: np.ndarray) -> np.ndarray:
+        monsters = self.monsters[games].astype(np.int64)
+        cells = monsters[:, :, 1] * GRID_SIZE + monsters[:, :, 0]
+        block = np.concatenate([cells, cells + 1, cells + GRID_SIZE, cells + GRID_SIZE + 1], axis=1)
+        return (self.tail_grid[games[:, None], block] > 0).any(axis=1)
+
+    def _monsters_move(self, games: np.ndarray) -> None:
+        games = self._end_over(games)
+        if not len(games):
+            return
+        how_many = self.rng.integers(1, 3, size=len(games))
+        order = np.argsort(self.rng.random((len(games), MONSTERS)), axis=1)
+        for j in range(2):
+            chosen = j < how_many
+            rows = games[chosen]
+            which = order[chosen, j]
+            start = self.monsters[rows, which].astype(np.int16)
+            dx = self.head[rows, 0] - start[:, 0]
+            dy = self.head[rows, 1] - start[:, 1]
+            suggested = ((dy >= dx) & (dy >= -dx) & (dy >= 0),
+                         (dy <= dx) & (dy <= -dx) & (dy <= 0),
+                         (-dx <= dy) & (dy <= dx) & (dx >= 0),
+                         (dx <= dy) & (dy <= -dx) & (dx <= 0))
+            for (step_x, step_y), wanted in zip(MONSTER_STEPS, suggested):
+                move = start + np.array([step_x, step_y], dtype=np.int16)
+                inside = ((move >= 0) & (move <= GRID_SIZE - 2)).all(axis=1)
+                occupied = (self.monsters[rows] == move[:, None, :]).all(axis=2).any(axis=1)
+                ok = wanted & inside & ~occupied
+                self.monsters[rows[ok], which[ok]] = move[ok]
+
+    def _relocate_food(self, games: np.ndarray) -> None:
+        # Like relocate_food: every uneaten food moves to a random empty cell, one that holds no food,
+        # old or new, and no part of the snake or a monster. The board never fills, so this always ends.
+        old = self.food[games].copy()
+        new = old.copy()
+        for i in range(FOODS):
+            redo = old[:, i, 0] >= 0
+            while redo.any():
+                rows = np.flatnonzero(redo)
+                new[rows, i] = self.rng.integers(0, GRID_SIZE, size=(len(rows), 2))
+                cells = new[:, i, 1].astype(np.int64) * GRID_SIZE + new[:, i, 0]
+                clash = ((old == new[:, i:i + 1]).all(axis=2).any(axis=1)
+                         | (new[:, :i] == new[:, i:i + 1]).all(axis=2).any(axis=1)
+                         | (self.head[games] == new[:, i]).all(axis=1)
+                         | (self.tail_grid[games, cells] > 0)
+                         | (self.monsters[games] == new[:, i:i + 1]).all(axis=2).any(axis=1))
+                redo = redo & clash
+        self.food[games] = new
+
+    def tail_cells(self, game: int) -> list[tuple[int, int]]:
+        """
+        Returns the tail of one game as (x, y) cells, nearest the head first.
+
+        Parameters:
+        game (int): The index of the game.
+
+        Returns:
+        list[tuple[int, int]]: The tail blocks.
+        """
+        front = int(self.tail_front[game])
+        cells = [int(self.tail[game, (front + i) % TAIL_CAPACITY]) for i in range(int(self.tail_length[game]))]
+        return [(cell % GRID_SIZE, cell // GRID_SIZE) for cell in cells]
@@ -0,0 +1,307 @@
+'''
+Occupancy grid for the Snake game board.
+
+One bytearray holds a kind code for every cell of the 25x25 board, so collision,
+food and contact checks are a single lookup instead of a scan over the tail,
+the monsters or the food. The grid is kept up to date incrementally as the
+head advances, the tail retracts and monsters and food move.
+
+Cells are packed as y * size + x by OccupancyGrid.index, the same int the snake
+body stores.
+Cell codes: bit 0 head, bit 1 tail, bit 2 monster, bits 4-6 food number (1-5).
+The tail may cross itself and monsters may share a cell, so per-cell counts
+decide when those bits are cleared.
+
+The grid also keeps a CellPool of the empty cells (code 0), updated whenever a
+cell fills or empties, so a random free cell for food is drawn in O(1) and
+placement never needs to retry, however full the board is.
+'''
+
+GRID_SIZE = 25
+HEAD = 0x01
+TAIL = 0x02
+MONSTER = 0x04
+FOOD_SHIFT = 4
+FOOD_MASK = 0x70
+
+
+class CellPool:
+    '''
+    A set of packed cells with O(1) add, remove, membership and uniform random choice.
+    `cells` lists the members in no particular order and `slots` maps every cell to
+    its index in `cells`, or -1; removal swaps the last member into the gap.
+    '''
+
+    def __init__(self, capacity: int, members=()):
+        self.cells = []
+        self.slots = [-1] * capacity
+        for cell in members:
+            self.add(cell)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __contains__(self, cell: int) -> bool:
+        return self.slots[cell] >= 0
+
+    def add(self, cell: int) -> None:
+        '''
+        Add a cell to the pool; does nothing if it is already there.
+
+        Args: cell
+        Returns: None
+        '''
+
+        if self.slots[cell] < 0:
+            self.slots[cell] = len(self.cells)
+            self.cells.append(cell)
+
+    def remove(self, cell: int) -> None:
+        '''
+        Remove a cell from the pool; does nothing if it is not there.
+
+        Args: cell
+        Returns: None
+        '''
+
+        slot = self.slots[cell]
+        if slot < 0:
+            return
+        last = self.cells.pop()
+        if last != cell:
+            self.cells[slot] = last
+            self.slots[last] = slot
+        self.slots[cell] = -1
+
+    def choice(self, rng):
+        '''
+        Return a uniformly random member, or None if the pool is empty.
+
+        Args: rng (random.Random)
+        Returns: int or None
+        '''
+
+        if not self.cells:
+            return None
+        return self.cells[rng.randrange(len(self.cells))]
+
+    def pop_random(self, rng):
+        '''
+        Remove and return a uniformly random member, or None if the pool is empty.
+
+        Args: rng (random.Random)
+        Returns: int or None
+        '''
+
+        cell = self.choice(rng)
+        if cell is not None:
+            self.remove(cell)
+        return cell
+
+
+class OccupancyGrid:
+    '''
+    Cell-kind codes for a square board addressed by [x, y] positions.
+    '''
+
+    def __init__(self, size: int = GRID_SIZE):
+        self.size = size
+        self.cells = bytearray(size * size)
+        self._tail_count = bytearray(size * size)
+        self._monster_count = bytearray(size * size)
+        self.free = CellPool(size * size, range(size * size))
+
+    def index(self, pos) -> int:
+        '''
+        Return the flat cell index of an [x, y] position.
+
+        Args: pos
+        Returns: int
+        '''
+
+        return pos[1] * self.size + pos[0]
+
+    def unpack(self, cell: int) -> tuple:
+        '''
+        Return the (x, y) position of a flat cell index.
+
+        Args: cell
+        Returns: tuple
+        '''
+
+        y, x = divmod(cell, self.size)
+        return x, y
+
+    def contains(self, pos) -> bool:
+        '''
+        Check if a position lies on the board.
+
+        Args: pos
+        Returns: bool
+        '''
+
+        return 0 <= pos[0] < self.size and 0 <= pos[1] < self.size
+
+    def _set_code(self, i: int, code: int) -> None:
+        # Every change of a cell code goes through here to keep the free pool in sync.
+        if code and not self.cells[i]:
+            self.free.remove(i)
+        elif self.cells[i] and not code:
+            self.free.add(i)
+        self.cells[i] = code
+
+    def has(self, pos, kind: int) -> bool:
+        '''
+        Check if a cell holds the given kind (HEAD, TAIL or MONSTER).
+
+        Args: pos, kind
+        Returns: bool
+        '''
+
+        return self.contains(pos) and bool(self.cells[self.index(pos)] & kind)
+
+    def move_head(self, old_pos, new_pos) -> None:
+        '''
+        Move the head marker from one cell to another.
+
+        Args: old_pos, new_pos
+        Returns: None
+        '''
+
+        if old_pos is not None:
+            i = self.index(old_pos)
+            self._set_code(i, self.cells[i] & ~HEAD & 0xFF)
+        i = self.index(new_pos)
+        self._set_code(i, self.cells[i] | HEAD)
+
+    def add_tail_cell(self, cell: int) -> None:
+        '''
+        Add one tail block to a flat cell index, as stored in the snake body.
+
+        Args: cell
+        Returns: None
+        '''
+
+        i = cell
+        self._tail_count[i] += 1
+        self._set_code(i, self.cells[i] | TAIL)
+
+    def remove_tail_cell(self, cell: int) -> None:
+        '''
+        Remove one tail block from a flat cell index, as stored in the snake body.
+
+        Args: cell
+        Returns: None
+        '''
+
+        i = cell
+        self._tail_count[i] -= 1
+        if not self._tail_count[i]:
+            self._set_code(i, self.cells[i] & ~TAIL & 0xFF)
+
+    def add_monster(self, pos) -> None:
+        '''
+        Add a monster to a cell.
+
+        Args: pos
+        Returns: None
+        '''
+
+        i = self.index(pos)
+        self._monster_count[i] += 1
+        self._set_code(i, self.cells[i] | MONSTER)
+
+    def remove_monster(self, pos) -> None:
+        '''
+        Remove a monster from a cell.
+
+        Args: pos
+        Returns: None
+        '''
+
+        i = self.index(pos)
+        self._monster_count[i] -= 1
+        if not self._monster_count[i]:
+            self._set_code(i, self.cells[i] & ~MONSTER & 0xFF)
+
+    def move_monster(self, old_pos, new_pos) -> None:
+        '''
+        Move a monster from one cell to another.
+
+        Args: old_pos, new_pos
+        Returns: None
+        '''
+
+        self.remove_monster(old_pos)
+        self.add_monster(new_pos)
+
+    def set_food(self, pos, number: int) -> None:
+        '''
+        Put food with the given number (1-5) on a cell.
+
+        Args: pos, number
+        Returns: None
+        '''
+
+        i = self.index(pos)
+        self._set_code(i, (self.cells[i] & ~FOOD_MASK & 0xFF) | (number << FOOD_SHIFT))
+
+    def clear_food(self, pos) -> None:
+        '''
+        Remove any food from a cell. Positions off the board (eaten food) are ignored.
+
+        Args: pos
+        Returns: None
+        '''
+
+        if self.contains(pos):
+            i = self.index(pos)
+            self._set_code(i, self.cells[i] & ~FOOD_MASK & 0xFF)
+
+    def food_at(self, pos) -> int:
+        '''
+        Return the number of the food on a cell, or 0 if there is none.
+
+        Args: pos
+        Returns: int
+        '''
+
+        if not self.contains(pos):
+            return 0
+        return (self.cells[self.index(pos)] & FOOD_MASK) >> FOOD_SHIFT
+
+    def is_free(self, pos) -> bool:
+        '''
+        Return True if pos is on the board and nothing occupies it.
+
+        Args: pos ([x, y])
+        Returns: bool
+        '''
+
+        return self.contains(pos) and self.index(pos) in self.free
+
+    def random_free_cell(self, rng):
+        '''
+        Return a uniformly random empty cell, or None if the board is full.
+
+        Args: rng (random.Random)
+        Returns: int or None
+        '''
+
+        return self.free.choice(rng)
+
+    def monster_touches_tail(self, monster_pos) -> bool:
+        '''
+        Check if a monster touches the snake tail.
+        A monster is drawn half a cell up and right of its cell, so it overlaps the
+        2x2 block of snake cells from its own cell to one cell up and right.
+
+        Args: monster_pos
+        Returns: bool
+        '''
+
+        x, y = monster_pos
+        for pos in ((x, y), (x + 1, y), (x, y + 1), (x + 1, y + 1)):
+            if self.has(pos, TAIL):
+                return True
+        return False
@@ -0,0 +1,205 @@
+"""Lockstep check of SnakeEngine against the real Snake game.
+
+Each seed plays Assignment3-2024.py (with the null renderer) and a one-game
+SnakeEngine side by side, tick by tick. Random key presses go to both, and
+after every tick the heads, tails, monsters, food, contacts, clock and
+game-over flags must match:
+
+    python snake_lockstep.py --seeds 50 --ticks 3000
+
+The two sides share the rules but not the order of their random draws, so
+the check lines them up:
+
+- Initial placement is copied from the game into the engine. Both put the
+  monsters outside the centre square and the five foods on distinct cells of
+  the food area, clear of the head and the monsters, but the game draws the
+  food from a pool of the free cells and the engine by rejection sampling.
+- Monster moves read the same stream on both sides: each side gets its own
+  copy of one seeded random.Random, behind the interface it expects.
+- Food relocation draws from a separate stream on each side. The engine's new
+  food is checked against the relocation rules, then replaced by the game's.
+
+The exit status is 1 if any tick differs.
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import sys
+
+import numpy as np
+
+from renderer import NullRenderer, set_renderer
+from snake_engine import DOWN, GRID_SIZE, LEFT, MONSTERS, PAUSE, RIGHT, UP, SnakeEngine
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+KEYS = {UP: 'Up', DOWN: 'Down', LEFT: 'Left', RIGHT: 'Right', PAUSE: 'space'}
+KEY_EVERY = 5  # Ticks between random key presses
+
+
+class SharedRandom:
+    """
+    One random.Random stream behind both the game's and the engine's interface.
+
+    The game calls randrange and sample; the engine calls integers and random.
+    sample picks monsters in the order of an argsort of four uniform draws, as
+    SnakeEngine._monsters_move does, so both sides read the same numbers.
+    """
+
+    def __init__(self, seed: int):
+        self.stream = random.Random(seed)
+
+    def randrange(self, start: int, stop: int) -> int:
+        return self.stream.randrange(start, stop)
+
+    def sample(self, population, k: int) -> list:
+        order = np.argsort([self.stream.random() for _ in range(MONSTERS)])
+        return [population[i] for i in order[:k]]
+
+    def integers(self, low: int, high: int, size=None, dtype=None) -> np.ndarray:
+        shape = size if isinstance(size, tuple) else (size,)
+        values = [self.stream.randrange(low, high) for _ in range(int(np.prod(shape)))]
+        return np.array(values, dtype=dtype).reshape(shape)
+
+    def random(self, shape) -> np.ndarray:
+        return np.array([self.stream.random() for _ in range(int(np.prod(shape)))]).reshape(shape)
+
+
+def load_game():
+    """
+    Load a fresh copy of Assignment3-2024.py that draws with the null renderer.
+
+    Returns:
+    module: The game.
+    """
+    set_renderer(NullRenderer())
+    spec = importlib.util.spec_from_file_location('lockstep_snake', os.path.join(HERE, 'Assignment3-2024.py'))
+    game = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(game)
+    return game
+
+
+def game_food(game) -> list[list[int]]:
+    return [list(game.food_pos_1), list(game.food_pos_2), list(game.food_pos_3),
+            list(game.food_pos_4), list(game.food_pos_5)]
+
+
+def game_state(game) -> tuple:
+    tail = [[cell % GRID_SIZE, cell // GRID_SIZE] for cell in game.SNAKE_TAIL_POS]
+    return (list(game.HEAD_CURR_POS), tail, [list(pos) for pos in game.monster_curr_pos], game_food(game),
+            game.GAME_CONTACT, game.GAME_TIME, game.IS_END_TIME)
+
+
+def engine_state(engine: SnakeEngine) -> tuple:
+    return (engine.head[0].tolist(), [list(cell) for cell in engine.tail_cells(0)], engine.monsters[0].tolist(),
+            engine.food[0].tolist(), int(engine.contact[0]), int(engine.game_time[0]), bool(engine.done[0]))
+
+
+def relocation_error(engine: SnakeEngine, old_food: np.ndarray) -> str | None:
+    """
+    Checks the engine's relocated food against the rules of relocate_food.
+
+    Parameters:
+    engine (SnakeEngine): The engine, just after it relocated the food.
+    old_food (np.ndarray): The food cells before the relocation.
+
+    Returns:
+    str | None: What is wrong, or None if the food is valid.
+    """
+    food = [tuple(pos) for pos in engine.food[0].tolist() if pos[0] >= 0]
+    taken = ({tuple(engine.head[0].tolist())} | set(engine.tail_cells(0))
+             | {tuple(pos) for pos in engine.monsters[0].tolist()} | {tuple(pos) for pos in old_food.tolist()})
+    if len(set(food)) != len(food) or taken & set(food):
+        return f'engine relocated food onto an occupied cell: {food}'
+    return None
+
+
+def check_seed(seed: int, ticks: int) -> str | None:
+    """
+    Plays one seeded game in lockstep with the engine.
+
+    Parameters:
+    seed (int): Seed of the game, the shared random stream and the key presses.
+    ticks (int): The most ticks to play.
+
+    Returns:
+    str | None: A description of the first difference, or None if every tick matched.
+    """
+    game = load_game()
+    game.seed_game(seed)
+    game.main()
+
+    engine = SnakeEngine(1, np.random.default_rng(seed))
+    engine.monsters[0] = game.monster_curr_pos
+    engine.food[0] = game_food(game)
+    engine.rng = SharedRandom(seed)
+    game.RNG = SharedRandom(seed)
+
+    # Food relocation reads its own stream on each side; see the module docstring.
+    game_food_rng = random.Random(seed + 1)
+    random_free_cell = game.GRID.random_free_cell
+    game.GRID.random_free_cell = lambda rng: random_free_cell(game_food_rng)
+    engine_food_rng = SharedRandom(seed + 2)
+    relocate_food = engine._relocate_food
+    relocated = []
+
+    def engine_relocate_food(games):
+        relocated.append(engine.food[0].copy())
+        engine.rng, shared = engine_food_rng, engine.rng
+        relocate_food(games)
+        engine.rng = shared
+
+    engine._relocate_food = engine_relocate_food
+
+    keys = random.Random(seed)
+    game.start_game(0, 0)
+    engine.step()  # Tick 0 ran inside start_game
+    for tick in range(1, ticks + 1):
+        if tick % KEY_EVERY == 0:
+            action = keys.choice([UP, DOWN, LEFT, RIGHT, UP, DOWN, LEFT, RIGHT, PAUSE])
+            game.press_key(KEYS[action])
+            engine.apply_actions(np.array([action]))
+        game.GAME_LOOP.tick()
+        engine.step()
+        if relocated:
+            error = relocation_error(engine, relocated.pop())
+            if error:
+                return f'seed {seed}, tick {tick}: {error}'
+            engine.food[0] = game_food(game)
+        expected, actual = game_state(game), engine_state(engine)
+        if expected != actual:
+            return f'seed {seed}, tick {tick}:\n  game   {expected}\n  engine {actual}'
+        if engine.done[0]:
+            break
+    return None
+
+
+def main(argv=None) -> int:
+    """
+    Runs the check over a range of seeds and reports the first difference of each.
+
+    Parameters:
+    argv (list[str] | None): The arguments, or None for the command line.
+
+    Returns:
+    int: The exit status, 1 if any game differed.
+    """
+    parser = argparse.ArgumentParser(description='Check SnakeEngine tick by tick against Assignment3-2024.py.')
+    parser.add_argument('--seeds', type=int, default=50, help='number of seeded games (default 50)')
+    parser.add_argument('--first-seed', type=int, default=0, help='seed of the first game (default 0)')
+    parser.add_argument('--ticks', type=int, default=3000, help='most ticks per game (default 3000)')
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for seed in range(args.first_seed, args.first_seed + args.seeds):
+        error = check_seed(seed, args.ticks)
+        if error:
+            failures += 1
+            print(error)
+    print(f'{args.seeds - failures} of {args.seeds} games matched on every tick')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,205 @@
+'''
+Monster pursuit for the Snake game.
+
+Once per monster tick a single breadth-first search from the snake head fills
+an int16 distance field over the board, treating monster cells and cells
+monsters may not enter as obstacles. Every monster then steps to its free
+neighbour with the smallest distance, an O(1) lookup. The cost per tick is one
+pass over the board, however many monsters there are, and monsters route
+around each other instead of stalling behind them.
+
+That pass only pays off with many monsters. Run this module to benchmark the
+field against the original greedy dx/dy rule (ms per monster tick):
+
+    board    monsters  greedy   field
+    25x25           4   0.007   0.30
+    50x50         500   7.7     1.8
+    100x100       500   9.9     5.9
+
+The field wins from about FIELD_MIN_MONSTERS monsters up; with fewer, games
+should keep the greedy rule.
+'''
+
+import time
+from array import array
+from random import Random
+
+GRID_SIZE = 25
+UNREACHED = 32767
+BLOCKED = UNREACHED - 1
+FIELD_MIN_MONSTERS = 200  # Fewest monsters for which the field beats the greedy rule
+# Monster moves in the order they are tried: up, down, right, left.
+MONSTER_STEPS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+_neighbour_tables = {}
+
+
+def neighbour_table(size: int) -> list:
+    '''
+    Return, for every cell of a size x size board, the tuple of its neighbouring cells.
+
+    Args: size
+    Returns: list of tuple
+    '''
+
+    if size not in _neighbour_tables:
+        table = []
+        for cell in range(size * size):
+            y, x = divmod(cell, size)
+            table.append(tuple(ny * size + nx for nx, ny in ((x, y + 1), (x, y - 1), (x + 1, y), (x - 1, y))
+                               if 0 <= nx < size and 0 <= ny < size))
+        _neighbour_tables[size] = table
+    return _neighbour_tables[size]
+
+
+def distance_field(target: int, cells, blocked: int, size: int = GRID_SIZE, limit: int = GRID_SIZE - 1) -> array:
+    '''
+    Return the BFS distance of every cell from the target cell as an int16 array.
+    Cells whose code in `cells` has any of the `blocked` bits set, and cells outside
+    0..limit-1 on either axis, are obstacles and hold BLOCKED; cells cut off behind
+    them stay at UNREACHED. A target beyond the limit is clamped into it: a monster
+    on the clamped cell covers the target with its 2x2 block.
+
+    Args: target (packed cell), cells (bytearray of cell codes), blocked (bit mask), size, limit
+    Returns: array
+    '''
+
+    neighbours = neighbour_table(size)
+    field = [UNREACHED if not code & blocked else BLOCKED for code in cells]
+    if limit < size:
+        for cell in range(size * size):
+            if cell % size >= limit or cell // size >= limit:
+                field[cell] = BLOCKED
+        y, x = divmod(target, size)
+        target = min(y, limit - 1) * size + min(x, limit - 1)
+    field[target] = 0
+    frontier = [target]
+    distance = 0
+    while frontier:
+        distance += 1
+        reached = []
+        for cell in frontier:
+            for neighbour in neighbours[cell]:
+                if field[neighbour] == UNREACHED:
+                    field[neighbour] = distance
+                    reached.append(neighbour)
+        frontier = reached
+    return array('h', field)
+
+
+def downhill_move(field, pos, cells, blocked: int, size: int = GRID_SIZE, limit: int = GRID_SIZE - 1):
+    '''
+    Return the free neighbour of pos that is nearest the target, or None if there is none.
+    Neighbours must lie in 0..limit-1 on both axes and be clear of the blocked bits.
+
+    Args: field, pos ([x, y]), cells, blocked, size, limit
+    Returns: list [x, y] or None
+    '''
+
+    best = None
+    best_distance = UNREACHED
+    x, y = pos
+    for step_x, step_y in MONSTER_STEPS:
+        move_x, move_y = x + step_x, y + step_y
+        if 0 <= move_x < limit and 0 <= move_y < limit:
+            cell = move_y * size + move_x
+            if field[cell] < best_distance and not cells[cell] & blocked:
+                best = [move_x, move_y]
+                best_distance = field[cell]
+    return best
+
+
+def greedy_moves(pos, target) -> list:
+    '''
+    Return the moves the original greedy rule suggests for a monster at pos chasing target.
+
+    Args: pos, target
+    Returns: list of [x, y]
+    '''
+
+    dx = target[0] - pos[0]
+    dy = target[1] - pos[1]
+    suggested_moves = []
+    if dy >= dx and dy >= -dx and dy >= 0:
+        suggested_moves.append([pos[0], pos[1] + 1])
+    if dy <= dx and dy <= -dx and dy <= 0:
+        suggested_moves.append([pos[0], pos[1] - 1])
+    if -dx <= dy <= dx and dx >= 0:
+        suggested_moves.append([pos[0] + 1, pos[1]])
+    if dx <= dy <= -dx and dx <= 0:
+        suggested_moves.append([pos[0] - 1, pos[1]])
+    return suggested_moves
+
+
+def _place(count: int, size: int, rng: Random) -> list:
+    cells = rng.sample(range((size - 1) * (size - 1)), count)
+    return [[cell % (size - 1), cell // (size - 1)] for cell in cells]
+
+
+def benchmark_greedy(monsters: int, size: int, ticks: int, seed: int = 1) -> float:
+    '''
+    Time the original loop: greedy moves checked against a list of monster positions.
+
+    Args: monsters, size, ticks, seed
+    Returns: float (ms per tick)
+    '''
+
+    rng = Random(seed)
+    positions = _place(monsters, size, rng)
+    head = [size // 2, size // 2]
+    started = time.perf_counter()
+    for _ in range(ticks):
+        for index in range(monsters):
+            for move in greedy_moves(positions[index], head):
+                if 0 <= move[0] <= size - 2 and 0 <= move[1] <= size - 2 and move not in positions:
+                    positions[index] = move
+    return 1000 * (time.perf_counter() - started) / ticks
+
+
+def benchmark_field(monsters: int, size: int, ticks: int, seed: int = 1) -> float:
+    '''
+    Time the distance field: one BFS per tick, then one lookup per monster.
+
+    Args: monsters, size, ticks, seed
+    Returns: float (ms per tick)
+    '''
+
+    rng = Random(seed)
+    positions = _place(monsters, size, rng)
+    cells = bytearray(size * size)
+    for x, y in positions:
+        cells[y * size + x] = 1
+    target = (size // 2) * size + size // 2
+    started = time.perf_counter()
+    for _ in range(ticks):
+        field = distance_field(target, cells, 1, size, size - 1)
+        for index in range(monsters):
+            move = downhill_move(field, positions[index], cells, 1, size, size - 1)
+            if move is not None:
+                x, y = positions[index]
+                cells[y * size + x] = 0
+                cells[move[1] * size + move[0]] = 1
+                positions[index] = move
+    return 1000 * (time.perf_counter() - started) / ticks
+
+
+def main() -> None:
+    '''
+    Print the cost per monster tick of both pursuit methods for several board sizes and monster counts.
+
+    Args: None
+    Returns: None
+    '''
+
+    print(f'{"board":>7} {"monsters":>9} {"greedy ms":>10} {"field ms":>9}')
+    for size in (25, 50, 100):
+        for monsters in (4, 50, 200, 500):
+            if monsters > (size - 1) ** 2 // 4:
+                continue
+            ticks = 20
+            print(f'{size:>4}x{size:<2} {monsters:>9} {benchmark_greedy(monsters, size, ticks):>10.3f} '
+                  f'{benchmark_field(monsters, size, ticks):>9.3f}')
+
+
+if __name__ == '__main__':
+    main()
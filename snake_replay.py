@@ -0,0 +1,129 @@
+'''
+Compact binary replays for the Snake game.
+
+A game is fully determined by its random seed and the keys pressed, each tagged
+with the game-loop tick it takes effect in. A replay file stores exactly that:
+
+    header  b'SNKR', version (1 byte), seed (8 bytes, little-endian, unsigned)
+    events  one varint per event: (tick - previous tick) << 3 | key code
+
+Most events take one or two bytes. The last event is always END, at the first
+tick that did not run.
+'''
+
+import struct
+
+MAGIC = b'SNKR'
+VERSION = 1
+HEADER = struct.Struct('<4sBQ')
+MAX_SEED = 2 ** 64 - 1  # Largest seed the header can hold
+KEYS = ('Up', 'Down', 'Left', 'Right', 'space', 'end')
+KEY_CODES = {key: code for code, key in enumerate(KEYS)}
+END = 'end'
+
+
+class ReplayRecorder:
+    '''
+    Collects key events of one game and encodes them as a replay.
+    '''
+
+    def __init__(self, seed: int):
+        if not 0 <= seed <= MAX_SEED:
+            raise ValueError(f'a replay seed must be from 0 to {MAX_SEED}, not {seed}')
+        self.seed = seed
+        self.events = bytearray()
+        self.last_tick = 0
+        self.finished = False
+
+    def record(self, tick: int, key: str) -> None:
+        '''
+        Append a key event taking effect at the given tick.
+
+        Args: tick, key (one of KEYS)
+        Returns: None
+        '''
+
+        if self.finished:
+            return
+        if tick < self.last_tick:
+            raise ValueError(f'tick {tick} is before the previous event at {self.last_tick}')
+        value = (tick - self.last_tick) << 3 | KEY_CODES[key]
+        self.last_tick = tick
+        while value >= 0x80:
+            self.events.append(value & 0x7F | 0x80)
+            value >>= 7
+        self.events.append(value)
+
+    def finish(self, tick: int) -> None:
+        '''
+        Mark the end of the game at the first tick that did not run.
+
+        Args: tick
+        Returns: None
+        '''
+
+        self.record(tick, END)
+        self.finished = True
+
+    def to_bytes(self) -> bytes:
+        '''
+        Return the encoded replay.
+
+        Args: None
+        Returns: bytes
+        '''
+
+        return HEADER.pack(MAGIC, VERSION, self.seed) + bytes(self.events)
+
+    def save(self, path: str) -> None:
+        '''
+        Write the encoded replay to a file.
+
+        Args: path
+        Returns: None
+        '''
+
+        with open(path, 'wb') as replay_file:
+            replay_file.write(self.to_bytes())
+
+
+def read_replay(data: bytes) -> tuple:
+    '''
+    Decode a replay into its seed and its (tick, key) events, END included.
+
+    Args: data
+    Returns: tuple of (int, list of (int, str))
+    '''
+
+    if len(data) < HEADER.size:
+        raise ValueError('replay is too short')
+    magic, version, seed = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('not a version 1 Snake replay')
+    events = []
+    tick = value = shift = 0
+    for byte in data[HEADER.size:]:
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte & 0x80:
+            continue
+        if value & 7 >= len(KEYS):
+            raise ValueError(f'unknown key code {value & 7}')
+        tick += value >> 3
+        events.append((tick, KEYS[value & 7]))
+        value = shift = 0
+    if shift or not events or events[-1][1] != END:
+        raise ValueError('replay is truncated')
+    return seed, events
+
+
+def load_replay(path: str) -> tuple:
+    '''
+    Read and decode a replay file.
+
+    Args: path
+    Returns: tuple of (int, list of (int, str))
+    '''
+
+    with open(path, 'rb') as replay_file:
+        return read_replay(replay_file.read())
@@ -0,0 +1,229 @@
+"""Persistent cache of sliding-puzzle solutions, shared across sessions.
+
+Solutions are stored per board as the cells of the tiles to slide into the
+blank, in order, the same form puzzle_autosolve returns them in. Boards are
+flat row-major sequences with 0 for the blank, of any width up to 15.
+
+Mirroring a board in its main diagonal, and renaming every tile after the goal
+cell it lands on, gives another board with the same goal and a mirrored
+solution. Both are stored under one canonical key, the smaller of the two
+encodings, so a board and its mirror image share an entry.
+
+An in-memory LRU of recently used entries sits in front of a SQLite file.
+Both are bounded: the LRU by entry count, the file by row count, dropping the
+least recently used rows when it grows past its limit. An entry marked
+optimal is never replaced; a best-known one is replaced by an optimal or
+shorter solution.
+"""
+
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'solution_cache.sqlite')
+MEMORY_ENTRIES = 4096
+MAX_ROWS = 200_000
+_cache = None
+
+
+def board_size(board) -> int:
+    """
+    Return the width of a flat square board.
+
+    Args: board (sequence of int)
+    Returns: int
+    """
+
+    size = int(round(len(board) ** 0.5))
+    if size * size != len(board) or not 2 <= size <= 15:
+        raise ValueError("A board must be square, from 2x2 to 15x15.")
+    return size
+
+
+def mirror_board(board, size: int) -> list[int]:
+    """
+    Mirror a board in its main diagonal and rename each tile after the goal cell it lands on.
+
+    The goal board maps to itself, so a solution of one board, mirrored cell by
+    cell, solves the other.
+
+    Args: board (sequence of int), size (int)
+    Returns: list[int]
+    """
+
+    mirrored = [0] * (size * size)
+    for cell, tile in enumerate(board):
+        row, col = divmod(cell, size)
+        if tile:
+            goal_row, goal_col = divmod(tile - 1, size)
+            tile = goal_col * size + goal_row + 1
+        mirrored[col * size + row] = tile
+    return mirrored
+
+
+def mirror_cells(cells, size: int) -> list[int]:
+    """
+    Mirror a list of cells in the main diagonal.
+
+    Args: cells (sequence of int), size (int)
+    Returns: list[int]
+    """
+
+    return [(cell % size) * size + cell // size for cell in cells]
+
+
+def canonical_key(board) -> tuple[bytes, bool]:
+    """
+    Return the cache key shared by a board and its mirror image, and whether the key is the mirror's.
+
+    Args: board (sequence of int)
+    Returns: tuple[bytes, bool]
+    """
+
+    size = board_size(board)
+    plain = bytes([size]) + bytes(board)
+    mirrored = bytes([size]) + bytes(mirror_board(board, size))
+    return (mirrored, True) if mirrored < plain else (plain, False)
+
+
+class SolutionCache:
+    """
+    Solutions by canonical board key: an in-memory LRU in front of a SQLite file.
+    """
+
+    def __init__(self, path: str = CACHE_PATH, memory_entries: int = MEMORY_ENTRIES, max_rows: int = MAX_ROWS):
+        self.memory = OrderedDict()  # key -> (cells, optimal)
+        self.memory_entries = memory_entries
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._clock = 0
+        self._rows = 0
+        try:
+            self.db = sqlite3.connect(path, check_same_thread=False)
+            with self.db:
+                self.db.execute('CREATE TABLE IF NOT EXISTS solutions '
+                                '(key BLOB PRIMARY KEY, cells BLOB NOT NULL, optimal INTEGER NOT NULL, '
+                                'used INTEGER NOT NULL)')
+                self.db.execute('CREATE INDEX IF NOT EXISTS solutions_used ON solutions (used)')
+            self._clock, self._rows = self.db.execute(
+                'SELECT COALESCE(MAX(used), 0), COUNT(*) FROM solutions').fetchone()
+        except sqlite3.Error:
+            self.db = None  # A read-only install still gets the in-memory cache.
+
+    def get(self, board) -> list[int] | None:
+        """
+        Return the cached solution of a board as the cells of the tiles to slide, or None.
+
+        Args: board (sequence of int)
+        Returns: list[int] | None
+        """
+
+        entry = self.lookup(board)
+        return None if entry is None else entry[0]
+
+    def lookup(self, board) -> tuple[list[int], bool] | None:
+        """
+        Return the cached solution of a board and whether it is optimal, or None.
+
+        Args: board (sequence of int)
+        Returns: tuple[list[int], bool] | None
+        """
+
+        key, mirrored = canonical_key(board)
+        with self._lock:
+            entry = self._lookup(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        cells = list(entry[0])
+        return (mirror_cells(cells, key[0]) if mirrored else cells), entry[1]
+
+    def put(self, board, cells, optimal: bool) -> None:
+        """
+        Store a solution of a board unless the cache already holds one at least as good.
+
+        Args: board (sequence of int), cells (sequence of int), optimal (bool)
+        Returns: None
+        """
+
+        key, mirrored = canonical_key(board)
+        stored = bytes(mirror_cells(cells, key[0]) if mirrored else cells)
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None and (entry[1] or (not optimal and len(entry[0]) <= len(stored))):
+                return
+            self._remember(key, (stored, optimal))
+            if self.db is None:
+                return
+            self._clock += 1
+            try:
+                with self.db:
+                    self._rows += self.db.execute('INSERT OR IGNORE INTO solutions VALUES (?, ?, ?, ?)',
+                                                  (key, stored, int(optimal), self._clock)).rowcount
+                    self.db.execute('UPDATE solutions SET cells = ?, optimal = ?, used = ? WHERE key = ?',
+                                    (stored, int(optimal), self._clock, key))
+                    if self._rows > self.max_rows:
+                        # Drop the least recently used tenth in one go rather than a row per insert.
+                        excess = self._rows - self.max_rows + self.max_rows // 10
+                        self._rows -= self.db.execute('DELETE FROM solutions WHERE key IN '
+                                                      '(SELECT key FROM solutions ORDER BY used LIMIT ?)',
+                                                      (excess,)).rowcount
+            except sqlite3.Error:
+                pass
+
+    def _lookup(self, key: bytes):
+        # Memory first; a row read from disk is marked as used and moves into memory.
+        entry = self.memory.get(key)
+        if entry is not None:
+            self.memory.move_to_end(key)
+            return entry
+        if self.db is None:
+            return None
+        try:
+            row = self.db.execute('SELECT cells, optimal FROM solutions WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            self._clock += 1
+            with self.db:
+                self.db.execute('UPDATE solutions SET used = ? WHERE key = ?', (self._clock, key))
+        except sqlite3.Error:
+            return None
+        entry = (bytes(row[0]), bool(row[1]))
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: bytes, entry) -> None:
+        self.memory[key] = entry
+        self.memory.move_to_end(key)
+        if len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def close(self) -> None:
+        """
+        Close the SQLite file; the in-memory entries stay usable.
+
+        Args: None
+        Returns: None
+        """
+
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+
+def get_cache() -> SolutionCache:
+    """
+    Return the shared solution cache, opening it on first use.
+
+    Args: None
+    Returns: SolutionCache
+    """
+
+    global _cache
+    if _cache is None:
+        _cache = SolutionCache()
+    return _cache
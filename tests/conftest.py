@@ -0,0 +1,55 @@
+"""Shared helpers for the tests of the game scripts and their modules.
+
+The modules live at the top of the repository, next to the game scripts, so the
+tests import them from there. The game scripts have hyphenated names and are
+loaded with importlib, drawing with the null renderer.
+"""
+
+import importlib.util
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from renderer import NullRenderer, set_renderer  # noqa: E402
+
+
+@pytest.fixture
+def load_script():
+    """
+    Return a function that loads a fresh copy of a game script by file name.
+    """
+
+    def load(filename: str):
+        set_renderer(NullRenderer())
+        name = 'test_' + filename.replace('-', '_').removesuffix('.py')
+        spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, filename))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    return load
+
+
+def slide_tiles(board: list[int], size: int, positions) -> list[int]:
+    """
+    Slide the tiles at the given (row, col) positions into the blank, in order.
+
+    Fails the test if a tile is not next to the blank.
+    """
+
+    board = list(board)
+    blank = board.index(0)
+    for row, col in positions:
+        cell = row * size + col
+        assert abs(cell // size - blank // size) + abs(cell % size - blank % size) == 1, (row, col)
+        board[blank], board[cell] = board[cell], 0
+        blank = cell
+    return board
+
+
+def goal(size: int) -> list[int]:
+    return list(range(1, size * size)) + [0]
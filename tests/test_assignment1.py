@@ -0,0 +1,102 @@
+"""Tests of the 8-tile CLI game: the session loop and the script and batch modes."""
+
+import io
+import json
+import random
+import sys
+
+import pytest
+
+LETTERS = ('a', 'd', 'w', 's')
+ONE_MOVE_LEFT = [1, 2, 3, 4, 5, 6, 7, ' ', 8]
+
+
+@pytest.fixture
+def game(load_script):
+    return load_script('Assignment1-2024.py')
+
+
+def run_main(game, monkeypatch, *args):
+    monkeypatch.setattr(sys, 'argv', ['Assignment1-2024.py', *args])
+    with pytest.raises(SystemExit) as exit_info:
+        game.main()
+    return exit_info.value.code
+
+
+def test_session_does_not_grow_the_stack(game, monkeypatch, capsys):
+    # More games than the recursion limit allows frames, each solved in one move.
+    rounds = sys.getrecursionlimit() + 100
+    answers = iter(['a', 'n'] * (rounds - 1) + ['a', 'q'])
+    monkeypatch.setattr(game, 'initialize_chessboard', lambda: list(ONE_MOVE_LEFT))
+    monkeypatch.setattr('builtins.input', lambda prompt='': next(answers))
+    game.play_session(LETTERS)
+    output = capsys.readouterr().out
+    assert output.count('That is an optimal solution!') == rounds
+    assert next(answers, None) is None
+
+
+def test_run_script_counts(game):
+    board = [1, 2, 3, 4, 5, 6, ' ', 7, 8]
+    counts = game.run_script(io.StringIO('d D 1\na'), LETTERS, board)
+    assert counts == {'moves': 1, 'invalid': 2, 'ignored': 1, 'solved': 0, 'game_moves': 1}
+    assert board == ONE_MOVE_LEFT
+
+
+def test_run_script_deals_a_new_board_after_a_win(game):
+    board = list(ONE_MOVE_LEFT)
+    rng = random.Random(1)
+    counts = game.run_script(io.StringIO('A'), LETTERS, board, rng)
+    assert counts['solved'] == 1 and counts['game_moves'] == 0
+    assert board == game.initialize_chessboard(random.Random(1))
+
+
+def test_run_script_matches_move_tile(game, capsys):
+    # A long random script leaves the same board as the interactive move_tile, up to the first win.
+    rng = random.Random(2)
+    script = ''.join(rng.choice('adws') for _ in range(200_000))
+    start = game.initialize_chessboard(rng)
+    played = list(start)
+    for played_moves, move in enumerate(script, start=1):
+        game.move_tile(played, move, LETTERS)
+        if played == game.SOLVED_CHESSBOARD:
+            script = script[:played_moves]
+            break
+    capsys.readouterr()
+
+    scripted = list(start)
+    counts = game.run_script(io.StringIO(script), LETTERS, scripted, random.Random(3))
+    # A win deals a new board, as the player entering "n" would get.
+    won = played == game.SOLVED_CHESSBOARD
+    assert scripted == (game.initialize_chessboard(random.Random(3)) if won else played)
+    assert counts['moves'] + counts['invalid'] == len(script)
+
+
+def test_script_mode(game, monkeypatch, capsys, tmp_path):
+    script = tmp_path / 'moves.txt'
+    script.write_text('a')
+    status = run_main(game, monkeypatch, '--script', str(script), '--letters', 'adws', '--board', '123456708')
+    output = capsys.readouterr().out
+    assert status == 0
+    assert 'Games solved: 1' in output
+    assert 'Moves applied: 1 (0 in the current game)' in output
+
+
+def test_script_mode_rejects_an_unsolvable_board(game, monkeypatch, tmp_path):
+    script = tmp_path / 'moves.txt'
+    script.write_text('a')
+    status = run_main(game, monkeypatch, '--script', str(script), '--letters', 'adws', '--board', '213456780')
+    assert 'not solvable' in status
+
+
+def test_batch_mode(game, monkeypatch, capsys, tmp_path):
+    boards = tmp_path / 'boards.txt'
+    boards.write_text('123456708\n123456780\n')
+    status = run_main(game, monkeypatch, '--batch', str(boards), '--letters', 'adws', '--workers', '1')
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert status == 0
+    assert [(result['length'], result['moves']) for result in results] == [(1, 'a'), (0, '')]
+
+
+def test_batch_and_script_are_exclusive(game, monkeypatch, capsys):
+    assert run_main(game, monkeypatch, '--batch', '-', '--script', '-') == 2
+    assert 'not allowed with argument' in capsys.readouterr().err
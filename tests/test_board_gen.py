@@ -0,0 +1,65 @@
+"""Tests of the solvability rule and the random board generators."""
+
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from board_gen import count_inversions, is_solvable, random_solvable_board, random_solvable_boards
+from conftest import goal
+
+
+def brute_force_inversions(tiles) -> int:
+    tiles = [tile for tile in tiles if tile]
+    return sum(a > b for a, b in itertools.combinations(tiles, 2))
+
+
+def test_count_inversions_matches_brute_force():
+    rng = random.Random(5)
+    for cells in (4, 9, 16, 25):
+        for _ in range(20):
+            tiles = list(range(cells))
+            rng.shuffle(tiles)
+            assert count_inversions(tiles) == brute_force_inversions(tiles)
+
+
+@pytest.mark.parametrize('size', [2, 3, 4, 5])
+def test_goal_is_solvable_and_one_swap_is_not(size):
+    board = goal(size)
+    assert is_solvable(board, size)
+    board[0], board[1] = board[1], board[0]
+    assert not is_solvable(board, size)
+
+
+def test_even_width_counts_the_blank_row():
+    # Moving the blank up one row on a 4x4 board keeps it solvable, though the inversions change parity.
+    board = goal(4)
+    board[11], board[15] = board[15], board[11]
+    assert count_inversions(board) % 2 == 1
+    assert is_solvable(board, 4)
+
+
+@pytest.mark.parametrize('size', [2, 3, 4, 5, 8])
+def test_random_solvable_board(size):
+    rng = random.Random(size)
+    for _ in range(50):
+        board = random_solvable_board(size, rng)
+        assert sorted(board) == list(range(size * size))
+        assert is_solvable(board, size)
+
+
+def test_random_solvable_board_is_uniform_on_2x2():
+    # A 2x2 puzzle has 12 solvable boards; every one should turn up.
+    rng = random.Random(1)
+    seen = {tuple(random_solvable_board(2, rng)) for _ in range(500)}
+    assert len(seen) == 12
+
+
+@pytest.mark.parametrize('size', [3, 4, 5, 12])
+def test_random_solvable_boards(size):
+    boards = random_solvable_boards(200, size, np.random.default_rng(size))
+    assert boards.shape == (200, size, size)
+    for board in boards.reshape(200, -1).tolist():
+        assert sorted(board) == list(range(size * size))
+        assert is_solvable(board, size)
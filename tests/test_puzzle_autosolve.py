@@ -0,0 +1,115 @@
+"""Tests of the N x N auto-solver used by Assignment2-2024.py."""
+
+import random
+import threading
+
+import numpy as np
+import pytest
+
+import puzzle_autosolve
+from board_gen import random_solvable_board
+from conftest import goal, slide_tiles
+from puzzle_autosolve import SolveCancelled, databases_on_disk, find_solution, solve_tiles
+from puzzle_table import distance
+
+
+@pytest.fixture
+def pdb_dir(tmp_path, monkeypatch):
+    # An empty database directory and no databases loaded, so nothing built on this machine is used.
+    monkeypatch.setattr(puzzle_autosolve, 'PDB_DIR', str(tmp_path))
+    monkeypatch.setattr(puzzle_autosolve, '_pdb_cache', {})
+    return tmp_path
+
+
+def chessboard(board: list[int]) -> list:
+    return [' ' if tile == 0 else tile for tile in board]
+
+
+def square(board: list[int], size: int) -> np.ndarray:
+    return np.array(board).reshape(size, size)
+
+
+def test_3x3_solutions_are_optimal():
+    rng = random.Random(1)
+    for _ in range(20):
+        board = random_solvable_board(3, rng)
+        positions, optimal = find_solution(square(board, 3), use_cache=False)
+        assert optimal
+        assert slide_tiles(board, 3, positions) == goal(3)
+        assert len(positions) == distance(chessboard(board))
+
+
+def test_pattern_database_search_is_optimal(pdb_dir, monkeypatch):
+    # Small databases for 3x3 boards build in a moment, and the distance table says what is optimal.
+    monkeypatch.setitem(puzzle_autosolve.PDB_GROUPS, 3, ((1, 2, 3, 4), (5, 6, 7, 8)))
+    rng = random.Random(2)
+    for _ in range(10):
+        board = random_solvable_board(3, rng)
+        positions, optimal = find_solution(square(board, 3), use_cache=False)
+        assert optimal
+        assert slide_tiles(board, 3, positions) == goal(3)
+        assert len(positions) == distance(chessboard(board))
+    assert databases_on_disk(3)
+    assert sorted(path.name for path in pdb_dir.iterdir()) == ['pdb_3x3_1-2-3-4.npy', 'pdb_3x3_5-6-7-8.npy']
+
+
+def test_4x4_without_databases_falls_back_when_it_may_not_build(pdb_dir):
+    rng = random.Random(3)
+    for _ in range(5):
+        board = random_solvable_board(4, rng)
+        positions, optimal = find_solution(square(board, 4), use_cache=False, build=False)
+        assert not optimal
+        assert slide_tiles(board, 4, positions) == goal(4)
+    assert not list(pdb_dir.iterdir())
+
+
+def test_4x4_over_budget_falls_back(pdb_dir, monkeypatch):
+    # Five three-tile databases build in a moment but leave far more than 100 nodes to search.
+    monkeypatch.setitem(puzzle_autosolve.PDB_GROUPS, 4, tuple(tuple(range(i, i + 3)) for i in range(1, 16, 3)))
+    board = random_solvable_board(4, random.Random(4))
+    positions, optimal = find_solution(square(board, 4), max_nodes=100, use_cache=False)
+    assert not optimal
+    assert slide_tiles(board, 4, positions) == goal(4)
+
+
+@pytest.mark.skipif(not databases_on_disk(4), reason='run python puzzle_autosolve.py --build first')
+def test_4x4_with_databases_is_optimal():
+    # Twenty random moves from the goal, undone: the optimal solution is no longer and has the same parity.
+    rng = random.Random(5)
+    board = goal(4)
+    blank = 15
+    for _ in range(20):
+        row, col = divmod(blank, 4)
+        cell = rng.choice([(r, c) for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1))
+                           if 0 <= r < 4 and 0 <= c < 4])
+        board = slide_tiles(board, 4, [cell])
+        blank = cell[0] * 4 + cell[1]
+    positions, optimal = find_solution(square(board, 4), use_cache=False, build=False)
+    assert optimal
+    assert slide_tiles(board, 4, positions) == goal(4)
+    assert len(positions) <= 20 and len(positions) % 2 == 0
+
+
+@pytest.mark.parametrize('size', [5, 6])
+def test_larger_boards_use_the_reduction(size):
+    board = random_solvable_board(size, random.Random(size))
+    positions, optimal = find_solution(square(board, size), use_cache=False)
+    assert not optimal
+    assert slide_tiles(board, size, positions) == goal(size)
+    assert solve_tiles(square(board, size), use_cache=False) == positions
+
+
+def test_cancelled_build_raises(pdb_dir):
+    cancel = threading.Event()
+    cancel.set()
+    board = random_solvable_board(4, random.Random(6))
+    with pytest.raises(SolveCancelled):
+        find_solution(square(board, 4), use_cache=False, cancel=cancel)
+    assert not list(pdb_dir.iterdir())
+
+
+def test_unsolvable_board_raises():
+    board = goal(4)
+    board[0], board[1] = board[1], board[0]
+    with pytest.raises(ValueError, match='not solvable'):
+        find_solution(square(board, 4), use_cache=False)
@@ -0,0 +1,59 @@
+"""Tests of batch solving of 8-tile boards."""
+
+import io
+import json
+import random
+
+import pytest
+
+from board_gen import random_solvable_board
+from puzzle_batch import parse_board, run_batch, solve_stream
+from puzzle_table import distance
+
+LETTERS = ('a', 'd', 'w', 's')
+
+
+def board_lines(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    return [''.join(map(str, random_solvable_board(3, rng))) + '\n' for _ in range(count)]
+
+
+@pytest.mark.parametrize('text', ['123456708', '1 2 3 4 5 6 7 _ 8', '1,2,3,4,5,6,7,.,8', ' 123456708 \n'])
+def test_parse_board_forms(text):
+    assert parse_board(text) == [1, 2, 3, 4, 5, 6, 7, ' ', 8]
+
+
+@pytest.mark.parametrize('text', ['12345670', '123456789', '123456778', '12345670x'])
+def test_parse_board_rejects_bad_lines(text):
+    with pytest.raises(ValueError):
+        parse_board(text)
+
+
+def test_results_are_optimal_and_in_input_order():
+    lines = board_lines(40, seed=1)
+    results = list(solve_stream(lines, LETTERS, workers=1, chunk_size=7))
+    assert [result['line'] for result in results] == list(range(1, 41))
+    for line, result in zip(lines, results):
+        assert result['board'] == line.strip()
+        assert result['length'] == len(result['moves']) == distance(parse_board(line))
+        assert set(result['moves']) <= set(LETTERS)
+
+
+def test_run_batch_output():
+    lines = ['# a comment\n', '123456708\n', '\n', '213456780\n', 'not a board\n', '123456780\n']
+    output = io.StringIO()
+    failures = run_batch(lines, LETTERS, output, workers=1)
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert failures == 2
+    assert [result['line'] for result in results] == [2, 4, 5, 6]
+    assert results[0]['board'] == '123456708' and results[0]['length'] == 1 and results[0]['moves'] == 'a'
+    assert 'not solvable' in results[1]['error']
+    assert 'error' in results[2]
+    assert results[3]['length'] == 0
+
+
+def test_worker_processes_give_the_same_results():
+    lines = board_lines(100, seed=2)
+    single = list(solve_stream(lines, LETTERS, workers=1))
+    pooled = list(solve_stream(lines, LETTERS, workers=2, chunk_size=8))
+    assert pooled == single
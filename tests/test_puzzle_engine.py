@@ -0,0 +1,59 @@
+"""Tests of the vectorised sliding-puzzle engine."""
+
+import numpy as np
+
+from board_gen import is_solvable
+from puzzle_engine import execute_moves, goal_board, new_boards, random_moves, shuffle_boards, solved_mask
+
+
+def blanks_of(boards: np.ndarray) -> np.ndarray:
+    return np.argmax(boards.reshape(len(boards), -1) == 0, axis=1).astype(np.int64)
+
+
+def test_moves_off_the_board_are_ignored():
+    boards, blanks = new_boards(4, 3)
+    # The blank starts in the bottom-right corner: only left and up move it.
+    applied = execute_moves(boards, blanks, np.array([1, 0, -1, 0]), np.array([0, 1, 0, -1]))
+    assert applied.tolist() == [False, False, True, True]
+    assert blanks.tolist() == [8, 8, 7, 5]
+    assert (boards[0] == goal_board(3)).all()
+    assert boards[2].ravel().tolist() == [1, 2, 3, 4, 5, 6, 7, 0, 8]
+    assert boards[3].ravel().tolist() == [1, 2, 3, 4, 5, 0, 7, 8, 6]
+
+
+def test_shuffled_boards_stay_solvable():
+    boards, blanks = new_boards(100, 4)
+    shuffle_boards(boards, blanks, rng=np.random.default_rng(2))
+    assert (blanks == blanks_of(boards)).all()
+    for board in boards.reshape(100, -1).tolist():
+        assert sorted(board) == list(range(16))
+        assert is_solvable(board, 4)
+
+
+def test_solved_mask():
+    boards, blanks = new_boards(3, 5)
+    execute_moves(boards, blanks, np.array([0, -1, 0]), np.array([0, 0, -1]))
+    assert solved_mask(boards).tolist() == [True, False, False]
+
+
+def test_non_contiguous_batches_are_updated_in_place():
+    rng = np.random.default_rng(4)
+    batch, batch_blanks = new_boards(12, 4)
+    shuffle_boards(batch, batch_blanks, rng=rng)
+    expected = batch.copy()
+
+    # Every other board, seen through a transposed view: the same moves, in the view's own layout.
+    view = batch[::2].transpose(0, 2, 1)
+    assert not view.flags.c_contiguous
+    view_blanks = blanks_of(view)
+    copy = view.copy()
+    copy_blanks = view_blanks.copy()
+    for _ in range(50):
+        x_dirs, y_dirs = random_moves(len(view), rng)
+        execute_moves(view, view_blanks, x_dirs, y_dirs)
+        execute_moves(copy, copy_blanks, x_dirs, y_dirs)
+
+    assert (view == copy).all()
+    assert (view_blanks == copy_blanks).all()
+    assert (batch[::2] == copy.transpose(0, 2, 1)).all()
+    assert (batch[1::2] == expected[1::2]).all()
@@ -0,0 +1,76 @@
+"""Tests of the optimal 3x3 solver and the exact distance table."""
+
+import random
+
+import pytest
+
+from board_gen import random_solvable_board
+from puzzle_solver import apply_move, pack_board, solve, solve_packed, unpack_board
+from puzzle_table import TABLE_SIZE, best_move, distance, rank_board
+
+SOLVED = list(range(1, 9)) + [' ']
+UNSOLVABLE = [2, 1, 3, 4, 5, 6, 7, 8, ' ']
+
+
+def chessboard(board: list[int]) -> list:
+    return [' ' if tile == 0 else tile for tile in board]
+
+
+def random_chessboards(count: int, seed: int = 7) -> list[list]:
+    rng = random.Random(seed)
+    return [chessboard(random_solvable_board(3, rng)) for _ in range(count)]
+
+
+def play(board: list, moves: list[str]) -> list:
+    packed = pack_board(board)
+    for move in moves:
+        packed = apply_move(packed, move)
+    return unpack_board(packed)
+
+
+def test_pack_round_trip():
+    for board in random_chessboards(20):
+        assert unpack_board(pack_board(board)) == board
+
+
+def test_solutions_solve_the_board_in_the_table_distance():
+    for board in random_chessboards(30):
+        moves = solve(board)
+        assert play(board, moves) == SOLVED
+        assert len(moves) == distance(board)
+
+
+def test_known_distances():
+    assert distance(SOLVED) == 0
+    assert solve(SOLVED) == []
+    assert distance([1, 2, 3, 4, 5, 6, 7, ' ', 8]) == 1
+    # The hardest 3x3 boards need 31 moves.
+    assert distance([8, 6, 7, 2, 5, 4, 3, ' ', 1]) == 31
+
+
+def test_best_move_follows_an_optimal_path():
+    for board in random_chessboards(20, seed=11):
+        length = distance(board)
+        while length:
+            board = play(board, [best_move(board)])
+            assert distance(board) == length - 1
+            length -= 1
+        assert best_move(board) is None
+
+
+def test_ranks_are_dense_and_distinct():
+    ranks = {rank_board(board) for board in random_chessboards(500, seed=3)}
+    assert len(ranks) == 500
+    assert all(0 <= rank < TABLE_SIZE for rank in ranks)
+
+
+@pytest.mark.parametrize('lookup', [solve, distance, best_move, rank_board])
+def test_unsolvable_boards_raise(lookup):
+    with pytest.raises(ValueError, match='not solvable'):
+        lookup(UNSOLVABLE)
+
+
+def test_solve_packed_counts_nodes():
+    moves, nodes = solve_packed(pack_board([1, 2, 3, 4, 5, 6, ' ', 7, 8]))
+    assert moves == ['left', 'left']
+    assert nodes >= len(moves)
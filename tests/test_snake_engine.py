@@ -0,0 +1,52 @@
+"""Tests of the headless Snake engine and monster pursuit against the real game."""
+
+import numpy as np
+import pytest
+
+from snake_engine import SnakeEngine
+from snake_lockstep import check_seed
+from snake_pursuit import BLOCKED, GRID_SIZE, UNREACHED, distance_field, downhill_move
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_engine_matches_the_game_tick_by_tick(seed):
+    assert check_seed(seed, 2000) is None
+
+
+def test_monsters_stay_on_the_board_and_apart():
+    engine = SnakeEngine(16, np.random.default_rng(1))
+    for _ in range(3000):
+        engine.step()
+        monsters = engine.monsters
+        assert ((monsters >= 0) & (monsters <= GRID_SIZE - 2)).all()
+        cells = monsters[:, :, 1].astype(int) * GRID_SIZE + monsters[:, :, 0]
+        assert all(len(set(row)) == len(row) for row in cells.tolist())
+        if engine.done.all():
+            break
+
+
+def cell(x: int, y: int) -> int:
+    return y * GRID_SIZE + x
+
+
+def test_distance_field_routes_around_obstacles():
+    cells = bytearray(GRID_SIZE * GRID_SIZE)
+    for y in range(0, 20):
+        cells[cell(10, y)] = 1
+    field = distance_field(cell(5, 5), cells, 1)
+    assert field[cell(5, 5)] == 0
+    assert field[cell(10, 3)] == BLOCKED
+    # Around the end of the wall at y = 20 and back down.
+    assert field[cell(11, 5)] == (20 - 5) * 2 + 6
+    assert downhill_move(field, [11, 5], cells, 1) == [11, 6]
+
+
+def test_distance_field_keeps_to_the_limit():
+    cells = bytearray(GRID_SIZE * GRID_SIZE)
+    field = distance_field(cell(3, 3), cells, 1)
+    assert field[cell(24, 3)] == BLOCKED and field[cell(3, 24)] == BLOCKED
+    # A head on the top-right corner is chased to the cell from which a monster covers it.
+    field = distance_field(cell(24, 24), cells, 1)
+    assert field[cell(23, 23)] == 0
+    assert UNREACHED not in field
+    assert downhill_move(field, [20, 23], cells, 1) == [21, 23]
@@ -0,0 +1,90 @@
+"""Tests of Snake replays: the file format and recording and replaying whole games."""
+
+import argparse
+
+import pytest
+
+from snake_autopilot import Autopilot
+from snake_replay import END, KEYS, MAX_SEED, ReplayRecorder, load_replay, read_replay
+
+
+def test_events_round_trip():
+    recorder = ReplayRecorder(MAX_SEED)
+    events = [(0, 'Up'), (0, 'Left'), (15, 'space'), (16, 'space'), (100_000, 'Down'), (2 ** 40, 'Right')]
+    for tick, key in events:
+        recorder.record(tick, key)
+    recorder.finish(2 ** 40 + 1)
+    recorder.record(2 ** 41, 'Up')  # Ignored once the game is finished
+    assert read_replay(recorder.to_bytes()) == (MAX_SEED, events + [(2 ** 40 + 1, END)])
+
+
+def test_short_gaps_take_one_byte():
+    recorder = ReplayRecorder(0)
+    for tick in range(0, 150, 15):
+        recorder.record(tick, KEYS[tick % 5])
+    assert len(recorder.events) == 10
+
+
+@pytest.mark.parametrize('seed', [-1, MAX_SEED + 1])
+def test_seed_out_of_range(seed):
+    with pytest.raises(ValueError, match='seed'):
+        ReplayRecorder(seed)
+
+
+def test_events_must_not_go_back_in_time():
+    recorder = ReplayRecorder(1)
+    recorder.record(10, 'Up')
+    with pytest.raises(ValueError):
+        recorder.record(9, 'Down')
+
+
+def test_damaged_replays_are_rejected():
+    recorder = ReplayRecorder(1)
+    recorder.record(300, 'Up')
+    recorder.finish(400)
+    data = recorder.to_bytes()
+    for damaged in (data[:5], b'XXXX' + data[4:], data[:-1], data[:-2]):
+        with pytest.raises(ValueError):
+            read_replay(damaged)
+
+
+def game_summary(game) -> tuple:
+    return (game.GAME_CONTACT, game.GAME_TIME, game.SNAKE_TAIL_LENGTH, game.FOOD_TO_EAT, list(game.HEAD_CURR_POS),
+            [list(pos) for pos in game.monster_curr_pos])
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_recorded_game_replays_exactly(load_script, tmp_path, capsys, seed):
+    path = tmp_path / 'game.snkr'
+    game = load_script('Assignment3-2024.py')
+    game.seed_game(seed)
+    game.RECORDER = ReplayRecorder(seed)
+    game.RECORD_PATH = str(path)
+    game.AUTOPILOT = Autopilot()
+    game.main()
+    game.start_game(0, 0)
+    ticks = 0
+    while game.GAME_LOOP.running and ticks < 40_000:
+        game.GAME_LOOP.tick()
+        ticks += 1
+    game.stop_game()
+    played = game_summary(game)
+    recorded_seed, events = load_replay(str(path))
+    assert recorded_seed == seed
+    # The replay ends at the first tick that did not run.
+    assert events[-1] == (game.GAME_LOOP.sim_ms // game.FRAME_STEP + 1, END)
+
+    again = tmp_path / 'again.snkr'
+    replay = load_script('Assignment3-2024.py')
+    replay.replay_game(str(path), record_path=str(again))
+    assert 'Replay finished' in capsys.readouterr().out
+    assert game_summary(replay) == played
+    assert again.read_bytes() == path.read_bytes()
+
+
+def test_seed_option_range(load_script):
+    game = load_script('Assignment3-2024.py')
+    assert game.parse_seed(str(MAX_SEED)) == MAX_SEED
+    for text in ('-1', str(MAX_SEED + 1)):
+        with pytest.raises(argparse.ArgumentTypeError):
+            game.parse_seed(text)
@@ -0,0 +1,57 @@
+"""Tests of the persistent solution cache."""
+
+import random
+
+import numpy as np
+
+from board_gen import random_solvable_board
+from conftest import goal, slide_tiles
+from puzzle_autosolve import find_solution
+from solution_cache import SolutionCache, mirror_board
+
+
+def cells_of(positions, size: int) -> list[int]:
+    return [row * size + col for row, col in positions]
+
+
+def test_mirror_keeps_the_goal():
+    for size in (2, 3, 4, 7):
+        assert mirror_board(goal(size), size) == goal(size)
+
+
+def test_entries_survive_reopening(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    board = random_solvable_board(3, random.Random(1))
+    positions, _ = find_solution(np.array(board).reshape(3, 3), use_cache=False)
+    cache = SolutionCache(path)
+    assert cache.lookup(board) is None
+    cache.put(board, cells_of(positions, 3), True)
+    cache.close()
+
+    reopened = SolutionCache(path)
+    assert reopened.lookup(board) == (cells_of(positions, 3), True)
+    reopened.close()
+
+
+def test_mirror_image_shares_the_entry(tmp_path):
+    board = random_solvable_board(4, random.Random(2))
+    positions, optimal = find_solution(np.array(board).reshape(4, 4), use_cache=False, build=False)
+    cache = SolutionCache(str(tmp_path / 'cache.sqlite'))
+    cache.put(board, cells_of(positions, 4), optimal)
+    mirrored = mirror_board(board, 4)
+    cells, _ = cache.lookup(mirrored)
+    assert slide_tiles(mirrored, 4, [divmod(cell, 4) for cell in cells]) == goal(4)
+    cache.close()
+
+
+def test_optimal_entries_are_kept_and_best_known_ones_improve(tmp_path):
+    cache = SolutionCache(str(tmp_path / 'cache.sqlite'))
+    board = goal(3)
+    board[7], board[8] = 0, 8
+    cache.put(board, [8, 5, 4, 7, 8, 5, 4, 7, 8], False)
+    cache.put(board, [8, 5, 4, 7, 8, 5, 4, 7, 8, 7, 8], False)
+    assert cache.lookup(board) == ([8, 5, 4, 7, 8, 5, 4, 7, 8], False)
+    cache.put(board, [8], True)
+    cache.put(board, [8, 5, 4, 7, 8, 5, 4, 7, 8], False)
+    assert cache.lookup(board) == ([8], True)
+    cache.close()
@@ -0,0 +1,103 @@
+"""Inverse tile index shared by the sliding-puzzle games.
+
+A TileIndex mirrors a board as two flat lists, cell -> tile and tile -> cell
+(0 is the blank), so finding a tile or the blank is O(1). It also keeps the
+board's Manhattan distance and inversion count up to date on every swap, for
+hints, solvers and solvability checks.
+"""
+
+
+class TileIndex:
+    """
+    Position index of an N x N board, updated by the games' swap functions.
+
+    Attributes:
+    size (int): The width of the board.
+    tiles (list[int]): The tile in each cell, row-major, 0 for the blank.
+    cells (list[int]): The cell of each tile; cells[0] is the blank.
+    manhattan (int): Sum of the distances of all tiles from their goal cells.
+    inversions (int): Pairs of numbered tiles that appear in the wrong order.
+    """
+
+    def __init__(self, tiles, size: int):
+        self.size = size
+        self.tiles = [int(tile) for tile in tiles]
+        self.cells = [0] * len(self.tiles)
+        for cell, tile in enumerate(self.tiles):
+            self.cells[tile] = cell
+        self.manhattan = sum(self._distance(tile, cell) for cell, tile in enumerate(self.tiles))
+        numbered = [tile for tile in self.tiles if tile]
+        self.inversions = sum(1 for i in range(len(numbered))
+                              for j in range(i + 1, len(numbered)) if numbered[i] > numbered[j])
+
+    @property
+    def blank(self) -> int:
+        """The cell of the blank."""
+        return self.cells[0]
+
+    def cell(self, tile: int) -> int:
+        """
+        Return the cell that holds the given tile.
+
+        Parameters:
+        tile (int): The tile number, 0 for the blank.
+
+        Returns:
+        int: The flat cell index.
+        """
+        return self.cells[tile]
+
+    def position(self, tile: int) -> tuple[int, int]:
+        """
+        Return the (row, col) of the given tile.
+
+        Parameters:
+        tile (int): The tile number, 0 for the blank.
+
+        Returns:
+        tuple[int, int]: The row and column.
+        """
+        return divmod(self.cells[tile], self.size)
+
+    def _distance(self, tile: int, cell: int) -> int:
+        if tile == 0:
+            return 0
+        goal_row, goal_col = divmod(tile - 1, self.size)
+        row, col = divmod(cell, self.size)
+        return abs(goal_row - row) + abs(goal_col - col)
+
+    def swap(self, cell_a: int, cell_b: int) -> None:
+        """
+        Swap the blank with a neighbouring tile and update the Manhattan distance and inversion count.
+
+        Parameters:
+        cell_a (int): One of the two cells; either may be the blank.
+        cell_b (int): The other cell.
+
+        Returns:
+        None
+        """
+        if self.tiles[cell_a] != 0:
+            cell_a, cell_b = cell_b, cell_a
+        tile = self.tiles[cell_b]
+        self.manhattan += self._distance(tile, cell_a) - self._distance(tile, cell_b)
+        # Only a vertical move changes the row-major order: the tile passes the tiles in between.
+        low, high = min(cell_a, cell_b), max(cell_a, cell_b)
+        moving_earlier = cell_a < cell_b
+        for other in self.tiles[low + 1:high]:
+            if other:
+                self.inversions += 1 if (tile > other) == moving_earlier else -1
+        self.tiles[cell_a], self.tiles[cell_b] = tile, 0
+        self.cells[tile], self.cells[0] = cell_a, cell_b
+
+    def is_solvable(self) -> bool:
+        """
+        Check whether the board can reach the goal, using the tracked inversion count.
+
+        Returns:
+        bool: True if the board is solvable.
+        """
+        if self.size % 2:
+            return self.inversions % 2 == 0
+        blank_row_from_bottom = self.size - self.blank // self.size
+        return (self.inversions + blank_row_from_bottom) % 2 == 1